@@ -83,15 +83,28 @@ export interface RetrievalOnlyMetrics {
     semantic: CategoryMetrics;
     mixed: CategoryMetrics;
   };
-  query_results?: Array<{
-    query: string;
-    expected: string;
-    retrieved: string;
-    correct: boolean;
-    rank: number;
-    confidence: number;
-    category: string;
-  }>;
+  // Parallel arrays by default; one object per query with ?verbose=true
+  query_results?: QueryResultColumns | QueryResult[];
+}
+
+export interface QueryResult {
+  query: string;
+  expected: string;
+  retrieved: string;
+  correct: boolean;
+  rank: number;
+  confidence: number;
+  category: string;
+}
+
+export interface QueryResultColumns {
+  queries: string[];
+  expected: string[];
+  retrieved: string[];
+  correct: boolean[];
+  ranks: number[];
+  confidence: number[];
+  categories: string[];
 }
 
 export interface EvaluationMetrics {
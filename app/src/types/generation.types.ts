@@ -148,8 +148,8 @@ export interface ProvenanceInfo {
   pattern_id: string;
   pattern_version: string;
   generated_at: string;      // ISO 8601 timestamp
-  tokens_hash: string;       // SHA-256 hash for change detection
-  requirements_hash: string; // SHA-256 hash for change detection
+  tokens_hash: string;       // BLAKE2b content hash for change detection
+  requirements_hash: string; // BLAKE2b content hash for change detection
 }
 
 // Generation response from POST /api/v1/generation/generate
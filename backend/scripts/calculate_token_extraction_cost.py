@@ -4,15 +4,188 @@
 import argparse
 from typing import Dict, Tuple
 
+import numpy as np
+
+# Optional: JIT-compile the cost kernels for large sweeps
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 # GPT-4o Pricing (as of 2024 - verify at https://openai.com/api/pricing/)
 INPUT_COST_PER_1M_TOKENS = 2.50  # $2.50 per 1M input tokens
 OUTPUT_COST_PER_1M_TOKENS = 10.00  # $10.00 per 1M output tokens
+# Per-token prices, folded once so the kernels multiply instead of divide
+INPUT_COST_PER_TOKEN = INPUT_COST_PER_1M_TOKENS / 1_000_000
+OUTPUT_COST_PER_TOKEN = OUTPUT_COST_PER_1M_TOKENS / 1_000_000
 
 # Token estimates
 PROMPT_TOKENS = 500  # ~2,000 characters in prompt
 AVERAGE_OUTPUT_TOKENS = 1000  # Typical JSON response size
 
+# Columns returned by calculate_single_extraction_cost_vec
+COST_DTYPE = np.dtype([
+    ("text_input_tokens", np.int64),
+    ("image_input_tokens", np.int64),
+    ("total_input_tokens", np.int64),
+    ("output_tokens", np.int64),
+    ("input_cost", np.float64),
+    ("output_cost", np.float64),
+    ("total_cost", np.float64),
+])
+
+
+def estimate_image_tokens_vec(
+    widths: np.ndarray, heights: np.ndarray, detail: str = "high"
+) -> np.ndarray:
+    """Estimate image tokens for a batch of image sizes.
+    
+    Vectorized form of estimate_image_tokens for capacity-planning sweeps.
+    
+    Args:
+        widths: Image widths in pixels
+        heights: Image heights in pixels (broadcast against widths)
+        detail: Image detail level ("high" or "low")
+        
+    Returns:
+        Array of estimated token counts (int64)
+    """
+    widths, heights = np.broadcast_arrays(
+        np.asarray(widths, dtype=np.int64), np.asarray(heights, dtype=np.int64)
+    )
+    
+    if detail != "high":
+        # Low detail: fixed cost
+        return np.full(widths.shape, 85, dtype=np.int64)
+    
+    # Tiles of 512x512, each ~170 tokens, with a ~85 token floor
+    tokens = (widths * heights / (512 * 512) * 170).astype(np.int64)
+    return np.maximum(tokens, 85)
+
+
+@njit(cache=True)
+def _image_tokens_kernel(width, height, detail_high):
+    """Scalar image-token estimate shared by the JIT cost kernels."""
+    if not detail_high:
+        return 85
+    tokens = int(width * height / (512 * 512) * 170)
+    return max(tokens, 85)
+
+
+@njit(cache=True)
+def _cost_kernel(width, height, detail_high, output_tokens, in_price, out_price):
+    """Compute token counts and dollar costs for a single extraction.
+    
+    Prices are per token (see INPUT_COST_PER_TOKEN / OUTPUT_COST_PER_TOKEN).
+    
+    Returns:
+        Tuple of (input_tokens, image_tokens, input_cost, output_cost, total_cost)
+    """
+    image_tokens = _image_tokens_kernel(width, height, detail_high)
+    input_tokens = PROMPT_TOKENS + image_tokens
+    input_cost = input_tokens * in_price
+    output_cost = output_tokens * out_price
+    return input_tokens, image_tokens, input_cost, output_cost, input_cost + output_cost
+
+
+@njit(cache=True, parallel=True)
+def _cost_kernel_vec(
+    widths, heights, detail_high, output_tokens, in_price, out_price,
+    image_tokens, input_tokens, input_cost, output_cost, total_cost,
+):
+    """Batch form of _cost_kernel writing into preallocated 1-D output arrays.
+    
+    The 85-token floor uses a branchless max (sign-bit mask) so the loop
+    vectorizes to a compare-select instead of a data-dependent branch.
+    """
+    for i in prange(widths.shape[0]):
+        if detail_high:
+            base_tokens = np.int64(widths[i] * heights[i] / (512 * 512) * 170)
+            diff = base_tokens - 85
+            tokens = base_tokens - (diff & (diff >> 63))
+        else:
+            tokens = np.int64(85)
+        image_tokens[i] = tokens
+        input_tokens[i] = PROMPT_TOKENS + tokens
+        input_cost[i] = input_tokens[i] * in_price
+        output_cost[i] = output_tokens[i] * out_price
+        total_cost[i] = input_cost[i] + output_cost[i]
+
+
+def calculate_single_extraction_cost_vec(
+    widths: np.ndarray,
+    heights: np.ndarray,
+    output_tokens: np.ndarray = None,
+    detail: str = "high"
+) -> np.ndarray:
+    """Calculate extraction costs for a batch of image sizes.
+    
+    Uses the parallel numba kernel when numba is installed, otherwise
+    falls back to plain NumPy array expressions.
+    
+    Args:
+        widths: Image widths in pixels
+        heights: Image heights in pixels
+        output_tokens: Output tokens per extraction (defaults to average)
+        detail: Image detail level
+        
+    Returns:
+        Structured array with COST_DTYPE columns, one row per input
+    """
+    if output_tokens is None:
+        output_tokens = AVERAGE_OUTPUT_TOKENS
+    
+    widths, heights, output_tokens = np.broadcast_arrays(
+        np.asarray(widths, dtype=np.int64),
+        np.asarray(heights, dtype=np.int64),
+        np.asarray(output_tokens, dtype=np.int64),
+    )
+    
+    result = np.empty(widths.shape, dtype=COST_DTYPE)
+    result["text_input_tokens"] = PROMPT_TOKENS
+    result["output_tokens"] = output_tokens
+    
+    if NUMBA_AVAILABLE:
+        n = widths.size
+        image_tokens = np.empty(n, dtype=np.int64)
+        input_tokens = np.empty(n, dtype=np.int64)
+        input_cost = np.empty(n, dtype=np.float64)
+        output_cost = np.empty(n, dtype=np.float64)
+        total_cost = np.empty(n, dtype=np.float64)
+        _cost_kernel_vec(
+            np.ascontiguousarray(widths).ravel(),
+            np.ascontiguousarray(heights).ravel(),
+            detail == "high",
+            np.ascontiguousarray(output_tokens).ravel(),
+            INPUT_COST_PER_TOKEN,
+            OUTPUT_COST_PER_TOKEN,
+            image_tokens, input_tokens, input_cost, output_cost, total_cost,
+        )
+        result["image_input_tokens"] = image_tokens.reshape(widths.shape)
+        result["total_input_tokens"] = input_tokens.reshape(widths.shape)
+        result["input_cost"] = input_cost.reshape(widths.shape)
+        result["output_cost"] = output_cost.reshape(widths.shape)
+        result["total_cost"] = total_cost.reshape(widths.shape)
+        return result
+    
+    image_input_tokens = estimate_image_tokens_vec(widths, heights, detail)
+    result["image_input_tokens"] = image_input_tokens
+    result["total_input_tokens"] = PROMPT_TOKENS + image_input_tokens
+    result["input_cost"] = result["total_input_tokens"] * INPUT_COST_PER_TOKEN
+    result["output_cost"] = output_tokens * OUTPUT_COST_PER_TOKEN
+    result["total_cost"] = result["input_cost"] + result["output_cost"]
+    return result
+
 
 def estimate_image_tokens(width: int, height: int, detail: str = "high") -> int:
     """Estimate image tokens based on dimensions.
@@ -29,18 +202,7 @@ def estimate_image_tokens(width: int, height: int, detail: str = "high") -> int:
     Returns:
         Estimated number of tokens
     """
-    pixels = width * height
-    
-    if detail == "high":
-        # High detail: more tokens per pixel
-        # Base formula: tiles of 512x512, each tile costs ~170 tokens
-        tiles = (pixels / (512 * 512))
-        tokens = int(tiles * 170)
-        # Minimum cost for any image
-        return max(tokens, 85)  # Minimum ~85 tokens
-    else:
-        # Low detail: fixed cost
-        return 85
+    return _image_tokens_kernel(width, height, detail == "high")
 
 
 def calculate_single_extraction_cost(
@@ -63,18 +225,19 @@ def calculate_single_extraction_cost(
     if output_tokens is None:
         output_tokens = AVERAGE_OUTPUT_TOKENS
     
-    # Calculate tokens
-    text_input_tokens = PROMPT_TOKENS
-    image_input_tokens = estimate_image_tokens(image_width, image_height, detail)
-    total_input_tokens = text_input_tokens + image_input_tokens
-    
-    # Calculate costs
-    input_cost = (total_input_tokens / 1_000_000) * INPUT_COST_PER_1M_TOKENS
-    output_cost = (output_tokens / 1_000_000) * OUTPUT_COST_PER_1M_TOKENS
-    total_cost = input_cost + output_cost
+    total_input_tokens, image_input_tokens, input_cost, output_cost, total_cost = (
+        _cost_kernel(
+            image_width,
+            image_height,
+            detail == "high",
+            output_tokens,
+            INPUT_COST_PER_TOKEN,
+            OUTPUT_COST_PER_TOKEN,
+        )
+    )
     
     return {
-        "text_input_tokens": text_input_tokens,
+        "text_input_tokens": PROMPT_TOKENS,
         "image_input_tokens": image_input_tokens,
         "total_input_tokens": total_input_tokens,
         "output_tokens": output_tokens,
@@ -196,22 +359,26 @@ def main():
             ("Large (2000x1200)", 2000, 1200),
         ]
         
-        for name, width, height in scenarios:
-            cost = calculate_single_extraction_cost(width, height, detail=args.detail)
+        names, widths, heights = zip(*scenarios)
+        costs = calculate_single_extraction_cost_vec(
+            np.array(widths), np.array(heights), detail=args.detail
+        )["total_cost"]
+        
+        for name, cost in zip(names, costs):
             print(f"\n{name}:")
-            print(f"  Cost per extraction: ${cost['total_cost']:.6f}")
+            print(f"  Cost per extraction: ${cost:.6f}")
             if args.monthly:
-                monthly = calculate_monthly_cost(args.monthly, width, height, args.detail)
-                print(f"  Monthly ({args.monthly:,} extractions): ${monthly['monthly_cost']:.2f}")
+                print(f"  Monthly ({args.monthly:,} extractions): ${cost * args.monthly:.2f}")
         
         print("\n" + "=" * 60)
         print("Monthly Projections (Standard 1920x1080 images)")
         print("=" * 60)
         
-        monthly_scenarios = [100, 1000, 10000, 100000]
-        for count in monthly_scenarios:
-            monthly = calculate_monthly_cost(count, 1920, 1080, args.detail)
-            print(f"{count:>7,} extractions/month: ${monthly['monthly_cost']:>10,.2f}/mo (${monthly['annual_cost']:>10,.2f}/yr)")
+        monthly_scenarios = np.array([100, 1000, 10000, 100000])
+        single_cost = calculate_single_extraction_cost_vec(1920, 1080, detail=args.detail)
+        monthly_costs = single_cost["total_cost"] * monthly_scenarios
+        for count, monthly_cost in zip(monthly_scenarios, monthly_costs):
+            print(f"{count:>7,} extractions/month: ${monthly_cost:>10,.2f}/mo (${monthly_cost * 12:>10,.2f}/yr)")
         
         return
     
@@ -4,11 +4,12 @@ This module analyzes components to propose accessibility requirements
 such as aria-label, semantic HTML, and keyboard navigation.
 """
 
-import json
-import os
+import asyncio
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from openai import AsyncOpenAI
 from PIL import Image
+from pydantic import BaseModel, ConfigDict, Field
 
 from .base_proposer import BaseRequirementProposer
 from src.types.requirement_types import (
@@ -17,13 +18,57 @@ from src.types.requirement_types import (
     ComponentClassification,
 )
 from src.services.image_processor import prepare_image_for_vision_api
+from src.cache.vision_cache import image_seed
+from src.services.image_text_router import VisionInput, append_detected_text
 from src.prompts.accessibility_proposer import create_accessibility_prompt
+from src.core.serialization import json_cache_key, json_loads
 from src.core.tracing import traced
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class AccessibilityRequirementSchema(BaseModel):
+    """One accessibility requirement as returned by GPT-4V."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    name: str
+    required: bool
+    description: str
+    visual_cues: List[str] = Field(max_length=3)
+    confidence: float
+
+
+class AccessibilityResponseSchema(BaseModel):
+    """Structured output schema for accessibility proposals."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    accessibility: List[AccessibilityRequirementSchema] = Field(max_length=8)
+
+
+# Strict structured output lets the model stop as soon as the schema is
+# satisfied and guarantees parseable JSON
+ACCESSIBILITY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "a11y",
+        "schema": AccessibilityResponseSchema.model_json_schema(),
+        "strict": True,
+    },
+}
+
+
+@lru_cache(maxsize=128)
+def _cached_accessibility_prompt(component_type: str, figma_key=None) -> str:
+    """Build the accessibility prompt once per (component type, figma_data)."""
+    return create_accessibility_prompt(
+        component_type,
+        figma_data=json_loads(figma_key) if figma_key is not None else None,
+    )
+
+
 class AccessibilityProposer(BaseRequirementProposer):
     """Propose accessibility requirements from component analysis.
     
@@ -34,18 +79,18 @@ class AccessibilityProposer(BaseRequirementProposer):
     - Color contrast considerations
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ):
         """Initialize the accessibility proposer.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            client: Optional AsyncOpenAI client (defaults to the shared client)
         """
-        super().__init__(RequirementCategory.ACCESSIBILITY)
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
-        
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        super().__init__(RequirementCategory.ACCESSIBILITY, api_key=api_key, client=client)
         # gpt-4o has vision capabilities and is the recommended model
         self.model = "gpt-4o"
     
@@ -55,15 +100,22 @@ class AccessibilityProposer(BaseRequirementProposer):
         image: Image.Image,
         classification: ComponentClassification,
         tokens: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0,
+        image_url: Optional[str] = None,
+        vision_input: Optional[VisionInput] = None,
     ) -> List[RequirementProposal]:
         """Propose accessibility requirements for the component.
         
+        The image and prompt are prepared once; only the API call is
+        retried, with exponential backoff and jitter between attempts.
+        
         Args:
             image: Component screenshot
             classification: Component type classification
             tokens: Optional design tokens
-            retry_count: Current retry attempt (for internal use)
+            image_url: Optional data URL already produced by
+                prepare_image_for_vision_api, to avoid re-encoding the image
+            vision_input: Optional OCR-routed image payload from
+                route_image_for_vision; takes precedence over image_url
             
         Returns:
             List of proposed accessibility requirements
@@ -74,81 +126,112 @@ class AccessibilityProposer(BaseRequirementProposer):
                 "extra": {
                     "component_type": classification.component_type.value,
                     "has_tokens": tokens is not None,
-                    "retry_count": retry_count,
                 }
             }
         )
         
+        image_url_payload: Dict[str, Any] = {}
         try:
-            # Prepare image
-            image_url = prepare_image_for_vision_api(image)
+            # Prepare image (reuse caller's encoding if given)
+            if vision_input is not None:
+                image_url = vision_input.image_url
+                if vision_input.detail:
+                    image_url_payload["detail"] = vision_input.detail
+            elif image_url is None:
+                image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
+            image_url_payload["url"] = image_url
 
             # Build accessibility analysis prompt using the prompts module
-            prompt = create_accessibility_prompt(
+            prompt = self._build_accessibility_prompt(
                 classification.component_type.value,
                 figma_data=None,  # Will be passed from orchestrator in future
             )
+            if vision_input is not None:
+                prompt = append_detected_text(prompt, vision_input)
+        except Exception as e:
+            logger.error(f"Failed to prepare accessibility request: {e}")
+            return []
 
-            # Call GPT-4V for accessibility analysis
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url
-                                }
-                            }
-                        ]
-                    }
-                ],
-                response_format={"type": "json_object"},
-                max_tokens=1500,
-                temperature=0.2,
-            )
-            
-            # Parse response
-            result = json.loads(response.choices[0].message.content)
-            
-            # Convert to proposals
-            proposals = self._parse_accessibility_result(result, classification)
-            
-            # Log proposals
-            for proposal in proposals:
-                self.log_proposal(proposal)
-            
-            logger.info(
-                f"Proposed {len(proposals)} accessibility requirements",
-                extra={"extra": {"count": len(proposals)}}
+        request = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "image_url",
+                            "image_url": image_url_payload,
+                        }
+                    ]
+                }
+            ],
+            "response_format": ACCESSIBILITY_RESPONSE_FORMAT,
+            "max_tokens": 600,
+            "temperature": 0,
+            "seed": image_seed(image_url),
+        }
+        
+        def parse(content: str) -> List[RequirementProposal]:
+            return self._parse_accessibility_result(json_loads(content), classification)
+        
+        try:
+            # Greedy decoding makes identical requests return identical
+            # output, so responses are served from the vision cache;
+            # requirements are converted as they finish streaming
+            proposals = await self._cached_call(
+                self._request_cache_key(request),
+                lambda: self._call_vision(
+                    request, "accessibility", self._parse_accessibility_item, parse
+                ),
+                parse,
             )
-            
-            return proposals
-            
         except Exception as e:
-            if retry_count < self.max_retries:
-                logger.warning(
-                    f"Accessibility proposal failed (attempt {retry_count + 1}), retrying: {e}",
-                    extra={"extra": {"retry_count": retry_count, "error": str(e)}}
-                )
-                return await self.propose(
-                    image, classification, tokens, retry_count + 1
-                )
-            else:
-                logger.error(
-                    f"Accessibility proposal failed after {self.max_retries} retries",
-                    extra={
-                        "extra": {
-                            "max_retries": self.max_retries,
-                            "error": str(e),
-                        }
+            logger.error(
+                f"Accessibility proposal failed after {self.max_retries} retries",
+                extra={
+                    "extra": {
+                        "max_retries": self.max_retries,
+                        "error": str(e),
                     }
-                )
-                # Return empty list instead of raising to allow workflow to continue
-                return []
+                }
+            )
+            # Return empty list instead of raising to allow workflow to continue
+            return []
+        
+        # Log proposals
+        for proposal in proposals:
+            self.log_proposal(proposal)
+        
+        logger.info(
+            f"Proposed {len(proposals)} accessibility requirements",
+            extra={"extra": {"count": len(proposals)}}
+        )
+        
+        return proposals
+    
+    def _build_accessibility_prompt(
+        self,
+        component_type: str,
+        figma_data: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the accessibility prompt, reusing cached prompt strings.
+        
+        Args:
+            component_type: The component type being analyzed
+            figma_data: Optional Figma layer/component metadata
+            
+        Returns:
+            Accessibility proposal prompt text
+        """
+        if not figma_data:
+            return _cached_accessibility_prompt(component_type)
+        try:
+            figma_key = json_cache_key(figma_data)
+        except TypeError:
+            # Not JSON-serializable; build without caching
+            return create_accessibility_prompt(component_type, figma_data=figma_data)
+        return _cached_accessibility_prompt(component_type, figma_key)
     
     def _parse_accessibility_result(
         self,
@@ -165,47 +248,58 @@ class AccessibilityProposer(BaseRequirementProposer):
             List of RequirementProposal objects
         """
         proposals = []
-        a11y_list = result.get("accessibility", [])
-        
-        for a11y_data in a11y_list:
-            try:
-                name = a11y_data.get("name", "unknown")
-                required = a11y_data.get("required", True)  # Default to required for a11y
-                description = a11y_data.get("description", "")
-                visual_cues = a11y_data.get("visual_cues", [])
-                base_confidence = float(a11y_data.get("confidence", 0.5))
-                
-                # Calculate adjusted confidence
-                confidence = self.calculate_confidence(
-                    base_confidence,
-                    len(visual_cues),
-                    min_cues=1,
-                    max_cues=3
-                )
-                
-                # Generate rationale
-                rationale = self.generate_rationale(
-                    name,
-                    visual_cues,
-                    source="accessibility analysis"
-                )
-                
-                # Add WCAG context
-                rationale += " (WCAG 2.1 Level AA)"
-                
-                # Create proposal
-                proposal = self.create_proposal(
-                    name=name,
-                    confidence=confidence,
-                    rationale=rationale,
-                    required=required,
-                    description=description,
-                )
-                
+        for a11y_data in result.get("accessibility", []):
+            proposal = self._parse_accessibility_item(a11y_data)
+            if proposal is not None:
                 proposals.append(proposal)
-                
-            except Exception as e:
-                logger.warning(f"Failed to parse accessibility requirement: {e}")
-                continue
         
         return proposals
+    
+    def _parse_accessibility_item(
+        self, a11y_data: Dict[str, Any]
+    ) -> Optional[RequirementProposal]:
+        """Convert a single accessibility requirement into a proposal.
+        
+        Args:
+            a11y_data: One entry of the "accessibility" array
+            
+        Returns:
+            RequirementProposal, or None if the entry is malformed
+        """
+        try:
+            name = a11y_data.get("name", "unknown")
+            required = a11y_data.get("required", True)  # Default to required for a11y
+            description = a11y_data.get("description", "")
+            visual_cues = a11y_data.get("visual_cues", [])
+            base_confidence = float(a11y_data.get("confidence", 0.5))
+            
+            # Calculate adjusted confidence
+            confidence = self.calculate_confidence(
+                base_confidence,
+                len(visual_cues),
+                min_cues=1,
+                max_cues=3
+            )
+            
+            # Generate rationale
+            rationale = self.generate_rationale(
+                name,
+                visual_cues,
+                source="accessibility analysis"
+            )
+            
+            # Add WCAG context
+            rationale += " (WCAG 2.1 Level AA)"
+            
+            # Create proposal
+            return self.create_proposal(
+                name=name,
+                confidence=confidence,
+                rationale=rationale,
+                required=required,
+                description=description,
+            )
+            
+        except Exception as e:
+            logger.warning(f"Failed to parse accessibility requirement: {e}")
+            return None
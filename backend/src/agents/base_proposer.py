@@ -4,21 +4,169 @@ This module provides the abstract base class that all requirement proposers
 (props, events, states, accessibility) will extend.
 """
 
+import json
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+)
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
 from PIL import Image
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.types.requirement_types import (
     RequirementProposal,
     ComponentClassification,
     RequirementCategory,
     get_confidence_level,
+    new_proposal_id,
 )
+from src.cache.vision_cache import vision_response_cache
+from src.services.openai_client import get_openai_client
 from src.core.tracing import traced
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Classifier confidence above which proposers send images at detail="low"
+LOW_DETAIL_CONFIDENCE = 0.85
+
+# Small proposers default to the cheaper model (override with the
+# REQUIREMENT_PROPOSER_MODEL env var) and re-run on the full model when
+# every proposal comes back below ESCALATION_CONFIDENCE
+DEFAULT_PROPOSER_MODEL = "gpt-4o-mini"
+ESCALATION_MODEL = "gpt-4o"
+ESCALATION_CONFIDENCE = 0.6
+
+# Transient failures worth retrying: network errors and timeouts, 429s,
+# 5xx responses, and truncated or malformed response bodies
+RETRYABLE_ERRORS = (
+    APIConnectionError,
+    RateLimitError,
+    InternalServerError,
+    ValueError,
+)
+RETRY_MAX_WAIT = 8.0  # Seconds
+
+T = TypeVar("T")
+
+
+async def call_with_retry(
+    fn: Callable[[], Awaitable[T]],
+    max_retries: int,
+    retry_backoff: float,
+    label: str,
+) -> T:
+    """Await fn, retrying transient failures.
+    
+    Shared by the classifier and every proposer. Retries back off
+    exponentially with jitter so parallel agents hitting a rate limit
+    don't retry in lockstep; errors outside RETRYABLE_ERRORS are raised
+    immediately.
+    
+    Args:
+        fn: Coroutine function performing one attempt
+        max_retries: Retries after the first attempt
+        retry_backoff: Initial backoff in seconds
+        label: What is being attempted, for retry log messages
+        
+    Returns:
+        Result of the first successful attempt
+    """
+    def log_retry(retry_state: RetryCallState) -> None:
+        error = retry_state.outcome.exception()
+        logger.warning(
+            f"{label} failed (attempt {retry_state.attempt_number}), retrying: {error}",
+            extra={
+                "extra": {
+                    "retry_count": retry_state.attempt_number - 1,
+                    "error": str(error),
+                }
+            }
+        )
+    
+    retrying = AsyncRetrying(
+        stop=stop_after_attempt(max_retries + 1),
+        wait=wait_exponential_jitter(initial=retry_backoff, max=RETRY_MAX_WAIT),
+        retry=retry_if_exception_type(RETRYABLE_ERRORS),
+        before_sleep=log_retry,
+        reraise=True,
+    )
+    return await retrying(fn)
+
+
+class StreamingArrayParser:
+    """Incrementally extract items of a JSON array from a streamed response.
+    
+    Feed text chunks as they arrive; each complete element of the array
+    stored under ``key`` is returned as soon as its closing brace has been
+    received, so callers can process items while the model is still
+    generating the rest.
+    """
+    
+    def __init__(self, key: str):
+        """Initialize the parser.
+        
+        Args:
+            key: Name of the top-level key holding the array
+        """
+        self._key_pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos: Optional[int] = None
+        self.done = False
+    
+    @property
+    def text(self) -> str:
+        """Full text received so far."""
+        return self._buffer
+    
+    def feed(self, chunk: str) -> List[Any]:
+        """Add a chunk of streamed text.
+        
+        Args:
+            chunk: Next piece of the response body
+            
+        Returns:
+            Array items completed by this chunk (possibly empty)
+        """
+        self._buffer += chunk
+        items: List[Any] = []
+        if self.done:
+            return items
+        
+        if self._pos is None:
+            match = self._key_pattern.search(self._buffer)
+            if not match:
+                return items
+            self._pos = match.end()
+        
+        buffer = self._buffer
+        while True:
+            # Skip separators between items
+            while self._pos < len(buffer) and buffer[self._pos] in " \t\r\n,":
+                self._pos += 1
+            if self._pos >= len(buffer):
+                break
+            if buffer[self._pos] == "]":
+                self.done = True
+                break
+            try:
+                item, self._pos = self._decoder.raw_decode(buffer, self._pos)
+            except json.JSONDecodeError:
+                # Item not complete yet; wait for more text
+                break
+            items.append(item)
+        
+        return items
+
 
 class BaseRequirementProposer(ABC):
     """Abstract base class for requirement proposers.
@@ -27,15 +175,50 @@ class BaseRequirementProposer(ABC):
     class and implement the propose() method.
     """
     
-    def __init__(self, category: RequirementCategory):
+    def __init__(
+        self,
+        category: RequirementCategory,
+        api_key: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ):
         """Initialize the requirement proposer.
         
         Args:
             category: The requirement category this proposer handles
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            client: Optional AsyncOpenAI client (defaults to the shared client)
+            
+        Raises:
+            ValueError: If no API key is given or set in the environment
         """
         self.category = category
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("OpenAI API key is required")
+        
+        # Share one connection pool across agents unless a client is injected
+        self.client = client or get_openai_client(self.api_key)
         self.retry_count = 0
         self.max_retries = 3
+        self.retry_backoff = 0.5  # Seconds; doubled on each retry
+    
+    @staticmethod
+    def image_detail(classification: ComponentClassification) -> str:
+        """Pick the vision detail level for a proposal request.
+        
+        Once the component type is known with high confidence, a single
+        low-detail tile is enough to read its visual cues; uncertain
+        classifications keep full tiling.
+        
+        Args:
+            classification: Component type classification
+            
+        Returns:
+            "low" or "high"
+        """
+        if classification.confidence > LOW_DETAIL_CONFIDENCE:
+            return "low"
+        return "high"
     
     @abstractmethod
     async def propose(
@@ -58,6 +241,165 @@ class BaseRequirementProposer(ABC):
         """
         pass
     
+    def should_escalate(
+        self, proposals: List[RequirementProposal], model: str
+    ) -> bool:
+        """Check whether proposals warrant a retry on ESCALATION_MODEL.
+        
+        Args:
+            proposals: Proposals parsed from the model's response
+            model: Model that produced them
+            
+        Returns:
+            True if every proposal is low-confidence and a stronger model
+            is available
+        """
+        return (
+            model != ESCALATION_MODEL
+            and bool(proposals)
+            and all(p.confidence < ESCALATION_CONFIDENCE for p in proposals)
+        )
+    
+    @staticmethod
+    def _request_cache_key(request: Dict[str, Any]) -> str:
+        """Build a vision cache key from chat completion request kwargs.
+        
+        Covers the model, every text part (prompt, component type, tokens),
+        the encoded image and its detail level, so any change to them is a cache miss.
+        
+        Args:
+            request: Keyword arguments for chat.completions.create
+            
+        Returns:
+            Cache key string
+        """
+        texts: List[str] = []
+        image_url = ""
+        detail = None
+        for message in request["messages"]:
+            content = message["content"]
+            if isinstance(content, str):
+                texts.append(content)
+                continue
+            for part in content:
+                if part["type"] == "text":
+                    texts.append(part["text"])
+                elif part["type"] == "image_url":
+                    image_url = part["image_url"]["url"]
+                    detail = part["image_url"].get("detail")
+        return vision_response_cache.build_key(
+            request["model"], "\n".join(texts), image_url, detail
+        )
+    
+    async def _cached_call(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Tuple[str, List[RequirementProposal]]]],
+        parse: Callable[[str], List[RequirementProposal]],
+    ) -> List[RequirementProposal]:
+        """Return proposals for key, calling fn on a cache miss.
+        
+        Re-submitted screenshots (retries, re-runs, CI fixtures) are served
+        from the shared vision response cache instead of the API. Raw text
+        is cached rather than proposals so each run still gets fresh IDs,
+        and only once fn has parsed it so a malformed response is never
+        reused.
+        
+        Args:
+            key: Cache key from _request_cache_key
+            fn: Coroutine function performing the API call and returning
+                the response text with its parsed proposals
+            parse: Converts cached response text into proposals
+            
+        Returns:
+            Parsed proposals
+        """
+        cached = await vision_response_cache.get(key)
+        if cached is not None:
+            logger.debug(
+                f"Using cached {self.category.value} response",
+                extra={"extra": {"category": self.category.value}}
+            )
+            return parse(cached)
+        
+        content, proposals = await fn()
+        await vision_response_cache.set(key, content)
+        return proposals
+    
+    async def _call_vision(
+        self,
+        request: Dict[str, Any],
+        key: str,
+        parse_item: Callable[[Dict[str, Any]], Optional[RequirementProposal]],
+        parse: Callable[[str], List[RequirementProposal]],
+    ) -> Tuple[str, List[RequirementProposal]]:
+        """Stream a vision request, retrying transient failures.
+        
+        Subclasses provide ``self.client``.
+        
+        Args:
+            request: Keyword arguments for chat.completions.create
+            key: Top-level key of the proposals array
+            parse_item: Converts one array item into a proposal (or None)
+            parse: Converts a full response body into proposals
+            
+        Returns:
+            Full response text and its proposals
+        """
+        async def attempt() -> Tuple[str, List[RequirementProposal]]:
+            stream = await self.client.chat.completions.create(**request, stream=True)
+            return await self._collect_stream(stream, key, parse_item, parse)
+        
+        return await call_with_retry(
+            attempt,
+            self.max_retries,
+            self.retry_backoff,
+            f"{self.category.value.capitalize()} proposal",
+        )
+    
+    async def _collect_stream(
+        self,
+        stream: AsyncIterator[Any],
+        key: str,
+        parse_item: Callable[[Dict[str, Any]], Optional[RequirementProposal]],
+        parse: Callable[[str], List[RequirementProposal]],
+    ) -> Tuple[str, List[RequirementProposal]]:
+        """Convert array items of a streamed completion as they arrive.
+        
+        Args:
+            stream: Chat completion chunks from a stream=True request
+            key: Top-level key of the proposals array
+            parse_item: Converts one array item into a proposal (or None)
+            parse: Converts a full response body into proposals, used when
+                the streamed body does not have the expected shape
+            
+        Returns:
+            Full response text and its proposals
+            
+        Raises:
+            ValueError: If the response was cut off before completing
+        """
+        parser = StreamingArrayParser(key)
+        proposals = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            for item in parser.feed(delta):
+                proposal = parse_item(item)
+                if proposal is not None:
+                    proposals.append(proposal)
+        
+        if not parser.done:
+            # Unexpected shape; fall back to parsing the buffered body
+            if not parser.text.rstrip().endswith("}"):
+                raise ValueError(f"Truncated {self.category.value} response")
+            proposals = parse(parser.text)
+        
+        return parser.text, proposals
+    
     def calculate_confidence(
         self,
         base_confidence: float,
@@ -143,13 +485,8 @@ class BaseRequirementProposer(ABC):
         Returns:
             RequirementProposal object
         """
-        import uuid
-        
-        # Generate unique ID using UUID4
-        proposal_id = f"{self.category.value}-{name}-{uuid.uuid4().hex[:8]}"
-        
         return RequirementProposal(
-            id=proposal_id,
+            id=new_proposal_id(self.category, name),
             category=self.category,
             name=name,
             values=values,
@@ -4,11 +4,13 @@ This agent analyzes screenshots and Figma frames to detect component types
 (Button, Card, Input, etc.) with confidence scoring.
 """
 
-import json
+import asyncio
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional
 from openai import AsyncOpenAI
 from PIL import Image
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.types.requirement_types import (
     ComponentType,
@@ -16,12 +18,82 @@ from src.types.requirement_types import (
     get_confidence_level,
 )
 from src.services.image_processor import prepare_image_for_vision_api
-from src.prompts.component_classifier import create_classification_prompt
+from src.services.openai_client import get_openai_client
+from src.agents.base_proposer import call_with_retry
+from src.cache.vision_cache import image_seed, vision_response_cache
+from src.services.image_text_router import VisionInput, append_detected_text
+from src.prompts.component_classifier import (
+    create_batch_classification_prompt,
+    create_classification_prompt,
+)
+from src.core.serialization import json_cache_key, json_loads
 from src.core.tracing import traced
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Most images sent in one classify_batch request; larger lists are split.
+# Bounds the request size and its max_tokens (400 per image)
+MAX_BATCH_IMAGES = 8
+
+
+class ClassificationCandidateSchema(BaseModel):
+    """Alternative component type with its confidence."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    type: ComponentType
+    confidence: float
+
+
+class ClassificationResponseSchema(BaseModel):
+    """Structured output schema for component classification."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    component_type: ComponentType
+    confidence: float
+    candidates: List[ClassificationCandidateSchema] = Field(max_length=3)
+    rationale: str
+
+
+# Strict structured output lets the model stop as soon as the schema is
+# satisfied and guarantees parseable JSON
+CLASSIFICATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "component_classification",
+        "schema": ClassificationResponseSchema.model_json_schema(),
+        "strict": True,
+    },
+}
+
+
+class BatchClassificationResponseSchema(BaseModel):
+    """Structured output schema for batch classification, one entry per image."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    classifications: List[ClassificationResponseSchema]
+
+
+BATCH_CLASSIFICATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "component_classification_batch",
+        "schema": BatchClassificationResponseSchema.model_json_schema(),
+        "strict": True,
+    },
+}
+
+
+@lru_cache(maxsize=128)
+def _cached_classification_prompt(figma_key=None) -> str:
+    """Build the classification prompt once per distinct figma_data."""
+    return create_classification_prompt(
+        json_loads(figma_key) if figma_key is not None else None
+    )
+
 
 class ComponentClassifierError(Exception):
     """Exception raised for component classification errors."""
@@ -35,36 +107,55 @@ class ComponentClassifier:
     based on visual cues, layout patterns, and interactive elements.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Built once so parsing is a dict lookup instead of enum construction
+    _COMPONENT_TYPE_MAP: Dict[str, ComponentType] = {c.value: c for c in ComponentType}
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        image_detail: Literal["low", "high"] = "low",
+        client: Optional[AsyncOpenAI] = None,
+    ):
         """Initialize the component classifier.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            image_detail: Vision detail level. Component type is a coarse
+                visual decision, so "low" (fixed 85 image tokens) is enough.
+            client: Optional AsyncOpenAI client (defaults to the shared client)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = client or get_openai_client(self.api_key)
         self.max_retries = 3
+        self.retry_backoff = 0.5  # Seconds; doubled on each retry
         # gpt-4o has vision capabilities and is the recommended model for GPT-4V tasks
         self.model = "gpt-4o"
+        self.image_detail = image_detail
     
     @traced(run_name="classify_component")
     async def classify_component(
         self,
         image: Image.Image,
         figma_data: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0
+        image_url: Optional[str] = None,
+        vision_input: Optional[VisionInput] = None,
     ) -> ComponentClassification:
         """Classify component type from an image.
         
-        This method is traced with LangSmith for observability.
+        This method is traced with LangSmith for observability. The image
+        and prompt are prepared once; only the API call is retried, with
+        exponential backoff between attempts.
         
         Args:
             image: PIL Image object
             figma_data: Optional Figma layer/component metadata
-            retry_count: Current retry attempt (for internal use)
+            image_url: Optional data URL already produced by
+                prepare_image_for_vision_api, to avoid re-encoding the image
+            vision_input: Optional OCR-routed image payload from
+                route_image_for_vision; takes precedence over image_url
             
         Returns:
             ComponentClassification with type, confidence, and candidates
@@ -72,24 +163,43 @@ class ComponentClassifier:
         Raises:
             ComponentClassifierError: If classification fails after retries
         """
-        try:
-            # Log input metadata
-            logger.info(
-                "Starting component classification",
-                extra={
-                    "extra": {
-                        "has_figma_data": figma_data is not None,
-                        "retry_count": retry_count,
-                    }
+        # Log input metadata
+        logger.info(
+            "Starting component classification",
+            extra={
+                "extra": {
+                    "has_figma_data": figma_data is not None,
                 }
-            )
-            
-            # Prepare image for vision API
-            image_url = prepare_image_for_vision_api(image)
+            }
+        )
+        
+        image_detail = self.image_detail
+        try:
+            # Prepare image for vision API (reuse caller's encoding if given)
+            if vision_input is not None:
+                image_url = vision_input.image_url
+                image_detail = vision_input.detail or image_detail
+            elif image_url is None:
+                image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
 
             # Build prompt
             prompt = self._build_classification_prompt(figma_data)
+            if vision_input is not None:
+                prompt = append_detected_text(prompt, vision_input)
+        except Exception as e:
+            raise ComponentClassifierError(
+                f"Failed to classify component: {e}"
+            ) from e
+
+        # Greedy decoding makes identical requests return identical output
+        cache_key = vision_response_cache.build_key(
+            self.model, prompt, image_url, image_detail
+        )
+        cached = await vision_response_cache.get(cache_key)
+        if cached is not None:
+            return self._parse_classification_result(json_loads(cached))
 
+        async def attempt() -> ComponentClassification:
             # Call GPT-4V with structured output
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -101,60 +211,179 @@ class ComponentClassifier:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": image_url
+                                    "url": image_url,
+                                    "detail": image_detail,
                                 }
                             }
                         ]
                     }
                 ],
-                response_format={"type": "json_object"},
-                max_tokens=1000,
-                temperature=0.1,  # Low temperature for consistent classification
+                response_format=CLASSIFICATION_RESPONSE_FORMAT,
+                max_tokens=400,
+                temperature=0,  # Greedy decoding for deterministic classification
+                seed=image_seed(image_url),
             )
             
-            # Parse response
-            result = json.loads(response.choices[0].message.content)
-            
-            # Validate and convert to ComponentClassification
-            classification = self._parse_classification_result(result)
-            
-            # Log successful classification
-            logger.info(
-                f"Component classified as {classification.component_type}",
+            # Parse and validate before caching
+            content = response.choices[0].message.content
+            classification = self._parse_classification_result(json_loads(content))
+            await vision_response_cache.set(cache_key, content)
+            return classification
+        
+        try:
+            classification = await call_with_retry(
+                attempt, self.max_retries, self.retry_backoff, "Classification"
+            )
+        except Exception as e:
+            logger.error(
+                f"Component classification failed after {self.max_retries} retries",
                 extra={
                     "extra": {
-                        "component_type": classification.component_type.value,
-                        "confidence": classification.confidence,
-                        "confidence_level": get_confidence_level(classification.confidence).value,
-                        "num_candidates": len(classification.candidates),
+                        "max_retries": self.max_retries,
+                        "error": str(e),
                     }
                 }
             )
+            raise ComponentClassifierError(
+                f"Failed to classify component: {e}"
+            ) from e
+        
+        # Log successful classification
+        logger.info(
+            f"Component classified as {classification.component_type}",
+            extra={
+                "extra": {
+                    "component_type": classification.component_type.value,
+                    "confidence": classification.confidence,
+                    "confidence_level": get_confidence_level(classification.confidence).value,
+                    "num_candidates": len(classification.candidates),
+                }
+            }
+        )
+        
+        return classification
+    
+    @traced(run_name="classify_batch")
+    async def classify_batch(
+        self, images: List[Image.Image]
+    ) -> List[ComponentClassification]:
+        """Classify several component images in a single API request.
+        
+        All images are attached to one message after a shared rubric, which
+        saves a round-trip and a prompt prefix per extra image. A single
+        image goes through classify_component so it keeps the per-image
+        prompt, and more than MAX_BATCH_IMAGES images are split into
+        concurrent requests of at most that size.
+        
+        Args:
+            images: PIL Image objects, e.g. sibling components from one upload
             
-            return classification
+        Returns:
+            ComponentClassification per image, in the same order
             
+        Raises:
+            ComponentClassifierError: If classification fails after retries
+        """
+        if not images:
+            return []
+        if len(images) == 1:
+            return [await self.classify_component(images[0])]
+        if len(images) > MAX_BATCH_IMAGES:
+            batches = await asyncio.gather(*(
+                self.classify_batch(images[i:i + MAX_BATCH_IMAGES])
+                for i in range(0, len(images), MAX_BATCH_IMAGES)
+            ))
+            return [c for batch in batches for c in batch]
+        
+        logger.info(
+            "Starting batch component classification",
+            extra={"extra": {"num_images": len(images)}}
+        )
+        
+        try:
+            # Encode off the event loop, like classify_component
+            image_urls = await asyncio.gather(*(
+                asyncio.to_thread(prepare_image_for_vision_api, image)
+                for image in images
+            ))
+            prompt = create_batch_classification_prompt(len(images))
         except Exception as e:
-            if retry_count < self.max_retries:
-                logger.warning(
-                    f"Classification failed (attempt {retry_count + 1}), retrying: {e}",
-                    extra={"extra": {"retry_count": retry_count, "error": str(e)}}
-                )
-                return await self.classify_component(
-                    image, figma_data, retry_count + 1
+            raise ComponentClassifierError(
+                f"Failed to classify components: {e}"
+            ) from e
+        
+        content: List[Dict[str, Any]] = [{"type": "text", "text": prompt}]
+        content.extend(
+            {
+                "type": "image_url",
+                "image_url": {"url": url, "detail": self.image_detail},
+            }
+            for url in image_urls
+        )
+        
+        # Keyed on every image in order, so a reordered batch is a miss
+        images_key = "\n".join(image_urls)
+        cache_key = vision_response_cache.build_key(
+            self.model, prompt, images_key, self.image_detail
+        )
+        
+        def parse(text: str) -> List[ComponentClassification]:
+            results = json_loads(text)["classifications"]
+            if len(results) != len(images):
+                raise ValueError(
+                    f"Expected {len(images)} classifications, got {len(results)}"
                 )
-            else:
-                logger.error(
-                    f"Component classification failed after {self.max_retries} retries",
-                    extra={
-                        "extra": {
-                            "max_retries": self.max_retries,
-                            "error": str(e),
-                        }
+            return [self._parse_classification_result(item) for item in results]
+        
+        async def attempt() -> List[ComponentClassification]:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": content}],
+                response_format=BATCH_CLASSIFICATION_RESPONSE_FORMAT,
+                max_tokens=400 * len(images),
+                temperature=0,
+                seed=image_seed(images_key),
+            )
+            
+            text = response.choices[0].message.content
+            classifications = parse(text)
+            await vision_response_cache.set(cache_key, text)
+            return classifications
+        
+        cached = await vision_response_cache.get(cache_key)
+        if cached is not None:
+            return parse(cached)
+        
+        try:
+            classifications = await call_with_retry(
+                attempt, self.max_retries, self.retry_backoff, "Batch classification"
+            )
+        except Exception as e:
+            logger.error(
+                f"Batch classification failed after {self.max_retries} retries",
+                extra={
+                    "extra": {
+                        "max_retries": self.max_retries,
+                        "error": str(e),
                     }
-                )
-                raise ComponentClassifierError(
-                    f"Failed to classify component: {e}"
-                ) from e
+                }
+            )
+            raise ComponentClassifierError(
+                f"Failed to classify components: {e}"
+            ) from e
+        
+        logger.info(
+            f"Classified {len(classifications)} components in one request",
+            extra={
+                "extra": {
+                    "component_types": [
+                        c.component_type.value for c in classifications
+                    ],
+                }
+            }
+        )
+        
+        return classifications
     
     def _build_classification_prompt(
         self, figma_data: Optional[Dict[str, Any]] = None
@@ -167,7 +396,14 @@ class ComponentClassifier:
         Returns:
             Classification prompt text with examples
         """
-        return create_classification_prompt(figma_data)
+        if not figma_data:
+            return _cached_classification_prompt()
+        try:
+            figma_key = json_cache_key(figma_data)
+        except TypeError:
+            # Not JSON-serializable; build without caching
+            return create_classification_prompt(figma_data)
+        return _cached_classification_prompt(figma_key)
     
     def _parse_classification_result(
         self, result: Dict[str, Any]
@@ -190,24 +426,25 @@ class ComponentClassifier:
                 raise ValueError("Missing component_type in result")
             
             # Map string to enum
-            component_type = ComponentType(component_type_str)
+            component_type = self._COMPONENT_TYPE_MAP.get(component_type_str)
+            if component_type is None:
+                raise ValueError(f"Unknown component_type: {component_type_str!r}")
             
             # Extract confidence
             confidence = float(result.get("confidence", 0.5))
             confidence = max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
             
-            # Extract candidates
-            candidates_raw = result.get("candidates", [])
-            candidates = []
-            for cand in candidates_raw:
-                try:
-                    candidates.append({
-                        "type": ComponentType(cand["type"]),
-                        "confidence": float(cand.get("confidence", 0.0))
-                    })
-                except (KeyError, ValueError):
-                    # Skip invalid candidates
-                    pass
+            # Extract candidates, skipping missing or unknown types
+            # (confidence is a number under the strict response schema)
+            type_map = self._COMPONENT_TYPE_MAP
+            candidates = [
+                {
+                    "type": type_map[cand["type"]],
+                    "confidence": float(cand.get("confidence", 0.0)),
+                }
+                for cand in result.get("candidates", [])
+                if cand.get("type") in type_map
+            ]
             
             # Extract rationale
             rationale = result.get("rationale", "No rationale provided")
@@ -4,8 +4,7 @@ This module analyzes components to propose event handler requirements
 such as onClick, onChange, onHover, and onFocus.
 """
 
-import json
-import os
+import asyncio
 from typing import Any, Dict, List, Optional
 from openai import AsyncOpenAI
 from PIL import Image
@@ -18,6 +17,7 @@ from src.types.requirement_types import (
 )
 from src.services.image_processor import prepare_image_for_vision_api
 from src.prompts.events_proposer import create_events_prompt
+from src.core.serialization import json_loads
 from src.core.tracing import traced
 from src.core.logging import get_logger
 
@@ -33,18 +33,18 @@ class EventsProposer(BaseRequirementProposer):
     - onHover/onFocus handlers for interactive states
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ):
         """Initialize the events proposer.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            client: Optional AsyncOpenAI client (defaults to the shared client)
         """
-        super().__init__(RequirementCategory.EVENTS)
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
-        
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        super().__init__(RequirementCategory.EVENTS, api_key=api_key, client=client)
         # gpt-4o has vision capabilities and is the recommended model
         self.model = "gpt-4o"
     
@@ -54,7 +54,7 @@ class EventsProposer(BaseRequirementProposer):
         image: Image.Image,
         classification: ComponentClassification,
         tokens: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0,
+        image_url: Optional[str] = None,
     ) -> List[RequirementProposal]:
         """Propose event handler requirements for the component.
         
@@ -62,7 +62,8 @@ class EventsProposer(BaseRequirementProposer):
             image: Component screenshot
             classification: Component type classification
             tokens: Optional design tokens
-            retry_count: Current retry attempt (for internal use)
+            image_url: Optional data URL already produced by
+                prepare_image_for_vision_api, to avoid re-encoding the image
             
         Returns:
             List of proposed event handler requirements
@@ -73,81 +74,79 @@ class EventsProposer(BaseRequirementProposer):
                 "extra": {
                     "component_type": classification.component_type.value,
                     "has_tokens": tokens is not None,
-                    "retry_count": retry_count,
                 }
             }
         )
         
         try:
-            # Prepare image
-            image_url = prepare_image_for_vision_api(image)
+            # Prepare image (reuse caller's encoding if given)
+            if image_url is None:
+                image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
 
             # Build events analysis prompt using the prompts module
             prompt = create_events_prompt(
                 classification.component_type.value,
                 figma_data=None,  # Will be passed from orchestrator in future
             )
-
-            # Call GPT-4V for events analysis
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url
-                                }
+        except Exception as e:
+            logger.error(f"Failed to prepare events request: {e}")
+            return []
+        
+        request = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": image_url
                             }
-                        ]
-                    }
-                ],
-                response_format={"type": "json_object"},
-                max_tokens=1500,
-                temperature=0.2,
-            )
-            
-            # Parse response
-            result = json.loads(response.choices[0].message.content)
-            
-            # Convert to proposals
-            proposals = self._parse_events_result(result, classification)
-            
-            # Log proposals
-            for proposal in proposals:
-                self.log_proposal(proposal)
-            
-            logger.info(
-                f"Proposed {len(proposals)} events requirements",
-                extra={"extra": {"count": len(proposals)}}
+                        }
+                    ]
+                }
+            ],
+            "response_format": {"type": "json_object"},
+            "max_tokens": 1500,
+            "temperature": 0.2,
+        }
+        
+        try:
+            # Only the API call and parsing are retried; the image and prompt
+            # are prepared once above
+            _, proposals = await self._call_vision(
+                request,
+                "events",
+                lambda event_data: self._parse_event_item(event_data, classification),
+                lambda content: self._parse_events_result(
+                    json_loads(content), classification
+                ),
             )
-            
-            return proposals
-            
         except Exception as e:
-            if retry_count < self.max_retries:
-                logger.warning(
-                    f"Events proposal failed (attempt {retry_count + 1}), retrying: {e}",
-                    extra={"extra": {"retry_count": retry_count, "error": str(e)}}
-                )
-                return await self.propose(
-                    image, classification, tokens, retry_count + 1
-                )
-            else:
-                logger.error(
-                    f"Events proposal failed after {self.max_retries} retries",
-                    extra={
-                        "extra": {
-                            "max_retries": self.max_retries,
-                            "error": str(e),
-                        }
+            logger.error(
+                f"Events proposal failed after {self.max_retries} retries",
+                extra={
+                    "extra": {
+                        "max_retries": self.max_retries,
+                        "error": str(e),
                     }
-                )
-                # Return empty list instead of raising to allow workflow to continue
-                return []
+                }
+            )
+            # Return empty list instead of raising to allow workflow to continue
+            return []
+        
+        # Log proposals
+        for proposal in proposals:
+            self.log_proposal(proposal)
+        
+        logger.info(
+            f"Proposed {len(proposals)} events requirements",
+            extra={"extra": {"count": len(proposals)}}
+        )
+        
+        return proposals
     
     def _parse_events_result(
         self,
@@ -164,45 +163,59 @@ class EventsProposer(BaseRequirementProposer):
             List of RequirementProposal objects
         """
         proposals = []
-        events_list = result.get("events", [])
-        
-        for event_data in events_list:
-            try:
-                name = event_data.get("name", "unknown")
-                required = event_data.get("required", False)
-                visual_cues = event_data.get("visual_cues", [])
-                base_confidence = float(event_data.get("confidence", 0.5))
-                
-                # Calculate adjusted confidence
-                confidence = self.calculate_confidence(
-                    base_confidence,
-                    len(visual_cues),
-                    min_cues=1,
-                    max_cues=3
-                )
-                
-                # Generate rationale
-                rationale = self.generate_rationale(
-                    name,
-                    visual_cues,
-                    source="visual analysis and interaction patterns"
-                )
-                
-                # Add component type context to rationale
-                rationale += f" (Component: {classification.component_type.value})"
-                
-                # Create proposal
-                proposal = self.create_proposal(
-                    name=name,
-                    confidence=confidence,
-                    rationale=rationale,
-                    required=required,
-                )
-                
+        for event_data in result.get("events", []):
+            proposal = self._parse_event_item(event_data, classification)
+            if proposal is not None:
                 proposals.append(proposal)
-                
-            except Exception as e:
-                logger.warning(f"Failed to parse event: {e}")
-                continue
         
         return proposals
+    
+    def _parse_event_item(
+        self,
+        event_data: Dict[str, Any],
+        classification: ComponentClassification
+    ) -> Optional[RequirementProposal]:
+        """Convert a single event handler into a proposal.
+        
+        Args:
+            event_data: One entry of the "events" array
+            classification: Component classification for context
+            
+        Returns:
+            RequirementProposal, or None if the entry is malformed
+        """
+        try:
+            name = event_data.get("name", "unknown")
+            required = event_data.get("required", False)
+            visual_cues = event_data.get("visual_cues", [])
+            base_confidence = float(event_data.get("confidence", 0.5))
+            
+            # Calculate adjusted confidence
+            confidence = self.calculate_confidence(
+                base_confidence,
+                len(visual_cues),
+                min_cues=1,
+                max_cues=3
+            )
+            
+            # Generate rationale
+            rationale = self.generate_rationale(
+                name,
+                visual_cues,
+                source="visual analysis and interaction patterns"
+            )
+            
+            # Add component type context to rationale
+            rationale += f" (Component: {classification.component_type.value})"
+            
+            # Create proposal
+            return self.create_proposal(
+                name=name,
+                confidence=confidence,
+                rationale=rationale,
+                required=required,
+            )
+            
+        except Exception as e:
+            logger.warning(f"Failed to parse event: {e}")
+            return None
@@ -4,26 +4,96 @@ This module analyzes components to propose prop requirements such as
 variants, sizes, and boolean props.
 """
 
-import json
+import asyncio
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional
 from openai import AsyncOpenAI
 from PIL import Image
+from pydantic import BaseModel, ConfigDict, Field
 
-from .base_proposer import BaseRequirementProposer
+from .base_proposer import (
+    BaseRequirementProposer,
+    DEFAULT_PROPOSER_MODEL,
+    ESCALATION_MODEL,
+)
 from src.types.requirement_types import (
     RequirementProposal,
     RequirementCategory,
     ComponentClassification,
 )
 from src.services.image_processor import prepare_image_for_vision_api
+from src.cache.vision_cache import image_seed
 from src.prompts.props_proposer import create_props_prompt
+from src.core.serialization import json_cache_key, json_loads
 from src.core.tracing import traced
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class PropRequirementSchema(BaseModel):
+    """One prop requirement as returned by GPT-4V."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    name: str
+    type: Literal["enum", "boolean", "string", "number"]
+    values: Optional[List[str]]
+    visual_cues: List[str] = Field(max_length=4)
+    confidence: float
+
+
+class PropsResponseSchema(BaseModel):
+    """Structured output schema for props proposals."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    props: List[PropRequirementSchema] = Field(max_length=6)
+
+
+class _PropItem(BaseModel):
+    """One prop as parsed from a response.
+    
+    Lenient counterpart of PropRequirementSchema for responses produced
+    without the strict schema (unified proposer, cached text).
+    """
+    
+    name: str = "unknown"
+    type: str = "string"
+    values: Optional[List[str]] = None
+    visual_cues: List[str] = []
+    confidence: float = 0.5
+
+
+class _PropsResponse(BaseModel):
+    """Props array as parsed from a response."""
+    
+    props: List[_PropItem] = []
+
+
+# Strict structured output bounds the response size and guarantees
+# parseable JSON
+PROPS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "props",
+        "schema": PropsResponseSchema.model_json_schema(),
+        "strict": True,
+    },
+}
+
+
+@lru_cache(maxsize=128)
+def _cached_props_prompt(component_type: str, tokens_key=None) -> str:
+    """Build the props prompt once per (component type, tokens)."""
+    return create_props_prompt(
+        component_type,
+        figma_data=None,  # Will be passed from orchestrator in future
+        tokens=json_loads(tokens_key) if tokens_key is not None else None,
+    )
+
+
 class PropsProposer(BaseRequirementProposer):
     """Propose prop requirements from component analysis.
     
@@ -33,20 +103,21 @@ class PropsProposer(BaseRequirementProposer):
     - Boolean props (disabled, loading, fullWidth)
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ):
         """Initialize the props proposer.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            client: Optional AsyncOpenAI client (defaults to the shared client)
         """
-        super().__init__(RequirementCategory.PROPS)
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
-        
-        self.client = AsyncOpenAI(api_key=self.api_key)
-        # gpt-4o has vision capabilities and is the recommended model
-        self.model = "gpt-4o"
+        super().__init__(RequirementCategory.PROPS, api_key=api_key, client=client)
+        # gpt-4o-mini handles single-screenshot props analysis; low-confidence
+        # results are re-run on ESCALATION_MODEL
+        self.model = os.getenv("REQUIREMENT_PROPOSER_MODEL", DEFAULT_PROPOSER_MODEL)
     
     @traced(run_name="propose_props")
     async def propose(
@@ -54,7 +125,7 @@ class PropsProposer(BaseRequirementProposer):
         image: Image.Image,
         classification: ComponentClassification,
         tokens: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0,
+        image_url: Optional[str] = None,
     ) -> List[RequirementProposal]:
         """Propose prop requirements for the component.
         
@@ -62,7 +133,8 @@ class PropsProposer(BaseRequirementProposer):
             image: Component screenshot
             classification: Component type classification
             tokens: Optional design tokens
-            retry_count: Current retry attempt (for internal use)
+            image_url: Optional data URL already produced by
+                prepare_image_for_vision_api, to avoid re-encoding the image
             
         Returns:
             List of proposed prop requirements
@@ -73,49 +145,38 @@ class PropsProposer(BaseRequirementProposer):
                 "extra": {
                     "component_type": classification.component_type.value,
                     "has_tokens": tokens is not None,
-                    "retry_count": retry_count,
                 }
             }
         )
         
         try:
-            # Prepare image
-            image_url = prepare_image_for_vision_api(image)
-
-            # Build props analysis prompt using the prompts module
-            prompt = create_props_prompt(
-                classification.component_type.value,
-                figma_data=None,  # Will be passed from orchestrator in future
-                tokens=tokens
-            )
+            # Prepare image (reuse caller's encoding if given)
+            if image_url is None:
+                image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
 
-            # Call GPT-4V for props analysis
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url
-                                }
-                            }
-                        ]
-                    }
-                ],
-                response_format={"type": "json_object"},
-                max_tokens=1500,
-                temperature=0.2,
-            )
+            def parse(content: str) -> List[RequirementProposal]:
+                return self._parse_props_result(json_loads(content))
             
-            # Parse response
-            result = json.loads(response.choices[0].message.content)
+            async def run(model: str) -> List[RequirementProposal]:
+                request = self.build_request(
+                    image_url, classification, tokens, model=model
+                )
+                
+                # Call GPT-4V for props analysis, converting each item as
+                # soon as it has streamed in
+                return await self._cached_call(
+                    self._request_cache_key(request),
+                    lambda: self._call_vision(request, "props", self._parse_prop_item, parse),
+                    parse,
+                )
             
-            # Convert to proposals
-            proposals = self._parse_props_result(result)
+            proposals = await run(self.model)
+            if self.should_escalate(proposals, self.model):
+                logger.info(
+                    f"Low-confidence props from {self.model}, escalating to {ESCALATION_MODEL}",
+                    extra={"extra": {"model": self.model, "count": len(proposals)}}
+                )
+                proposals = await run(ESCALATION_MODEL)
             
             # Log proposals
             for proposal in proposals:
@@ -129,26 +190,87 @@ class PropsProposer(BaseRequirementProposer):
             return proposals
             
         except Exception as e:
-            if retry_count < self.max_retries:
-                logger.warning(
-                    f"Props proposal failed (attempt {retry_count + 1}), retrying: {e}",
-                    extra={"extra": {"retry_count": retry_count, "error": str(e)}}
-                )
-                return await self.propose(
-                    image, classification, tokens, retry_count + 1
-                )
-            else:
-                logger.error(
-                    f"Props proposal failed after {self.max_retries} retries",
-                    extra={
-                        "extra": {
-                            "max_retries": self.max_retries,
-                            "error": str(e),
-                        }
+            logger.error(
+                f"Props proposal failed after {self.max_retries} retries",
+                extra={
+                    "extra": {
+                        "max_retries": self.max_retries,
+                        "error": str(e),
                     }
-                )
-                # Return empty list instead of raising to allow workflow to continue
-                return []
+                }
+            )
+            # Return empty list instead of raising to allow workflow to continue
+            return []
+    
+    def build_request(
+        self,
+        image_url: str,
+        classification: ComponentClassification,
+        tokens: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for props analysis.
+        
+        Shared by propose() and batch submission so both send the same
+        payload.
+        
+        Args:
+            image_url: Data URL from prepare_image_for_vision_api
+            classification: Component type classification
+            tokens: Optional design tokens
+            model: Model override (defaults to self.model)
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        # Build props analysis prompt using the prompts module
+        prompt = self._build_props_prompt(classification.component_type.value, tokens)
+        
+        return {
+            "model": model or self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": image_url,
+                                "detail": self.image_detail(classification),
+                            }
+                        }
+                    ]
+                }
+            ],
+            "response_format": PROPS_RESPONSE_FORMAT,
+            "max_tokens": 600,
+            "temperature": 0,
+            "seed": image_seed(image_url),
+        }
+    
+    def _build_props_prompt(
+        self,
+        component_type: str,
+        tokens: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the props prompt, reusing cached prompt strings.
+        
+        Args:
+            component_type: The component type being analyzed
+            tokens: Optional design tokens
+            
+        Returns:
+            Props proposal prompt text
+        """
+        if not tokens:
+            return _cached_props_prompt(component_type)
+        try:
+            tokens_key = json_cache_key(tokens)
+        except TypeError:
+            # Not JSON-serializable; build without caching
+            return create_props_prompt(component_type, tokens=tokens)
+        return _cached_props_prompt(component_type, tokens_key)
     
     def _parse_props_result(self, result: Dict[str, Any]) -> List[RequirementProposal]:
         """Parse props analysis result into proposals.
@@ -158,45 +280,48 @@ class PropsProposer(BaseRequirementProposer):
             
         Returns:
             List of RequirementProposal objects
+            
+        Raises:
+            pydantic.ValidationError: If the result is malformed
         """
-        proposals = []
-        props_list = result.get("props", [])
+        parsed = _PropsResponse.model_validate(result)
+        return [self._create_prop_proposal(item) for item in parsed.props]
+    
+    def _parse_prop_item(self, prop_data: Dict[str, Any]) -> RequirementProposal:
+        """Convert a single streamed prop into a proposal.
         
-        for prop_data in props_list:
-            try:
-                name = prop_data.get("name", "unknown")
-                prop_type = prop_data.get("type", "string")
-                values = prop_data.get("values")
-                visual_cues = prop_data.get("visual_cues", [])
-                base_confidence = float(prop_data.get("confidence", 0.5))
-                
-                # Calculate adjusted confidence
-                confidence = self.calculate_confidence(
-                    base_confidence,
-                    len(visual_cues),
-                    min_cues=1,
-                    max_cues=4
-                )
-                
-                # Generate rationale
-                rationale = self.generate_rationale(
-                    name,
-                    visual_cues,
-                    source="visual analysis"
-                )
-                
-                # Create proposal
-                proposal = self.create_proposal(
-                    name=name,
-                    confidence=confidence,
-                    rationale=rationale,
-                    values=values if prop_type == "enum" else None,
-                )
-                
-                proposals.append(proposal)
-                
-            except Exception as e:
-                logger.warning(f"Failed to parse prop: {e}")
-                continue
+        Args:
+            prop_data: One entry of the "props" array
+            
+        Returns:
+            RequirementProposal object
+            
+        Raises:
+            pydantic.ValidationError: If the entry is malformed
+        """
+        return self._create_prop_proposal(_PropItem.model_validate(prop_data))
+    
+    def _create_prop_proposal(self, item: _PropItem) -> RequirementProposal:
+        """Create a proposal from a validated prop."""
+        # Calculate adjusted confidence
+        confidence = self.calculate_confidence(
+            item.confidence,
+            len(item.visual_cues),
+            min_cues=1,
+            max_cues=4
+        )
         
-        return proposals
+        # Generate rationale
+        rationale = self.generate_rationale(
+            item.name,
+            item.visual_cues,
+            source="visual analysis"
+        )
+        
+        # Create proposal
+        return self.create_proposal(
+            name=item.name,
+            confidence=confidence,
+            rationale=rationale,
+            values=item.values if item.type == "enum" else None,
+        )
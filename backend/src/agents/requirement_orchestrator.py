@@ -5,21 +5,44 @@ coordinating component classification and requirement analysis.
 """
 
 import asyncio
+import json
+import os
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from openai import AsyncOpenAI
 from PIL import Image
 
-from src.types.requirement_types import RequirementState, ComponentClassification
+from src.types.requirement_types import (
+    RequirementState,
+    ComponentClassification,
+    RequirementProposal,
+)
 from src.agents.component_classifier import ComponentClassifier
 from src.agents.props_proposer import PropsProposer
 from src.agents.events_proposer import EventsProposer
 from src.agents.states_proposer import StatesProposer
 from src.agents.accessibility_proposer import AccessibilityProposer
-from src.core.tracing import traced
+from src.agents.unified_proposer import UnifiedRequirementsProposer
+from src.services.image_processor import prepare_image_for_vision_api
+from src.services.image_text_router import VisionInput, route_image_for_vision
+from src.services.openai_client import get_openai_client
+from src.core.tracing import traced, add_trace_metadata
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Propose all categories from one vision call instead of one per proposer
+UNIFIED_PROPOSER_ENABLED = os.getenv("UNIFIED_REQUIREMENTS_PROPOSER", "false").lower() == "true"
+
+# Below this classification confidence the proposer calls are skipped; their
+# output for an unrecognized component is not worth the vision-call cost
+MIN_PROPOSER_CONFIDENCE = float(os.getenv("MIN_PROPOSER_CONFIDENCE", "0.4"))
+
+# Offline batch runs: endpoint and the (category, proposer attribute) pairs
+# submitted per component
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_PROPOSERS = (("props", "props_proposer"), ("states", "states_proposer"))
+
 
 class RequirementOrchestrator:
     """Orchestrate the requirement proposal workflow.
@@ -29,18 +52,49 @@ class RequirementOrchestrator:
     props, events, states, and accessibility.
     """
     
-    def __init__(self, openai_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+        use_unified_proposer: Optional[bool] = None,
+    ):
         """Initialize the requirement orchestrator.
         
         Args:
             openai_api_key: OpenAI API key for AI agents
+            client: Optional AsyncOpenAI client for all agents (defaults to
+                the shared pooled client, closed on app shutdown)
+            use_unified_proposer: Propose all categories in one call
+                (defaults to the UNIFIED_REQUIREMENTS_PROPOSER env var)
         """
-        self.classifier = ComponentClassifier(api_key=openai_api_key)
+        # One client for every agent so parallel proposer calls share
+        # keep-alive connections and HTTP/2 streams
+        self._openai = client or get_openai_client(openai_api_key)
+        self.classifier = ComponentClassifier(
+            api_key=openai_api_key, client=self._openai
+        )
         # Initialize all requirement proposers
-        self.props_proposer = PropsProposer(api_key=openai_api_key)
-        self.events_proposer = EventsProposer(api_key=openai_api_key)
-        self.states_proposer = StatesProposer(api_key=openai_api_key)
-        self.a11y_proposer = AccessibilityProposer(api_key=openai_api_key)
+        self.props_proposer = PropsProposer(api_key=openai_api_key, client=self._openai)
+        self.events_proposer = EventsProposer(api_key=openai_api_key, client=self._openai)
+        self.states_proposer = StatesProposer(api_key=openai_api_key, client=self._openai)
+        self.a11y_proposer = AccessibilityProposer(
+            api_key=openai_api_key, client=self._openai
+        )
+        
+        if use_unified_proposer is None:
+            use_unified_proposer = UNIFIED_PROPOSER_ENABLED
+        self.unified_proposer = (
+            UnifiedRequirementsProposer(
+                self.props_proposer,
+                self.events_proposer,
+                self.states_proposer,
+                self.a11y_proposer,
+                api_key=openai_api_key,
+                client=self._openai,
+            )
+            if use_unified_proposer
+            else None
+        )
     
     @traced(run_name="propose_requirements")
     async def propose_requirements(
@@ -53,10 +107,10 @@ class RequirementOrchestrator:
         
         This method coordinates the multi-agent workflow:
         1. Classify component type
-        2. Propose props requirements
-        3. Propose events requirements
-        4. Propose states requirements
-        5. Propose accessibility requirements
+        2-5. Propose props, events, states and accessibility requirements
+           concurrently (a failed proposer is logged and skipped); skipped
+           entirely when classification confidence is below
+           MIN_PROPOSER_CONFIDENCE
         
         Args:
             image: Component screenshot
@@ -76,10 +130,22 @@ class RequirementOrchestrator:
         try:
             logger.info("Starting requirement proposal workflow")
             
+            # Encode the screenshot once and share it across agents. Chat
+            # Completions only accepts images as data or http(s) URLs (Files
+            # API file_ids are a Responses API feature), so the compact WebP
+            # data URL is reused instead of uploading the image. PIL encoding
+            # and OCR are CPU-bound, so they run off the event loop
+            image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
+            # Text-heavy screenshots go to the classifier and a11y agents as
+            # OCR text + thumbnail; the other proposers reuse the full image
+            vision_input = await asyncio.to_thread(
+                route_image_for_vision, image, image_url
+            )
+            
             # Step 1: Classify component type
             logger.info("Step 1: Classifying component type")
             classification = await self.classifier.classify_component(
-                image, figma_data
+                image, figma_data, vision_input=vision_input
             )
             state.classification = classification
             
@@ -93,49 +159,27 @@ class RequirementOrchestrator:
                 }
             )
             
-            # Step 2: Propose props requirements
-            logger.info("Step 2: Proposing props requirements")
-            if self.props_proposer:
-                state.props_proposals = await self.props_proposer.propose(
-                    image, state.classification, tokens
-                )
-                logger.info(
-                    f"Props proposals complete: {len(state.props_proposals)} proposals",
-                    extra={"extra": {"count": len(state.props_proposals)}}
-                )
-            
-            # Step 3: Propose events requirements
-            logger.info("Step 3: Proposing events requirements")
-            if self.events_proposer:
-                state.events_proposals = await self.events_proposer.propose(
-                    image, state.classification, tokens
-                )
-                logger.info(
-                    f"Events proposals complete: {len(state.events_proposals)} proposals",
-                    extra={"extra": {"count": len(state.events_proposals)}}
-                )
-            
-            # Step 4: Propose states requirements
-            logger.info("Step 4: Proposing states requirements")
-            if self.states_proposer:
-                state.states_proposals = await self.states_proposer.propose(
-                    image, state.classification, tokens
-                )
-                logger.info(
-                    f"States proposals complete: {len(state.states_proposals)} proposals",
-                    extra={"extra": {"count": len(state.states_proposals)}}
+            if classification.confidence < MIN_PROPOSER_CONFIDENCE:
+                logger.warning(
+                    "Classification confidence too low, skipping requirement proposers",
+                    extra={
+                        "extra": {
+                            "confidence": classification.confidence,
+                            "min_confidence": MIN_PROPOSER_CONFIDENCE,
+                        }
+                    }
                 )
+                add_trace_metadata({
+                    "proposers_skipped": True,
+                    "classification_confidence": classification.confidence,
+                })
+                state.completed_at = datetime.now(timezone.utc).isoformat()
+                return state
             
-            # Step 5: Propose accessibility requirements
-            logger.info("Step 5: Proposing accessibility requirements")
-            if self.a11y_proposer:
-                state.accessibility_proposals = await self.a11y_proposer.propose(
-                    image, state.classification, tokens
-                )
-                logger.info(
-                    f"Accessibility proposals complete: {len(state.accessibility_proposals)} proposals",
-                    extra={"extra": {"count": len(state.accessibility_proposals)}}
-                )
+            # Steps 2-5: Propose requirements for every category
+            await self._propose_all(
+                state, image, classification, tokens, image_url, vision_input
+            )
             
             # Mark completion
             state.completed_at = datetime.now(timezone.utc).isoformat()
@@ -164,6 +208,71 @@ class RequirementOrchestrator:
             state.completed_at = datetime.now(timezone.utc).isoformat()
             raise
     
+    async def _propose_all(
+        self,
+        state: RequirementState,
+        image: Image.Image,
+        classification: ComponentClassification,
+        tokens: Optional[Dict[str, Any]],
+        image_url: str,
+        vision_input: VisionInput,
+    ) -> None:
+        """Fill the state's proposals for every requirement category.
+        
+        Uses the unified single-call proposer when enabled, falling back to
+        the per-category proposers if it fails.
+        """
+        if self.unified_proposer is not None:
+            logger.info("Steps 2-5: Proposing requirements in one unified call")
+            try:
+                results = await self.unified_proposer.propose(
+                    image, classification, tokens, image_url=image_url
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Unified proposal failed, falling back to per-category proposers: {e}"
+                )
+            else:
+                for field, proposals in results.items():
+                    setattr(state, field, proposals)
+                return
+        
+        # Steps 2-5: Proposers make independent vision calls, so run them
+        # concurrently; a failing proposer leaves its category empty
+        # instead of failing the whole workflow
+        logger.info("Steps 2-5: Proposing requirements in parallel")
+        proposers = [
+            ("props_proposals", self.props_proposer, {"image_url": image_url}),
+            ("events_proposals", self.events_proposer, {"image_url": image_url}),
+            ("states_proposals", self.states_proposer, {"image_url": image_url}),
+            (
+                "accessibility_proposals",
+                self.a11y_proposer,
+                {"vision_input": vision_input},
+            ),
+        ]
+        proposers = [entry for entry in proposers if entry[1] is not None]
+        results = await asyncio.gather(
+            *(
+                proposer.propose(image, classification, tokens, **kwargs)
+                for _, proposer, kwargs in proposers
+            ),
+            return_exceptions=True,
+        )
+        
+        for (field, _, _), result in zip(proposers, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Proposer for {field} failed: {result}",
+                    extra={"extra": {"category": field, "error": str(result)}}
+                )
+                continue
+            setattr(state, field, result)
+            logger.info(
+                f"{field} complete: {len(result)} proposals",
+                extra={"extra": {"category": field, "count": len(result)}}
+            )
+    
     async def propose_requirements_parallel(
         self,
         image: Image.Image,
@@ -172,9 +281,8 @@ class RequirementOrchestrator:
     ) -> RequirementState:
         """Run requirement proposal with parallel execution.
         
-        This variant runs all requirement proposers in parallel after
-        classification to minimize latency. This is the recommended
-        approach for production deployments targeting p50 latency ≤15s.
+        Kept for existing callers; propose_requirements already runs all
+        requirement proposers in parallel after classification.
         
         Args:
             image: Component screenshot as PIL Image
@@ -184,50 +292,121 @@ class RequirementOrchestrator:
         Returns:
             RequirementState with classification and all proposals
         """
-        # Initialize state
-        state = RequirementState(
-            figma_data=figma_data,
-            tokens=tokens,
-            started_at=datetime.now(timezone.utc).isoformat()
-        )
+        return await self.propose_requirements(image, figma_data, tokens)
+    
+    async def propose_requirements_batch(
+        self,
+        items: List[Tuple[Image.Image, ComponentClassification, Optional[Dict[str, Any]]]],
+    ) -> str:
+        """Submit props and states proposals for many components as one batch.
         
-        try:
-            # Step 1: Classify component type (sequential)
-            classification = await self.classifier.classify_component(
-                image, figma_data
-            )
-            state.classification = classification
-            
-            # Steps 2-5: Run proposers in parallel for better performance
-            results = await asyncio.gather(
-                self.props_proposer.propose(image, classification, tokens),
-                self.events_proposer.propose(image, classification, tokens),
-                self.states_proposer.propose(image, classification, tokens),
-                self.a11y_proposer.propose(image, classification, tokens),
-            )
-            state.props_proposals = results[0]
-            state.events_proposals = results[1]
-            state.states_proposals = results[2]
-            state.accessibility_proposals = results[3]
+        For offline or bulk runs (evaluation sweeps, re-proposing a corpus)
+        where results are not needed interactively. Requests go through the
+        OpenAI Batch API at a discount and against a separate rate limit;
+        use collect_batch to parse the results once the batch completes.
+        
+        Args:
+            items: (image, classification, tokens) for each component
             
-            logger.info(
-                f"Parallel requirement proposal complete",
-                extra={
-                    "extra": {
-                        "props_count": len(state.props_proposals),
-                        "events_count": len(state.events_proposals),
-                        "states_count": len(state.states_proposals),
-                        "accessibility_count": len(state.accessibility_proposals),
-                        "total_proposals": len(state.get_all_proposals()),
-                    }
+        Returns:
+            Batch ID to pass to collect_batch
+        """
+        lines = []
+        for idx, (image, classification, tokens) in enumerate(items):
+            image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
+            for category, proposer in BATCH_PROPOSERS:
+                body = getattr(self, proposer).build_request(
+                    image_url, classification, tokens
+                )
+                lines.append(json.dumps({
+                    "custom_id": f"{idx}:{category}",
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": body,
+                }))
+        
+        batch_file = await self._openai.files.create(
+            file=("requirements_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = await self._openai.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        
+        logger.info(
+            f"Submitted requirement batch {batch.id}",
+            extra={
+                "extra": {
+                    "batch_id": batch.id,
+                    "components": len(items),
+                    "requests": len(lines),
                 }
-            )
+            }
+        )
+        
+        return batch.id
+    
+    async def collect_batch(
+        self,
+        batch_id: str,
+        classifications: List[ComponentClassification],
+    ) -> List[Dict[str, List[RequirementProposal]]]:
+        """Parse the results of a completed propose_requirements_batch run.
+        
+        Args:
+            batch_id: ID returned by propose_requirements_batch
+            classifications: Classifications in the order they were submitted
             
-            state.completed_at = datetime.now(timezone.utc).isoformat()
-            return state
+        Returns:
+            One dict per submitted component with props_proposals and
+            states_proposals; failed requests leave an empty list
             
-        except Exception as e:
-            logger.error(f"Parallel requirement proposal failed: {e}")
-            state.error = str(e)
-            state.completed_at = datetime.now(timezone.utc).isoformat()
-            raise
+        Raises:
+            ValueError: If the batch has not completed
+        """
+        batch = await self._openai.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            raise ValueError(f"Batch {batch_id} is not completed (status: {batch.status})")
+        
+        results = [
+            {"props_proposals": [], "states_proposals": []}
+            for _ in classifications
+        ]
+        if not batch.output_file_id:
+            return results
+        
+        content = await self._openai.files.content(batch.output_file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            idx, category = record["custom_id"].split(":", 1)
+            idx = int(idx)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.warning(
+                    f"Batch request {record['custom_id']} failed",
+                    extra={"extra": {"batch_id": batch_id, "error": record.get("error")}}
+                )
+                continue
+            
+            try:
+                message = response["body"]["choices"][0]["message"]["content"]
+                result = json.loads(message)
+                if category == "props":
+                    proposals = self.props_proposer._parse_props_result(result)
+                else:
+                    proposals = self.states_proposer._parse_states_result(
+                        result, classifications[idx]
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to parse batch result {record['custom_id']}: {e}",
+                    extra={"extra": {"batch_id": batch_id, "error": str(e)}}
+                )
+                continue
+            results[idx][f"{category}_proposals"] = proposals
+        
+        return results
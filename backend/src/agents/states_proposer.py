@@ -4,26 +4,93 @@ This module analyzes components to propose state and variant requirements
 such as hover, focus, disabled, and loading states.
 """
 
-import json
+import asyncio
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from openai import AsyncOpenAI
 from PIL import Image
+from pydantic import BaseModel, ConfigDict, Field
 
-from .base_proposer import BaseRequirementProposer
+from .base_proposer import (
+    BaseRequirementProposer,
+    DEFAULT_PROPOSER_MODEL,
+    ESCALATION_MODEL,
+)
 from src.types.requirement_types import (
     RequirementProposal,
     RequirementCategory,
     ComponentClassification,
 )
 from src.services.image_processor import prepare_image_for_vision_api
+from src.cache.vision_cache import image_seed
 from src.prompts.states_proposer import create_states_prompt
+from src.core.serialization import json_loads
 from src.core.tracing import traced
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class StateRequirementSchema(BaseModel):
+    """One state requirement as returned by GPT-4V."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    name: str
+    description: str
+    visual_cues: List[str] = Field(max_length=4)
+    confidence: float
+
+
+class StatesResponseSchema(BaseModel):
+    """Structured output schema for states proposals."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    states: List[StateRequirementSchema] = Field(max_length=6)
+
+
+class _StateItem(BaseModel):
+    """One state as parsed from a response.
+    
+    Lenient counterpart of StateRequirementSchema for responses produced
+    without the strict schema (unified proposer, cached text).
+    """
+    
+    name: str = "unknown"
+    description: str = ""
+    visual_cues: List[str] = []
+    confidence: float = 0.5
+
+
+class _StatesResponse(BaseModel):
+    """States array as parsed from a response."""
+    
+    states: List[_StateItem] = []
+
+
+# Strict structured output bounds the response size and guarantees
+# parseable JSON
+STATES_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "states",
+        "schema": StatesResponseSchema.model_json_schema(),
+        "strict": True,
+    },
+}
+
+
+@lru_cache(maxsize=128)
+def _cached_states_prompt(component_type: str) -> str:
+    """Build the states prompt once per component type."""
+    return create_states_prompt(
+        component_type,
+        figma_data=None,  # Will be passed from orchestrator in future
+    )
+
+
 class StatesProposer(BaseRequirementProposer):
     """Propose state/variant requirements from component analysis.
     
@@ -34,20 +101,21 @@ class StatesProposer(BaseRequirementProposer):
     - Loading states (spinner/skeleton)
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ):
         """Initialize the states proposer.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            client: Optional AsyncOpenAI client (defaults to the shared client)
         """
-        super().__init__(RequirementCategory.STATES)
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OpenAI API key is required")
-        
-        self.client = AsyncOpenAI(api_key=self.api_key)
-        # gpt-4o has vision capabilities and is the recommended model
-        self.model = "gpt-4o"
+        super().__init__(RequirementCategory.STATES, api_key=api_key, client=client)
+        # gpt-4o-mini handles single-screenshot states analysis; low-confidence
+        # results are re-run on ESCALATION_MODEL
+        self.model = os.getenv("REQUIREMENT_PROPOSER_MODEL", DEFAULT_PROPOSER_MODEL)
     
     @traced(run_name="propose_states")
     async def propose(
@@ -55,7 +123,7 @@ class StatesProposer(BaseRequirementProposer):
         image: Image.Image,
         classification: ComponentClassification,
         tokens: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0,
+        image_url: Optional[str] = None,
     ) -> List[RequirementProposal]:
         """Propose state/variant requirements for the component.
         
@@ -63,7 +131,8 @@ class StatesProposer(BaseRequirementProposer):
             image: Component screenshot
             classification: Component type classification
             tokens: Optional design tokens
-            retry_count: Current retry attempt (for internal use)
+            image_url: Optional data URL already produced by
+                prepare_image_for_vision_api, to avoid re-encoding the image
             
         Returns:
             List of proposed state/variant requirements
@@ -74,48 +143,38 @@ class StatesProposer(BaseRequirementProposer):
                 "extra": {
                     "component_type": classification.component_type.value,
                     "has_tokens": tokens is not None,
-                    "retry_count": retry_count,
                 }
             }
         )
         
         try:
-            # Prepare image
-            image_url = prepare_image_for_vision_api(image)
-
-            # Build states analysis prompt using the prompts module
-            prompt = create_states_prompt(
-                classification.component_type.value,
-                figma_data=None,  # Will be passed from orchestrator in future
-            )
+            # Prepare image (reuse caller's encoding if given)
+            if image_url is None:
+                image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
 
-            # Call GPT-4V for states analysis
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url
-                                }
-                            }
-                        ]
-                    }
-                ],
-                response_format={"type": "json_object"},
-                max_tokens=1500,
-                temperature=0.2,
-            )
+            def parse(content: str) -> List[RequirementProposal]:
+                return self._parse_states_result(json_loads(content), classification)
             
-            # Parse response
-            result = json.loads(response.choices[0].message.content)
+            async def run(model: str) -> List[RequirementProposal]:
+                request = self.build_request(
+                    image_url, classification, tokens, model=model
+                )
+                
+                # Call GPT-4V for states analysis, converting each item as
+                # soon as it has streamed in
+                return await self._cached_call(
+                    self._request_cache_key(request),
+                    lambda: self._call_vision(request, "states", self._parse_state_item, parse),
+                    parse,
+                )
             
-            # Convert to proposals
-            proposals = self._parse_states_result(result, classification)
+            proposals = await run(self.model)
+            if self.should_escalate(proposals, self.model):
+                logger.info(
+                    f"Low-confidence states from {self.model}, escalating to {ESCALATION_MODEL}",
+                    extra={"extra": {"model": self.model, "count": len(proposals)}}
+                )
+                proposals = await run(ESCALATION_MODEL)
             
             # Log proposals
             for proposal in proposals:
@@ -129,26 +188,64 @@ class StatesProposer(BaseRequirementProposer):
             return proposals
             
         except Exception as e:
-            if retry_count < self.max_retries:
-                logger.warning(
-                    f"States proposal failed (attempt {retry_count + 1}), retrying: {e}",
-                    extra={"extra": {"retry_count": retry_count, "error": str(e)}}
-                )
-                return await self.propose(
-                    image, classification, tokens, retry_count + 1
-                )
-            else:
-                logger.error(
-                    f"States proposal failed after {self.max_retries} retries",
-                    extra={
-                        "extra": {
-                            "max_retries": self.max_retries,
-                            "error": str(e),
-                        }
+            logger.error(
+                f"States proposal failed after {self.max_retries} retries",
+                extra={
+                    "extra": {
+                        "max_retries": self.max_retries,
+                        "error": str(e),
                     }
-                )
-                # Return empty list instead of raising to allow workflow to continue
-                return []
+                }
+            )
+            # Return empty list instead of raising to allow workflow to continue
+            return []
+    
+    def build_request(
+        self,
+        image_url: str,
+        classification: ComponentClassification,
+        tokens: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for states analysis.
+        
+        Shared by propose() and batch submission so both send the same
+        payload.
+        
+        Args:
+            image_url: Data URL from prepare_image_for_vision_api
+            classification: Component type classification
+            tokens: Optional design tokens
+            model: Model override (defaults to self.model)
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        # Build states analysis prompt using the prompts module
+        prompt = _cached_states_prompt(classification.component_type.value)
+        
+        return {
+            "model": model or self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": image_url,
+                                "detail": self.image_detail(classification),
+                            }
+                        }
+                    ]
+                }
+            ],
+            "response_format": STATES_RESPONSE_FORMAT,
+            "max_tokens": 600,
+            "temperature": 0,
+            "seed": image_seed(image_url),
+        }
     
     def _parse_states_result(
         self,
@@ -163,48 +260,52 @@ class StatesProposer(BaseRequirementProposer):
             
         Returns:
             List of RequirementProposal objects
+            
+        Raises:
+            pydantic.ValidationError: If the result is malformed
         """
-        proposals = []
-        states_list = result.get("states", [])
+        parsed = _StatesResponse.model_validate(result)
+        return [self._create_state_proposal(item) for item in parsed.states]
+    
+    def _parse_state_item(self, state_data: Dict[str, Any]) -> RequirementProposal:
+        """Convert a single streamed state into a proposal.
         
-        for state_data in states_list:
-            try:
-                name = state_data.get("name", "unknown")
-                description = state_data.get("description", "")
-                visual_cues = state_data.get("visual_cues", [])
-                base_confidence = float(state_data.get("confidence", 0.5))
-                
-                # Calculate adjusted confidence
-                confidence = self.calculate_confidence(
-                    base_confidence,
-                    len(visual_cues),
-                    min_cues=1,
-                    max_cues=4
-                )
-                
-                # Generate rationale
-                rationale = self.generate_rationale(
-                    f"{name} state",
-                    visual_cues,
-                    source="visual state analysis"
-                )
-                
-                # Add description if provided
-                if description and description not in rationale:
-                    rationale = f"{description}. {rationale}"
-                
-                # Create proposal
-                proposal = self.create_proposal(
-                    name=name,
-                    confidence=confidence,
-                    rationale=rationale,
-                    description=description,
-                )
-                
-                proposals.append(proposal)
-                
-            except Exception as e:
-                logger.warning(f"Failed to parse state: {e}")
-                continue
+        Args:
+            state_data: One entry of the "states" array
+            
+        Returns:
+            RequirementProposal object
+            
+        Raises:
+            pydantic.ValidationError: If the entry is malformed
+        """
+        return self._create_state_proposal(_StateItem.model_validate(state_data))
+    
+    def _create_state_proposal(self, item: _StateItem) -> RequirementProposal:
+        """Create a proposal from a validated state."""
+        # Calculate adjusted confidence
+        confidence = self.calculate_confidence(
+            item.confidence,
+            len(item.visual_cues),
+            min_cues=1,
+            max_cues=4
+        )
         
-        return proposals
+        # Generate rationale
+        rationale = self.generate_rationale(
+            f"{item.name} state",
+            item.visual_cues,
+            source="visual state analysis"
+        )
+        
+        # Add description if provided
+        if item.description and item.description not in rationale:
+            rationale = f"{item.description}. {rationale}"
+        
+        # Create proposal
+        return self.create_proposal(
+            name=item.name,
+            confidence=confidence,
+            rationale=rationale,
+            description=item.description,
+        )
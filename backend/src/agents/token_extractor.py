@@ -3,11 +3,11 @@
 import json
 import os
 from typing import Dict, Any, Optional
-from openai import AsyncOpenAI
 from PIL import Image
 
 from src.prompts.token_extraction import create_extraction_prompt
 from src.services.image_processor import prepare_image_for_vision_api
+from src.services.openai_client import get_openai_client
 from src.core.confidence import process_tokens_with_confidence
 from src.core.logging import get_logger
 from src.core.tracing import traced
@@ -33,7 +33,7 @@ class TokenExtractor:
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.max_retries = 3
     
     @traced(run_name="extract_tokens")
@@ -0,0 +1,202 @@
+"""Unified requirement proposer.
+
+This module proposes props, events, states and accessibility requirements
+from a single GPT-4V call instead of one call per category, reusing each
+category proposer's result parser.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+from openai import AsyncOpenAI
+from PIL import Image
+
+from .props_proposer import PropsProposer
+from .events_proposer import EventsProposer
+from .states_proposer import StatesProposer
+from .accessibility_proposer import AccessibilityProposer
+from .base_proposer import call_with_retry
+from src.types.requirement_types import (
+    RequirementProposal,
+    ComponentClassification,
+)
+from src.services.image_processor import prepare_image_for_vision_api
+from src.services.openai_client import get_openai_client
+from src.cache.vision_cache import image_seed
+from src.prompts.unified_proposer import create_unified_prompt
+from src.core.serialization import json_loads
+from src.core.tracing import traced
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class UnifiedRequirementsProposerError(Exception):
+    """Exception raised when the unified proposal call fails."""
+    pass
+
+
+class UnifiedRequirementsProposer:
+    """Propose all requirement categories from one vision call.
+
+    The image is sent once with a prompt combining the four category
+    rubrics; each array in the response is parsed by the matching
+    category proposer so proposals are identical in shape to the
+    per-category path.
+    """
+
+    def __init__(
+        self,
+        props_proposer: PropsProposer,
+        events_proposer: EventsProposer,
+        states_proposer: StatesProposer,
+        a11y_proposer: AccessibilityProposer,
+        api_key: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ):
+        """Initialize the unified proposer.
+
+        Args:
+            props_proposer: Parses the "props" array
+            events_proposer: Parses the "events" array
+            states_proposer: Parses the "states" array
+            a11y_proposer: Parses the "accessibility" array
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            client: Optional AsyncOpenAI client (defaults to the shared client)
+        """
+        self.props_proposer = props_proposer
+        self.events_proposer = events_proposer
+        self.states_proposer = states_proposer
+        self.a11y_proposer = a11y_proposer
+
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("OpenAI API key is required")
+
+        self.client = client or get_openai_client(self.api_key)
+        self.max_retries = 3
+        self.retry_backoff = 0.5  # Seconds; doubled on each retry
+        # gpt-4o has vision capabilities and is the recommended model
+        self.model = "gpt-4o"
+
+    @traced(run_name="propose_unified")
+    async def propose(
+        self,
+        image: Image.Image,
+        classification: ComponentClassification,
+        tokens: Optional[Dict[str, Any]] = None,
+        image_url: Optional[str] = None,
+    ) -> Dict[str, List[RequirementProposal]]:
+        """Propose requirements for every category in one call.
+
+        Args:
+            image: Component screenshot
+            classification: Component type classification
+            tokens: Optional design tokens
+            image_url: Optional data URL already produced by
+                prepare_image_for_vision_api, to avoid re-encoding the image
+
+        Returns:
+            Proposals keyed by RequirementState field name (props_proposals,
+            events_proposals, states_proposals, accessibility_proposals)
+
+        Raises:
+            UnifiedRequirementsProposerError: If the call fails after retries
+        """
+        logger.info(
+            f"Proposing all requirements for {classification.component_type.value}",
+            extra={
+                "extra": {
+                    "component_type": classification.component_type.value,
+                    "has_tokens": tokens is not None,
+                }
+            }
+        )
+
+        try:
+            if image_url is None:
+                image_url = await asyncio.to_thread(prepare_image_for_vision_api, image)
+
+            prompt = create_unified_prompt(
+                classification.component_type.value,
+                figma_data=None,  # Will be passed from orchestrator in future
+                tokens=tokens,
+            )
+        except Exception as e:
+            raise UnifiedRequirementsProposerError(
+                f"Failed to prepare unified proposal: {e}"
+            ) from e
+
+        async def attempt() -> Dict[str, List[RequirementProposal]]:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": prompt},
+                            {
+                                "type": "image_url",
+                                "image_url": {"url": image_url},
+                            }
+                        ]
+                    }
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=3000,
+                temperature=0,
+                seed=image_seed(image_url),
+            )
+
+            result = json_loads(response.choices[0].message.content)
+
+            return {
+                "props_proposals": self.props_proposer._parse_props_result(result),
+                "events_proposals": self.events_proposer._parse_events_result(
+                    result, classification
+                ),
+                "states_proposals": self.states_proposer._parse_states_result(
+                    result, classification
+                ),
+                "accessibility_proposals": self.a11y_proposer._parse_accessibility_result(
+                    result, classification
+                ),
+            }
+
+        try:
+            proposals = await call_with_retry(
+                attempt, self.max_retries, self.retry_backoff, "Unified proposal"
+            )
+        except Exception as e:
+            logger.error(
+                f"Unified proposal failed after {self.max_retries} retries",
+                extra={
+                    "extra": {
+                        "max_retries": self.max_retries,
+                        "error": str(e),
+                    }
+                }
+            )
+            raise UnifiedRequirementsProposerError(
+                f"Failed to propose requirements: {e}"
+            ) from e
+
+        for proposer, field in (
+            (self.props_proposer, "props_proposals"),
+            (self.events_proposer, "events_proposals"),
+            (self.states_proposer, "states_proposals"),
+            (self.a11y_proposer, "accessibility_proposals"),
+        ):
+            for proposal in proposals[field]:
+                proposer.log_proposal(proposal)
+
+        logger.info(
+            "Unified requirement proposal complete",
+            extra={
+                "extra": {
+                    field: len(items) for field, items in proposals.items()
+                }
+            }
+        )
+
+        return proposals
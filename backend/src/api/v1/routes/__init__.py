@@ -1,15 +1,35 @@
-from .tokens import router as tokens_router
-from .figma import router as figma_router
-from .requirements import router as requirements_router
-from .retrieval import router as retrieval_router
-from .generation import router as generation_router
-from .evaluation import router as evaluation_router
-
-__all__ = [
-    "tokens_router",
-    "figma_router",
-    "requirements_router",
-    "retrieval_router",
-    "generation_router",
-    "evaluation_router",
-]
+"""API v1 routers.
+
+This package is only imported as ``src.api.v1.routes`` and its routers use
+relative imports, so each route module is loaded (and its router built)
+exactly once.
+
+Routers are resolved lazily (PEP 562): importing the package does not pull
+in the route modules and their heavy dependencies (OpenAI agents, PIL,
+tracing) until a ``*_router`` attribute is first accessed.
+"""
+
+from importlib import import_module
+
+# Exported router name -> route submodule defining ``router``
+_ROUTER_MODULES = {
+    "tokens_router": "tokens",
+    "figma_router": "figma",
+    "requirements_router": "requirements",
+    "retrieval_router": "retrieval",
+    "generation_router": "generation",
+    "evaluation_router": "evaluation",
+}
+
+__all__ = list(_ROUTER_MODULES)
+
+
+def __getattr__(name: str):
+    """Import a route module on first access to its router."""
+    module_name = _ROUTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = import_module(f".{module_name}", __name__).router
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = router
+    return router
@@ -9,26 +9,125 @@ Endpoints:
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+import asyncio
 import os
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 from ....evaluation.e2e_evaluator import E2EEvaluator
 from ....evaluation.golden_dataset import GoldenDataset
 from ....evaluation.retrieval_queries import TEST_QUERIES, get_query_statistics
-from ....evaluation.metrics import RetrievalMetrics
 from ....services.retrieval_service import RetrievalService
 from ....core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Endpoints keep their return annotations and the default response class so
+# FastAPI serializes the large payloads straight to JSON bytes via Pydantic;
+# setting response_class (e.g. ORJSONResponse) would opt out of that path
 router = APIRouter(prefix="/evaluation", tags=["evaluation"])
 
+# Maximum retrieval-only queries in flight at once
+RETRIEVAL_CONCURRENCY = 10
+
+# TEST_QUERIES is static, so its category counts never change
+_QUERY_STATS = get_query_statistics()
+
+# Query categories reported in the retrieval-only per-category breakdown
+RETRIEVAL_CATEGORIES = ('keyword', 'semantic', 'mixed')
+
+# Seconds a successful response is reused (bypass with ?fresh=true)
+METRICS_CACHE_TTL = 300.0
+STATUS_CACHE_TTL = 5.0
+
+
+class _ResponseCache:
+    """Last successful response of an endpoint, reused until it expires.
+
+    The lock makes concurrent requests for an expired entry wait for one
+    computation instead of each running it. Failures are not cached.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._value: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(
+        self,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        fresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Return the cached response, computing it if missing or expired."""
+        async with self._lock:
+            if not fresh and self._value is not None and time.monotonic() < self._expires_at:
+                return self._value
+            value = await compute()
+            self._value = value
+            self._expires_at = time.monotonic() + self.ttl
+            return value
+
+    def clear(self) -> None:
+        """Drop the cached response."""
+        self._value = None
+        self._expires_at = 0.0
+
+
+_metrics_cache = _ResponseCache(METRICS_CACHE_TTL)
+_status_cache = _ResponseCache(STATUS_CACHE_TTL)
+
+
+@lru_cache(maxsize=1)
+def _get_dataset(
+    dataset_cls: Type[GoldenDataset],
+) -> Tuple[GoldenDataset, int, Dict[str, Any]]:
+    """
+    Load the golden dataset and its summary once.
+
+    Keyed on the loader class so a replaced loader is not served a stale
+    dataset; load failures raise and are retried on the next call.
+
+    Args:
+        dataset_cls: Golden dataset loader class
+
+    Returns:
+        Tuple of (dataset, size, statistics)
+    """
+    dataset = dataset_cls()
+    return dataset, len(dataset), dataset.get_statistics()
+
+
+@lru_cache(maxsize=1)
+def _get_retrieval_service(
+    service_cls: Type[RetrievalService],
+) -> RetrievalService:
+    """
+    Build the retrieval-only evaluation service once.
+
+    Keyed on the service class, like _get_dataset, so a replaced class gets
+    its own instance.
+
+    Args:
+        service_cls: Retrieval service class
+
+    Returns:
+        Retrieval service over the mock pattern library
+    """
+    # TODO: Load real patterns from database or pattern library
+    return service_cls(patterns=_create_mock_patterns())
+
 
 @router.get("/metrics")
-async def get_evaluation_metrics() -> Dict[str, Any]:
+async def get_evaluation_metrics(
+    fresh: bool = False, verbose: bool = False
+) -> Dict[str, Any]:
     """
     Run E2E evaluation and return comprehensive metrics.
 
@@ -43,6 +142,13 @@ async def get_evaluation_metrics() -> Dict[str, Any]:
     2. Retrieval-only evaluation on 22 test queries
     3. Per-category breakdown (keyword, semantic, mixed)
 
+    The last successful result is reused for METRICS_CACHE_TTL seconds.
+
+    Args:
+        fresh: Re-run the evaluation even if a cached result is available
+        verbose: Return retrieval query_results as one object per query
+            instead of parallel per-field arrays
+
     Returns:
         JSON with overall metrics and per-screenshot results
 
@@ -51,7 +157,6 @@ async def get_evaluation_metrics() -> Dict[str, Any]:
     """
     logger.info("Received request for evaluation metrics")
 
-    # Check for API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         logger.error("OPENAI_API_KEY not configured")
@@ -60,125 +165,69 @@ async def get_evaluation_metrics() -> Dict[str, Any]:
             detail="OPENAI_API_KEY not configured. Set the environment variable to run evaluation."
         )
 
-    try:
-        # ===== E2E Evaluation =====
-        logger.info("Running E2E evaluation...")
-        evaluator = E2EEvaluator(api_key=api_key)
-        e2e_results = await evaluator.evaluate_all()
+    results = await _metrics_cache.get(lambda: _evaluate(api_key), fresh=fresh)
+    return results if verbose else _with_columnar_query_results(results)
 
-        logger.info(
-            f"E2E evaluation complete. "
-            f"Success rate: {e2e_results['overall']['pipeline_success_rate']:.1%}"
-        )
 
-        # ===== Retrieval-Only Evaluation =====
-        logger.info("Running retrieval-only evaluation...")
+def _with_columnar_query_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return results with retrieval query_results as parallel arrays.
 
-        # Create mock patterns for retrieval testing
-        # TODO: Load real patterns from database or pattern library
-        mock_patterns = _create_mock_patterns()
-        retrieval_service = RetrievalService(patterns=mock_patterns)
-        retrieval_results = []
+    One array per field serializes faster and is smaller on the wire than
+    a list of per-query objects. The cached results are not modified.
 
-        for query_data in TEST_QUERIES:
-            query = query_data['query']
-            expected = query_data['expected_pattern']
-            category = query_data['category']
+    Args:
+        results: Combined evaluation results
 
-            # Run retrieval
-            results = await retrieval_service.search(
-                requirements={'description': query},
-                top_k=5
-            )
+    Returns:
+        Shallow copy of results with columnar query_results
+    """
+    retrieval_only = results.get('retrieval_only')
+    if not retrieval_only or 'query_results' not in retrieval_only:
+        return results
+
+    query_results = retrieval_only['query_results']
+    columns = {
+        'queries': [r['query'] for r in query_results],
+        'expected': [r['expected'] for r in query_results],
+        'retrieved': [r['retrieved'] for r in query_results],
+        'correct': [r['correct'] for r in query_results],
+        'ranks': [r['rank'] for r in query_results],
+        'confidence': [r['confidence'] for r in query_results],
+        'categories': [r['category'] for r in query_results],
+    }
+    return {
+        **results,
+        'retrieval_only': {**retrieval_only, 'query_results': columns},
+    }
 
-            # Get top result
-            if results and len(results) > 0:
-                retrieved = results[0].get('pattern_id', '')
-                confidence = results[0].get('score', 0.0)
-            else:
-                retrieved = ''
-                confidence = 0.0
-
-            correct = retrieved == expected
-
-            # Find rank of correct pattern
-            rank = 999
-            for i, result in enumerate(results):
-                if result.get('pattern_id') == expected:
-                    rank = i + 1
-                    break
-
-            retrieval_results.append({
-                'query': query,
-                'expected': expected,
-                'retrieved': retrieved,
-                'correct': correct,
-                'rank': rank,
-                'confidence': confidence,
-                'category': category,
-            })
-
-        # Calculate retrieval metrics
-        from ....evaluation.types import RetrievalResult
-
-        retrieval_result_objects = [
-            RetrievalResult(
-                screenshot_id=r['query'][:20],  # Truncate for ID
-                expected_pattern_id=r['expected'],
-                retrieved_pattern_id=r['retrieved'],
-                correct=r['correct'],
-                rank=r['rank'],
-                confidence=r['confidence']
-            )
-            for r in retrieval_results
-        ]
-
-        # Overall retrieval metrics
-        overall_mrr = RetrievalMetrics.mean_reciprocal_rank(retrieval_result_objects)
-        overall_hit_at_3 = RetrievalMetrics.hit_at_k(retrieval_result_objects, k=3)
-        overall_precision_at_1 = RetrievalMetrics.precision_at_k(retrieval_result_objects, k=1)
-
-        # Per-category metrics
-        def calculate_category_metrics(category: str) -> Dict[str, float]:
-            """Calculate metrics for a specific category."""
-            category_results = [
-                RetrievalResult(
-                    screenshot_id=r['query'][:20],
-                    expected_pattern_id=r['expected'],
-                    retrieved_pattern_id=r['retrieved'],
-                    correct=r['correct'],
-                    rank=r['rank'],
-                    confidence=r['confidence']
-                )
-                for r in retrieval_results
-                if r['category'] == category
-            ]
-
-            if not category_results:
-                return {'mrr': 0.0, 'hit_at_3': 0.0, 'precision_at_1': 0.0}
 
-            return {
-                'mrr': RetrievalMetrics.mean_reciprocal_rank(category_results),
-                'hit_at_3': RetrievalMetrics.hit_at_k(category_results, k=3),
-                'precision_at_1': RetrievalMetrics.precision_at_k(category_results, k=1),
-            }
+async def _evaluate(api_key: str) -> Dict[str, Any]:
+    """
+    Run the E2E and retrieval-only evaluations.
 
-        retrieval_only_metrics = {
-            'mrr': overall_mrr,
-            'hit_at_3': overall_hit_at_3,
-            'precision_at_1': overall_precision_at_1,
-            'test_queries': len(TEST_QUERIES),
-            'per_category': {
-                'keyword': calculate_category_metrics('keyword'),
-                'semantic': calculate_category_metrics('semantic'),
-                'mixed': calculate_category_metrics('mixed'),
-            },
-            'query_results': retrieval_results,
-        }
+    Args:
+        api_key: OpenAI API key for the E2E evaluator
+
+    Returns:
+        E2E results combined with retrieval-only metrics
+
+    Raises:
+        HTTPException: If evaluation fails
+    """
+    try:
+        # E2E and retrieval-only evaluations share no data, so run them
+        # concurrently
+        logger.info("Running E2E and retrieval-only evaluations...")
+        evaluator = E2EEvaluator(api_key=api_key)
+        e2e_results, retrieval_only_metrics = await asyncio.gather(
+            evaluator.evaluate_all(),
+            _run_retrieval_only(),
+        )
 
         logger.info(
-            f"Retrieval-only evaluation complete. "
-            f"MRR: {overall_mrr:.3f}, Hit@3: {overall_hit_at_3:.1%}"
+            f"E2E evaluation complete. "
+            f"Success rate: {e2e_results['overall']['pipeline_success_rate']:.1%}"
         )
 
         # Combine E2E and retrieval-only results
@@ -197,8 +246,162 @@ async def get_evaluation_metrics() -> Dict[str, Any]:
         )
 
 
+async def _run_retrieval_only() -> Dict[str, Any]:
+    """
+    Run the retrieval-only evaluation on the test queries.
+
+    Returns:
+        Overall and per-category retrieval metrics with per-query results
+    """
+    logger.info("Running retrieval-only evaluation...")
+
+    # Reuse one service over the mock patterns across requests
+    retrieval_service = _get_retrieval_service(RetrievalService)
+    retrieval_results = []
+
+    # Queries are independent, so run them concurrently (bounded so the
+    # retrieval backend isn't flooded)
+    semaphore = asyncio.Semaphore(RETRIEVAL_CONCURRENCY)
+
+    async def _run_query(query_data: Dict[str, Any]):
+        async with semaphore:
+            return await retrieval_service.search(
+                requirements={'description': query_data['query']},
+                top_k=5
+            )
+
+    raw_results = await asyncio.gather(
+        *[_run_query(query_data) for query_data in TEST_QUERIES]
+    )
+
+    for query_data, results in zip(TEST_QUERIES, raw_results):
+        query = query_data['query']
+        expected = query_data['expected_pattern']
+        category = query_data['category']
+
+        # Get top result
+        if results and len(results) > 0:
+            retrieved = results[0].get('pattern_id', '')
+            confidence = results[0].get('score', 0.0)
+        else:
+            retrieved = ''
+            confidence = 0.0
+
+        correct = retrieved == expected
+
+        # Find rank of correct pattern (first occurrence wins, as before)
+        positions = {}
+        for i, result in enumerate(results):
+            positions.setdefault(result.get('pattern_id'), i)
+        rank = positions[expected] + 1 if expected in positions else 999
+
+        retrieval_results.append({
+            'query': query,
+            'expected': expected,
+            'retrieved': retrieved,
+            'correct': correct,
+            'rank': rank,
+            'confidence': confidence,
+            'category': category,
+        })
+
+    # Calculate all retrieval metrics in one vectorized pass
+    ranks = np.array([r['rank'] for r in retrieval_results], dtype=np.int32)
+    correct = np.array([r['correct'] for r in retrieval_results], dtype=bool)
+    categories = np.array([r['category'] for r in retrieval_results])
+
+    overall = _retrieval_metrics(ranks, correct)
+    overall_mrr = overall['mrr']
+    overall_hit_at_3 = overall['hit_at_3']
+    overall_precision_at_1 = overall['precision_at_1']
+
+    retrieval_only_metrics = {
+        'mrr': overall_mrr,
+        'hit_at_3': overall_hit_at_3,
+        'precision_at_1': overall_precision_at_1,
+        'test_queries': len(TEST_QUERIES),
+        'per_category': _retrieval_metrics_by_category(ranks, correct, categories),
+        'query_results': retrieval_results,
+    }
+
+    logger.info(
+        f"Retrieval-only evaluation complete. "
+        f"MRR: {overall_mrr:.3f}, Hit@3: {overall_hit_at_3:.1%}"
+    )
+
+    return retrieval_only_metrics
+
+
+def _retrieval_metrics(ranks: np.ndarray, correct: np.ndarray) -> Dict[str, float]:
+    """
+    Compute MRR, Hit@3 and Precision@1 over aligned rank/correctness arrays.
+
+    Matches RetrievalMetrics.mean_reciprocal_rank, hit_at_k(k=3) and
+    precision_at_k(k=1) without building RetrievalResult objects.
+
+    Args:
+        ranks: 1-based rank of the expected pattern per query (999 if absent)
+        correct: Whether the top result was the expected pattern per query
+
+    Returns:
+        Dictionary with mrr, hit_at_3 and precision_at_1 (0.0 when empty)
+    """
+    if ranks.size == 0:
+        return {'mrr': 0.0, 'hit_at_3': 0.0, 'precision_at_1': 0.0}
+
+    return {
+        'mrr': float(np.where(correct, 1.0 / ranks, 0.0).mean()),
+        'hit_at_3': float((correct & (ranks <= 3)).mean()),
+        'precision_at_1': float((correct & (ranks == 1)).mean()),
+    }
+
+
+def _retrieval_metrics_by_category(
+    ranks: np.ndarray, correct: np.ndarray, categories: np.ndarray
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compute _retrieval_metrics for each of RETRIEVAL_CATEGORIES in one pass.
+
+    Queries are partitioned once by category index and each metric is a
+    weighted bincount, rather than masking all arrays per category.
+
+    Args:
+        ranks: 1-based rank of the expected pattern per query (999 if absent)
+        correct: Whether the top result was the expected pattern per query
+        categories: Category name per query
+
+    Returns:
+        Metrics keyed by category (0.0 for categories with no queries)
+    """
+    n = len(RETRIEVAL_CATEGORIES)
+    # Index of each query's category; unknown categories land in bucket n
+    index = {category: i for i, category in enumerate(RETRIEVAL_CATEGORIES)}
+    bucket = np.fromiter(
+        (index.get(c, n) for c in categories), dtype=np.intp, count=len(categories)
+    )
+
+    counts = np.bincount(bucket, minlength=n + 1)[:n]
+    sums = {
+        'mrr': np.where(correct, 1.0 / ranks, 0.0),
+        'hit_at_3': correct & (ranks <= 3),
+        'precision_at_1': correct & (ranks == 1),
+    }
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = {
+            name: np.nan_to_num(
+                np.bincount(bucket, weights=values, minlength=n + 1)[:n] / counts
+            )
+            for name, values in sums.items()
+        }
+
+    return {
+        category: {name: float(values[i]) for name, values in means.items()}
+        for i, category in enumerate(RETRIEVAL_CATEGORIES)
+    }
+
+
 @router.get("/status")
-async def get_evaluation_status() -> Dict[str, Any]:
+async def get_evaluation_status(fresh: bool = False) -> Dict[str, Any]:
     """
     Check if evaluation system is ready.
 
@@ -207,16 +410,24 @@ async def get_evaluation_status() -> Dict[str, Any]:
     - Golden dataset availability
     - Retrieval query statistics
 
+    The response is reused for STATUS_CACHE_TTL seconds.
+
+    Args:
+        fresh: Recompute the status even if a cached response is available
+
     Returns:
         Status information and readiness check
     """
+    return await _status_cache.get(_evaluation_status, fresh=fresh)
+
+
+async def _evaluation_status() -> Dict[str, Any]:
+    """Build the evaluation readiness status."""
     api_key_set = bool(os.getenv("OPENAI_API_KEY"))
 
     # Check golden dataset
     try:
-        dataset = GoldenDataset()
-        dataset_size = len(dataset)
-        dataset_stats = dataset.get_statistics()
+        _, dataset_size, dataset_stats = _get_dataset(GoldenDataset)
         dataset_loaded = True
     except Exception as e:
         logger.error(f"Failed to load golden dataset: {e}")
@@ -225,7 +436,7 @@ async def get_evaluation_status() -> Dict[str, Any]:
         dataset_loaded = False
 
     # Get retrieval query statistics
-    query_stats = get_query_statistics()
+    query_stats = _QUERY_STATS
 
     return {
         "ready": api_key_set and dataset_loaded,
@@ -1,8 +1,10 @@
 """Figma integration API routes."""
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status, Depends
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from typing import Optional, Dict, Any, List
 
 from ....services.figma_client import (
     FigmaClient,
@@ -11,6 +13,8 @@ from ....services.figma_client import (
     FigmaFileNotFoundError,
     FigmaRateLimitError,
 )
+from ....cache.figma_cache import get_figma_cache
+from ....core.confidence import process_tokens_with_confidence
 from ....core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -57,16 +61,28 @@ class FigmaExtractRequest(BaseModel):
         description="Figma PAT (if not provided, uses environment variable)",
     )
 
+    # File key parsed from figma_url once it has been validated
+    _file_key: str = PrivateAttr()
+
     @field_validator("figma_url")
     @classmethod
     def validate_figma_url(cls, v):
         """Validate Figma URL format."""
-        if not v or not ("figma.com/file/" in v or "figma.com/design/" in v):
+        if not FigmaClient.FILE_URL_RE.search(v):
             raise ValueError(
                 "Invalid Figma URL. Must be in format: https://figma.com/file/{key} or https://figma.com/design/{key}"
             )
         return v
 
+    def model_post_init(self, __context: Any) -> None:
+        """Extract the file key from the validated figma_url."""
+        self._file_key = FigmaClient.FILE_URL_RE.search(self.figma_url).group(1)
+
+    @property
+    def file_key(self) -> str:
+        """Figma file key parsed from figma_url."""
+        return self._file_key
+
 
 class ColorTokens(BaseModel):
     """Semantic color tokens matching shadcn/ui convention."""
@@ -208,29 +224,28 @@ async def extract_figma_tokens(request: FigmaExtractRequest):
     Results are cached for 5 minutes to reduce API calls.
     """
     try:
-        # Extract file key from URL
-        file_key = FigmaClient.extract_file_key(request.figma_url)
+        # File key was extracted when the URL was validated
+        file_key = request.file_key
         logger.info(f"Extracting tokens from Figma file: {file_key}")
 
         # Initialize client with provided or environment PAT
         async with FigmaClient(personal_access_token=request.personal_access_token) as client:
-            # Fetch file data (with caching)
-            file_data = await client.get_file(file_key, use_cache=True)
-            
+            # Fetch file and styles data concurrently (with caching)
+            file_data, styles_data = await asyncio.gather(
+                client.get_file(file_key, use_cache=True),
+                client.get_file_styles(file_key, use_cache=True),
+            )
+
             # Check if response was cached
             cached = file_data.get("_cached", False)
-            
+
             # Extract file metadata
             file_name = file_data.get("name", "Unknown")
-            
-            # Fetch styles data (with caching)
-            styles_data = await client.get_file_styles(file_key, use_cache=True)
 
             # Extract tokens from file and styles (with confidence scores)
             raw_tokens = _extract_tokens(file_data, styles_data)
 
             # Process tokens with confidence-based fallbacks
-            from ....core.confidence import process_tokens_with_confidence
             processed = process_tokens_with_confidence(raw_tokens)
 
         return FigmaExtractResponse(
@@ -285,8 +300,9 @@ async def invalidate_figma_cache(file_key: str):
     This forces the next request to fetch fresh data from Figma API.
     """
     try:
-        async with FigmaClient() as client:
-            deleted = await client.invalidate_cache(file_key)
+        # Cache operations need no Figma HTTP client
+        logger.info(f"Invalidating cache for Figma file: {file_key}")
+        deleted = await get_figma_cache().invalidate_file(file_key)
 
         return {
             "file_key": file_key,
@@ -310,8 +326,7 @@ async def get_figma_cache_metrics(file_key: str):
     Returns hit rate, latency, and other performance metrics.
     """
     try:
-        async with FigmaClient() as client:
-            metrics = await client.get_cache_metrics(file_key)
+        metrics = await get_figma_cache().get_hit_rate(file_key)
 
         return CacheMetricsResponse(**metrics)
 
@@ -349,9 +364,18 @@ def _extract_tokens(file_data: Dict[str, Any], styles_data: Dict[str, Any]) -> D
             "borderRadius": {...}
         }
     """
+    # Split styles by type in a single pass over the style list
+    # Figma /files/{key}/styles returns: { "meta": { "styles": [...] } }
+    # style_type can be: FILL, TEXT, EFFECT, GRID
+    styles_by_type = {"FILL": [], "TEXT": []}
+    for style in styles_data.get("meta", {}).get("styles", []):
+        bucket = styles_by_type.get(style.get("style_type"))
+        if bucket is not None:
+            bucket.append(style)
+
     tokens = {
-        "colors": _extract_color_tokens(styles_data),
-        "typography": _extract_typography_tokens(styles_data),
+        "colors": _extract_color_tokens(styles_by_type["FILL"]),
+        "typography": _extract_typography_tokens(styles_by_type["TEXT"]),
         "spacing": _extract_spacing_tokens(file_data),
         "borderRadius": _extract_border_radius_tokens(file_data),
     }
@@ -445,12 +469,12 @@ def _extract_border_radius_tokens(file_data: Dict[str, Any]) -> Dict[str, Dict[s
     return border_radius
 
 
-def _extract_color_tokens(styles_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+def _extract_color_tokens(fill_styles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     Extract color tokens from Figma styles with confidence scores using semantic keyword matching.
 
     Args:
-        styles_data: Figma styles data from /files/{key}/styles endpoint
+        fill_styles: FILL styles from the /files/{key}/styles endpoint
 
     Returns:
         Dictionary of semantic color tokens with {value, confidence}
@@ -469,40 +493,34 @@ def _extract_color_tokens(styles_data: Dict[str, Any]) -> Dict[str, Dict[str, An
         'border': ['border', 'divider', 'stroke', 'outline']
     }
 
-    # Figma /files/{key}/styles returns: { "meta": { "styles": [...] } }
-    meta = styles_data.get("meta", {})
-    styles = meta.get("styles", [])
-
-    for style in styles:
-        # style_type can be: FILL, TEXT, EFFECT, GRID
-        if style.get("style_type") == "FILL":
-            name = style.get("name", "").lower()
-            if not name:
-                continue
-
-            # Try to match against semantic keywords
-            for semantic_name, keyword_list in keywords.items():
-                if any(keyword in name for keyword in keyword_list):
-                    if semantic_name not in colors:
-                        # LIMITATION: Currently using default colors based on semantic name matching only.
-                        # TODO: Fetch actual color values from Figma style nodes via /files/{key}/nodes endpoint.
-                        # This would require additional API calls to get the actual fill colors from style references.
-                        # Using lower confidence (0.4) since these are inferred defaults, not extracted values.
-                        default_colors = {
-                            'primary': '#3B82F6',
-                            'secondary': '#64748B',
-                            'accent': '#06B6D4',
-                            'destructive': '#EF4444',
-                            'muted': '#94A3B8',
-                            'background': '#FFFFFF',
-                            'foreground': '#0F172A',
-                            'border': '#E2E8F0'
-                        }
-                        colors[semantic_name] = {
-                            "value": default_colors.get(semantic_name, '#9CA3AF'),
-                            "confidence": 0.4  # Lower confidence since using defaults, not extracted values
-                        }
-                    break
+    for style in fill_styles:
+        name = style.get("name", "").lower()
+        if not name:
+            continue
+
+        # Try to match against semantic keywords
+        for semantic_name, keyword_list in keywords.items():
+            if any(keyword in name for keyword in keyword_list):
+                if semantic_name not in colors:
+                    # LIMITATION: Currently using default colors based on semantic name matching only.
+                    # TODO: Fetch actual color values from Figma style nodes via /files/{key}/nodes endpoint.
+                    # This would require additional API calls to get the actual fill colors from style references.
+                    # Using lower confidence (0.4) since these are inferred defaults, not extracted values.
+                    default_colors = {
+                        'primary': '#3B82F6',
+                        'secondary': '#64748B',
+                        'accent': '#06B6D4',
+                        'destructive': '#EF4444',
+                        'muted': '#94A3B8',
+                        'background': '#FFFFFF',
+                        'foreground': '#0F172A',
+                        'border': '#E2E8F0'
+                    }
+                    colors[semantic_name] = {
+                        "value": default_colors.get(semantic_name, '#9CA3AF'),
+                        "confidence": 0.4  # Lower confidence since using defaults, not extracted values
+                    }
+                break
 
     # If no styles found, provide complete fallback defaults with low confidence
     if not colors:
@@ -536,64 +554,59 @@ def _extract_color_tokens(styles_data: Dict[str, Any]) -> Dict[str, Dict[str, An
     return colors
 
 
-def _extract_typography_tokens(styles_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+def _extract_typography_tokens(text_styles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     Extract typography tokens from Figma styles with confidence scores using font scale.
 
     Args:
-        styles_data: Figma styles data from /files/{key}/styles endpoint
+        text_styles: TEXT styles from the /files/{key}/styles endpoint
 
     Returns:
         Dictionary of typography tokens with {value, confidence}
     """
     typography = {}
 
-    meta = styles_data.get("meta", {})
-    styles = meta.get("styles", [])
-
     # Track if we found any text styles
-    found_text_styles = False
-
-    for style in styles:
-        if style.get("style_type") == "TEXT":
-            found_text_styles = True
-            name = style.get("name", "").lower()
-            if not name:
-                continue
-
-            # Extract typography properties from style name patterns
-            # Note: Full implementation would parse actual node data
-            # For now, infer from common naming patterns
-
-            # Font family inference
-            if not typography.get("fontFamily"):
-                typography["fontFamily"] = {"value": "Inter", "confidence": 0.5}
-            
-            # Map style names to font scale
-            if "caption" in name or "xs" in name or "tiny" in name:
-                typography.setdefault("fontSizeXs", {"value": "12px", "confidence": 0.7})
-            elif "small" in name or "sm" in name or "footnote" in name:
-                typography.setdefault("fontSizeSm", {"value": "14px", "confidence": 0.7})
-            elif "body" in name or "paragraph" in name or "base" in name:
-                typography.setdefault("fontSizeBase", {"value": "16px", "confidence": 0.7})
-            elif "large" in name or "lg" in name:
-                typography.setdefault("fontSizeLg", {"value": "18px", "confidence": 0.7})
-            elif ("h5" in name or "heading 5" in name) or ("xl" in name and "2xl" not in name):
-                typography.setdefault("fontSizeXl", {"value": "20px", "confidence": 0.7})
-            elif "h4" in name or "heading 4" in name or "2xl" in name:
-                typography.setdefault("fontSize2xl", {"value": "24px", "confidence": 0.7})
-            elif "h3" in name or "heading 3" in name or "3xl" in name:
-                typography.setdefault("fontSize3xl", {"value": "30px", "confidence": 0.7})
-            elif "h2" in name or "h1" in name or "heading" in name or "title" in name or "4xl" in name:
-                typography.setdefault("fontSize4xl", {"value": "36px", "confidence": 0.7})
-            
-            # Font weight inference
-            if "bold" in name or "heavy" in name:
-                typography.setdefault("fontWeightBold", {"value": 700, "confidence": 0.7})
-            elif "semibold" in name or "semi" in name or "medium" in name:
-                typography.setdefault("fontWeightSemibold", {"value": 600, "confidence": 0.7})
-            elif "light" in name or "thin" in name:
-                typography.setdefault("fontWeightNormal", {"value": 400, "confidence": 0.7})
+    found_text_styles = bool(text_styles)
+
+    for style in text_styles:
+        name = style.get("name", "").lower()
+        if not name:
+            continue
+
+        # Extract typography properties from style name patterns
+        # Note: Full implementation would parse actual node data
+        # For now, infer from common naming patterns
+
+        # Font family inference
+        if not typography.get("fontFamily"):
+            typography["fontFamily"] = {"value": "Inter", "confidence": 0.5}
+        
+        # Map style names to font scale
+        if "caption" in name or "xs" in name or "tiny" in name:
+            typography.setdefault("fontSizeXs", {"value": "12px", "confidence": 0.7})
+        elif "small" in name or "sm" in name or "footnote" in name:
+            typography.setdefault("fontSizeSm", {"value": "14px", "confidence": 0.7})
+        elif "body" in name or "paragraph" in name or "base" in name:
+            typography.setdefault("fontSizeBase", {"value": "16px", "confidence": 0.7})
+        elif "large" in name or "lg" in name:
+            typography.setdefault("fontSizeLg", {"value": "18px", "confidence": 0.7})
+        elif ("h5" in name or "heading 5" in name) or ("xl" in name and "2xl" not in name):
+            typography.setdefault("fontSizeXl", {"value": "20px", "confidence": 0.7})
+        elif "h4" in name or "heading 4" in name or "2xl" in name:
+            typography.setdefault("fontSize2xl", {"value": "24px", "confidence": 0.7})
+        elif "h3" in name or "heading 3" in name or "3xl" in name:
+            typography.setdefault("fontSize3xl", {"value": "30px", "confidence": 0.7})
+        elif "h2" in name or "h1" in name or "heading" in name or "title" in name or "4xl" in name:
+            typography.setdefault("fontSize4xl", {"value": "36px", "confidence": 0.7})
+        
+        # Font weight inference
+        if "bold" in name or "heavy" in name:
+            typography.setdefault("fontWeightBold", {"value": 700, "confidence": 0.7})
+        elif "semibold" in name or "semi" in name or "medium" in name:
+            typography.setdefault("fontWeightSemibold", {"value": 600, "confidence": 0.7})
+        elif "light" in name or "thin" in name:
+            typography.setdefault("fontWeightNormal", {"value": 400, "confidence": 0.7})
 
     # Fill in missing properties with defaults and appropriate confidence
     if not found_text_styles:
@@ -1,10 +1,16 @@
 """API routes for code generation."""
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+import asyncio
+import json
+import re
 import time
+import uuid
 
 # Try to import LangSmith for tracing (optional dependency)
 try:
@@ -31,6 +37,9 @@ logger = get_logger(__name__)
 # Initialize code sanitizer (singleton)
 code_sanitizer = CodeSanitizer()
 
+# Endpoints keep their return annotations and the default response class so
+# FastAPI serializes the large payloads straight to JSON bytes via Pydantic;
+# setting response_class (e.g. ORJSONResponse) would opt out of that path
 router = APIRouter(prefix="/generation", tags=["generation"])
 
 # Initialize generator service (singleton)
@@ -38,12 +47,19 @@ generator_service = GeneratorService()
 
 # Prometheus metrics (optional - only if prometheus_client is available)
 try:
-    from prometheus_client import Histogram
+    from prometheus_client import Counter, Histogram
     
+    # Histograms cost a series per bucket, so latency is only broken down by
+    # pattern family; per-pattern detail goes on the cheaper counter
     generation_latency_seconds = Histogram(
         "generation_latency_seconds",
         "Code generation latency in seconds",
-        ["pattern_id", "success"]
+        ["pattern_family", "success"]
+    )
+    generation_total = Counter(
+        "generation_total",
+        "Code generation requests",
+        ["pattern_id"]
     )
     
     METRICS_ENABLED = True
@@ -51,6 +67,45 @@ except ImportError:
     METRICS_ENABLED = False
     logger.warning("Prometheus metrics not available for generation endpoint")
 
+# pattern_id comes from the request, so only library patterns get their own
+# label; anything else shares one "other" series to keep cardinality bounded
+KNOWN_PATTERN_IDS = frozenset(generator_service.pattern_parser.list_available_patterns())
+KNOWN_PATTERN_FAMILIES = frozenset(
+    pattern_id.replace("shadcn-", "") for pattern_id in KNOWN_PATTERN_IDS
+)
+
+
+def _pattern_family(pattern_id: str) -> str:
+    """Map a pattern ID to its family label (e.g. "shadcn-button-v1" -> "button")."""
+    # Same normalization PatternParser uses to find the pattern file
+    family = pattern_id.replace("shadcn-", "").lower()
+    family = re.sub(r'-\d+$', '', family)
+    family = re.sub(r'-v\d+$', '', family)
+    return family if family in KNOWN_PATTERN_FAMILIES else "other"
+
+
+@lru_cache(maxsize=None)
+def _latency_metric(pattern_family: str, success: bool):
+    """Get the latency histogram child for a pattern family/outcome pair."""
+    return generation_latency_seconds.labels(
+        pattern_family=pattern_family,
+        success="true" if success else "false",
+    )
+
+
+@lru_cache(maxsize=None)
+def _generation_counter(pattern_label: str):
+    """Get the request counter child for a pattern label."""
+    return generation_total.labels(pattern_id=pattern_label)
+
+
+def _record_latency(pattern_id: str, success: bool, elapsed_ns: int) -> None:
+    """Record generation latency if Prometheus metrics are enabled."""
+    if METRICS_ENABLED:
+        _latency_metric(_pattern_family(pattern_id), success).observe(elapsed_ns / 1e9)
+        pattern_label = pattern_id if pattern_id in KNOWN_PATTERN_IDS else "other"
+        _generation_counter(pattern_label).inc()
+
 
 @router.post("/generate")
 @traceable(run_type="chain", name="generate_component_api")
@@ -85,6 +140,92 @@ async def generate_component(
         - security_issues: Security sanitization results
         - provenance: Generation metadata for tracking
         
+    Raises:
+        HTTPException: For validation or generation errors
+    """
+    return await _generate(request)
+
+
+@router.post("/generate/stream")
+async def generate_component_stream(request: GenerationRequest) -> StreamingResponse:
+    """
+    Generate a component, streaming progress as NDJSON.
+
+    Emits one {"stage", "elapsed_ms"} line as each pipeline stage starts,
+    then a final line with stage "done" and the same payload /generate
+    returns, or stage "error" with status_code and detail on failure.
+    The run's ID (the request's generation_id, or a generated one) is sent
+    up front in the X-Generation-ID header for polling /status.
+
+    Args:
+        request: GenerationRequest with pattern_id, tokens, requirements
+
+    Returns:
+        Streaming application/x-ndjson response
+    """
+    generation_id = request.generation_id or uuid.uuid4().hex
+    return StreamingResponse(
+        _stream_generation(request, generation_id),
+        media_type="application/x-ndjson",
+        headers={"X-Generation-ID": generation_id},
+    )
+
+
+async def _stream_generation(
+    request: GenerationRequest, generation_id: str
+) -> AsyncIterator[str]:
+    """Run a generation and yield its stage events as NDJSON lines."""
+    events: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(
+        _generate(request, on_stage=events.put_nowait, generation_id=generation_id)
+    )
+    # None marks the end of the stage events
+    task.add_done_callback(lambda _: events.put_nowait(None))
+
+    try:
+        while True:
+            event = await events.get()
+            if event is None:
+                break
+            yield _ndjson_line(event)
+
+        try:
+            response = task.result()
+        except HTTPException as e:
+            yield _ndjson_line({
+                "stage": "error",
+                "status_code": e.status_code,
+                "detail": e.detail,
+            })
+        else:
+            yield _ndjson_line({"stage": "done", **response})
+    finally:
+        # Stop generating if the client disconnects mid-stream
+        task.cancel()
+
+
+def _ndjson_line(event: Dict[str, Any]) -> str:
+    """Serialize one streamed event as a newline-terminated JSON line."""
+    return json.dumps(jsonable_encoder(event)) + "\n"
+
+
+async def _generate(
+    request: GenerationRequest,
+    on_stage: Optional[Callable[[Dict[str, Any]], None]] = None,
+    generation_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Generate, sanitize and build the /generate response payload.
+
+    Args:
+        request: GenerationRequest with pattern_id, tokens, requirements
+        on_stage: Optional callback receiving stage progress events
+        generation_id: Optional run ID (defaults to request.generation_id,
+            else one is generated)
+
+    Returns:
+        Response payload for /generate
+
     Raises:
         HTTPException: For validation or generation errors
     """
@@ -92,7 +233,8 @@ async def generate_component(
         f"Received generation request for pattern: {request.pattern_id}"
     )
     
-    start_time = time.time()
+    # Monotonic integer clock; immune to wall-clock adjustments
+    start_ns = time.perf_counter_ns()
     success = False
     
     try:
@@ -113,7 +255,11 @@ async def generate_component(
         # Generate component
         logger.info(f"Starting generation for pattern: {request.pattern_id}")
         
-        result: GenerationResult = await generator_service.generate(request)
+        result: GenerationResult = await generator_service.generate(
+            request,
+            generation_id=generation_id or request.generation_id,
+            on_stage=on_stage,
+        )
 
         # Check if generation catastrophically failed (no code at all)
         if not result.success and not result.component_code:
@@ -157,7 +303,8 @@ async def generate_component(
             logger.info("Code sanitization passed - no security issues detected")
         
         # Calculate total latency
-        total_latency_ms = int((time.time() - start_time) * 1000)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        total_latency_ms = elapsed_ns // 1_000_000
         success = True
         
         # Get trace metadata for observability
@@ -173,11 +320,7 @@ async def generate_component(
         result.metadata.trace_url = trace_url
         
         # Record Prometheus metric
-        if METRICS_ENABLED:
-            generation_latency_seconds.labels(
-                pattern_id=request.pattern_id,
-                success="true"
-            ).observe((time.time() - start_time))
+        _record_latency(request.pattern_id, True, elapsed_ns)
         
         logger.info(
             f"Generation completed successfully in {total_latency_ms}ms",
@@ -195,6 +338,7 @@ async def generate_component(
         
         # Return successful response matching frontend GenerationResponse type
         response = {
+            "generation_id": result.generation_id,
             "code": {
                 "component": result.component_code,
                 "stories": result.stories_code,
@@ -231,8 +375,8 @@ async def generate_component(
                 "pattern_id": request.pattern_id,
                 "pattern_version": "1.0.0",
                 "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "tokens_hash": "placeholder",  # TODO: Calculate hash
-                "requirements_hash": "placeholder"  # TODO: Calculate hash
+                "tokens_hash": result.metadata.tokens_hash,
+                "requirements_hash": result.metadata.requirements_hash
             },
             # Always return "completed" - validation details are in validation_results
             "status": "completed"
@@ -305,21 +449,13 @@ async def generate_component(
     
     except HTTPException:
         # Record failure metric
-        if METRICS_ENABLED:
-            generation_latency_seconds.labels(
-                pattern_id=request.pattern_id,
-                success="false"
-            ).observe((time.time() - start_time))
+        _record_latency(request.pattern_id, False, time.perf_counter_ns() - start_ns)
         # Re-raise HTTP exceptions
         raise
     
     except FileNotFoundError as e:
         # Record failure metric
-        if METRICS_ENABLED:
-            generation_latency_seconds.labels(
-                pattern_id=request.pattern_id,
-                success="false"
-            ).observe((time.time() - start_time))
+        _record_latency(request.pattern_id, False, time.perf_counter_ns() - start_ns)
         logger.error(f"Pattern not found: {e}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -328,11 +464,7 @@ async def generate_component(
     
     except ValueError as e:
         # Record failure metric
-        if METRICS_ENABLED:
-            generation_latency_seconds.labels(
-                pattern_id=request.pattern_id,
-                success="false"
-            ).observe((time.time() - start_time))
+        _record_latency(request.pattern_id, False, time.perf_counter_ns() - start_ns)
         logger.error(f"Validation error: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -341,11 +473,7 @@ async def generate_component(
     
     except Exception as e:
         # Record failure metric
-        if METRICS_ENABLED:
-            generation_latency_seconds.labels(
-                pattern_id=request.pattern_id,
-                success="false"
-            ).observe((time.time() - start_time))
+        _record_latency(request.pattern_id, False, time.perf_counter_ns() - start_ns)
         logger.error(f"Unexpected error during generation: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -364,11 +492,8 @@ async def list_available_patterns() -> Dict[str, Any]:
     logger.info("Listing available patterns")
     
     try:
-        # Use pattern parser to list patterns
-        from ....generation.pattern_parser import PatternParser
-        
-        parser = PatternParser()
-        patterns = parser.list_available_patterns()
+        # Use the generator service's pattern parser to list patterns
+        patterns = generator_service.pattern_parser.list_available_patterns()
         
         logger.info(f"Found {len(patterns)} available patterns")
         
@@ -386,37 +511,37 @@ async def list_available_patterns() -> Dict[str, Any]:
         )
 
 
-@router.get("/status/{pattern_id}")
-async def get_generation_status(pattern_id: str) -> Dict[str, Any]:
+@router.get("/status/{generation_id}")
+async def get_generation_status(generation_id: str) -> Dict[str, Any]:
     """
     Get current generation status (for progress tracking).
     
     Args:
-        pattern_id: ID of pattern being generated
+        generation_id: ID of the generation run (the request's generation_id,
+            the X-Generation-ID header of /generate/stream, or the /generate
+            response)
         
     Returns:
         JSON response with current stage and progress
+
+    Raises:
+        HTTPException: 404 if the run is unknown or no longer tracked
     """
-    logger.info(f"Getting generation status for pattern: {pattern_id}")
-    
-    try:
-        # Get current stage from generator service
-        current_stage = generator_service.get_current_stage()
-        stage_latencies = generator_service.get_stage_latencies()
-        
-        return {
-            "success": True,
-            "pattern_id": pattern_id,
-            "current_stage": current_stage.value,
-            "stage_latencies": {
-                stage.value: latency 
-                for stage, latency in stage_latencies.items()
-            }
-        }
-    
-    except Exception as e:
-        logger.error(f"Error getting generation status: {e}", exc_info=True)
+    logger.info(f"Getting generation status for run: {generation_id}")
+
+    progress = generator_service.get_progress(generation_id)
+    if progress is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get status: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown generation run: {generation_id}"
         )
+
+    return {
+        "success": True,
+        "generation_id": generation_id,
+        "current_stage": progress.current_stage.value,
+        "stage_latencies": {
+            stage.value: latency
+            for stage, latency in progress.stage_latencies.items()
+        }
+    }
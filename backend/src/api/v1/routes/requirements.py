@@ -1,45 +1,251 @@
 """API routes for requirement proposal."""
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status, Depends
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, status, Depends
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, StreamingResponse
-from typing import Dict, Any, Optional, List, AsyncGenerator
-from pydantic import BaseModel, Field
+from typing import (
+    Dict, Any, Optional, List, AsyncGenerator, Awaitable, BinaryIO, Iterator, Tuple
+)
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from datetime import datetime, timezone
+from functools import lru_cache
+import asyncio
+import hashlib
 import io
+import logging
+import os
 import time
 import json
 from PIL import Image
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
+from ....core.serialization import json_dumps, json_loads
 from ....services.image_processor import (
+    read_upload,
     validate_and_process_image,
-    ImageValidationError
+    ImageTooLargeError,
+    ImageValidationError,
 )
 from ....services.requirement_exporter import RequirementExporter
 from ....agents.requirement_orchestrator import RequirementOrchestrator
 from ....types.requirement_types import (
     RequirementProposal,
     ComponentType,
-    RequirementCategory
+    RequirementCategory,
+    RequirementState,
 )
 from ....core.logging import get_logger
-from ....core.database import get_async_session
+from ....core.database import get_async_connection, get_async_session
+from ....cache.proposal_cache import get_proposal_cache
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/requirements", tags=["requirements"])
 
+# Serializes proposals grouped by category in one call; built once since
+# compiling the nested schema is the expensive part
+PROPOSALS_ADAPTER = TypeAdapter(Dict[str, List[RequirementProposal]])
 
-class RequirementProposalRequest(BaseModel):
-    """Request model for requirement proposal."""
-    tokens: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Optional design tokens from Epic 1 extraction"
-    )
-    figma_data: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Optional Figma frame data"
-    )
+# Exports whose request body exceeds this many bytes are streamed; the
+# export JSON mirrors the submitted requirements, tokens and metadata
+EXPORT_STREAM_THRESHOLD = 64 * 1024
+
+# p50 latency target for /propose, in seconds
+PROPOSAL_LATENCY_TARGET = 15.0
+
+# UTC timestamp format for response metadata
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@lru_cache(maxsize=1)
+def _format_utc_second(epoch_second: int) -> str:
+    """Format a whole epoch second; cached since it repeats until the next tick."""
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(epoch_second))
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time formatted with TIMESTAMP_FORMAT."""
+    return _format_utc_second(int(time.time()))
+
+
+def get_requirement_orchestrator(request: Request) -> RequirementOrchestrator:
+    """Dependency to get the requirement orchestrator from FastAPI app state.
+
+    The orchestrator and its agents keep no per-request state, so the one
+    instance built in the app lifespan serves concurrent requests.
+
+    Args:
+        request: FastAPI request object containing app state
+
+    Returns:
+        RequirementOrchestrator instance from app state
+
+    Raises:
+        HTTPException: If the orchestrator was not initialized at startup
+            (typically because OPENAI_API_KEY is not configured)
+    """
+    orchestrator = getattr(request.app.state, "requirement_orchestrator", None)
+    if orchestrator is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Requirement orchestrator not initialized. "
+                   "Ensure OPENAI_API_KEY is configured and app startup completed."
+        )
+    return orchestrator
+
+
+# Orchestrator runs allowed at once, and how many more may wait for a slot
+# before new proposals are turned away with 503
+PROPOSE_CONCURRENCY = int(os.getenv("PROPOSE_CONCURRENCY", "8"))
+PROPOSE_MAX_QUEUED = int(os.getenv("PROPOSE_MAX_QUEUED", "32"))
+
+_propose_semaphore = asyncio.Semaphore(PROPOSE_CONCURRENCY)
+_proposals_admitted = 0  # Running plus waiting
+
+
+class ProposalCapacityError(Exception):
+    """Raised when too many proposals are already waiting to run."""
+    pass
+
+
+async def _bounded_proposal(
+    orchestrator: RequirementOrchestrator,
+    image: Image.Image,
+    tokens: Optional[Dict[str, Any]],
+    figma_data: Optional[Dict[str, Any]],
+) -> RequirementState:
+    """Admit a proposal run, to start once one of PROPOSE_CONCURRENCY slots frees.
+
+    Bounds how many images and in-flight LLM calls are held at once.
+
+    Args:
+        orchestrator: Orchestrator to run the proposal with
+        image: Validated component image
+        tokens: Optional design tokens
+        figma_data: Optional Figma metadata
+
+    Returns:
+        The proposal's RequirementState
+
+    Raises:
+        ProposalCapacityError: If PROPOSE_MAX_QUEUED runs are already waiting
+    """
+    global _proposals_admitted
+    # Check and count without awaiting in between, so concurrent admissions
+    # see each other; the matching decrement is in the finally below
+    if _proposals_admitted >= PROPOSE_CONCURRENCY + PROPOSE_MAX_QUEUED:
+        raise ProposalCapacityError(
+            "Too many requirement proposals in progress. Please retry shortly."
+        )
+    _proposals_admitted += 1
+    try:
+        async with _propose_semaphore:
+            return await orchestrator.propose_requirements_parallel(
+                image=image, tokens=tokens, figma_data=figma_data
+            )
+    finally:
+        _proposals_admitted -= 1
+
+
+# In-flight proposals by request fingerprint, so identical concurrent
+# requests share one set of LLM calls
+_inflight_proposals: Dict[str, "asyncio.Task[RequirementState]"] = {}
+
+
+def _proposal_key(image_file: BinaryIO, tokens: Optional[str], figma_data: Optional[str]) -> str:
+    """Fingerprint a proposal request by its image file and form fields."""
+    image_file.seek(0)
+    digest = hashlib.file_digest(image_file, lambda: hashlib.blake2b(digest_size=16))
+    for field in (tokens, figma_data):
+        digest.update(b"\0" + (field or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def _cache_proposal(
+    key: str, proposal: Awaitable[RequirementState]
+) -> RequirementState:
+    """Await a proposal run and store its result for repeat uploads."""
+    state = await proposal
+    await get_proposal_cache().set_state(key, state)
+    return state
+
+
+async def _propose_coalesced(
+    key: str,
+    orchestrator: RequirementOrchestrator,
+    image: Image.Image,
+    tokens: Optional[Dict[str, Any]],
+    figma_data: Optional[Dict[str, Any]],
+) -> RequirementState:
+    """Run a proposal, reusing a cached or in-flight identical one.
+
+    The shared task is shielded so one caller disconnecting does not
+    cancel it for the others.
+
+    Args:
+        key: Request fingerprint from _proposal_key
+        orchestrator: Orchestrator to run a new proposal with
+        image: Validated component image
+        tokens: Optional design tokens
+        figma_data: Optional Figma metadata
+
+    Returns:
+        RequirementState shared by every caller with the same key, from the
+        proposal cache when this request was answered within its TTL
+
+    Raises:
+        ProposalCapacityError: If a new run is needed and the queue is full
+    """
+    cached = await get_proposal_cache().get_state(key)
+    if cached is not None:
+        logger.info(
+            "Serving cached requirement proposal",
+            extra={"extra": {"request_key": key}}
+        )
+        return cached
+
+    task = _inflight_proposals.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _cache_proposal(
+                key, _bounded_proposal(orchestrator, image, tokens, figma_data)
+            )
+        )
+        _inflight_proposals[key] = task
+        task.add_done_callback(lambda _: _inflight_proposals.pop(key, None))
+    else:
+        logger.info(
+            "Joining in-flight requirement proposal",
+            extra={"extra": {"request_key": key}}
+        )
+    return await asyncio.shield(task)
+
+
+def _parse_form_json(
+    tokens: Optional[str], figma_data: Optional[str]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Parse the optional tokens and figma_data JSON form fields.
+
+    Args:
+        tokens: Design tokens JSON string, if provided
+        figma_data: Figma frame metadata JSON string, if provided
+
+    Returns:
+        Tuple of (tokens_dict, figma_data_dict), None where not provided
+
+    Raises:
+        ValueError: If a field is not valid JSON (message names the field)
+    """
+    parsed = []
+    for name, value in (("tokens", tokens), ("figma_data", figma_data)):
+        if not value:
+            parsed.append(None)
+            continue
+        try:
+            parsed.append(json_loads(value))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid {name} JSON: {str(e)}") from e
+    return parsed[0], parsed[1]
 
 
 class RequirementProposalResponse(BaseModel):
@@ -62,7 +268,8 @@ class RequirementProposalResponse(BaseModel):
 async def propose_requirements_stream(
     file: UploadFile = File(..., description="Screenshot or Figma image (PNG, JPG, JPEG up to 10MB)"),
     tokens: Optional[str] = Form(None, description="Optional design tokens as JSON string"),
-    figma_data: Optional[str] = Form(None, description="Optional Figma frame data as JSON string")
+    figma_data: Optional[str] = Form(None, description="Optional Figma frame data as JSON string"),
+    orchestrator: RequirementOrchestrator = Depends(get_requirement_orchestrator)
 ) -> StreamingResponse:
     """Propose requirements with real-time progress streaming via SSE.
 
@@ -75,6 +282,7 @@ async def propose_requirements_stream(
         file: Uploaded image file
         tokens: Optional design tokens JSON
         figma_data: Optional Figma metadata JSON
+        orchestrator: Shared requirement orchestrator (injected)
 
     Returns:
         SSE stream with progress updates and final result
@@ -82,9 +290,8 @@ async def propose_requirements_stream(
     async def event_generator() -> AsyncGenerator[str, None]:
         try:
             # Read and validate image
-            contents = await file.read()
-
             try:
+                contents = await read_upload(file)
                 image, metadata = validate_and_process_image(
                     contents,
                     mime_type=file.content_type
@@ -94,22 +301,11 @@ async def propose_requirements_stream(
                 return
 
             # Parse tokens and figma_data
-            tokens_dict = None
-            figma_data_dict = None
-
-            if tokens:
-                try:
-                    tokens_dict = json.loads(tokens)
-                except json.JSONDecodeError as e:
-                    yield f"event: error\ndata: {json.dumps({'error': f'Invalid tokens JSON: {str(e)}'})}\n\n"
-                    return
-
-            if figma_data:
-                try:
-                    figma_data_dict = json.loads(figma_data)
-                except json.JSONDecodeError as e:
-                    yield f"event: error\ndata: {json.dumps({'error': f'Invalid figma_data JSON: {str(e)}'})}\n\n"
-                    return
+            try:
+                tokens_dict, figma_data_dict = _parse_form_json(tokens, figma_data)
+            except ValueError as e:
+                yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+                return
 
             # Progress update helper
             def send_progress(stage: str, progress: int, message: str):
@@ -121,34 +317,28 @@ async def propose_requirements_stream(
             # Stage 2: Classification
             yield send_progress("classifying", 20, "Classifying component type...")
 
-            import os as env_os
-            openai_api_key = env_os.getenv("OPENAI_API_KEY")
-            if not openai_api_key:
-                yield f"event: error\ndata: {json.dumps({'error': 'OPENAI_API_KEY not configured'})}\n\n"
-                return
-
-            orchestrator = RequirementOrchestrator(openai_api_key=openai_api_key)
-
             # Stage 3: Analyzing requirements
             yield send_progress("analyzing", 40, "Analyzing component requirements...")
 
             # Run requirement proposal
-            state = await orchestrator.propose_requirements_parallel(
-                image=image,
-                tokens=tokens_dict,
-                figma_data=figma_data_dict
+            state = await _bounded_proposal(
+                orchestrator, image, tokens_dict, figma_data_dict
             )
 
             # Stage 4: Finalizing
             yield send_progress("finalizing", 80, "Finalizing proposals...")
 
             # Group proposals by category and convert Pydantic models to dicts
-            proposals_by_category = {
-                "props": [p.model_dump(by_alias=True) for p in state.props_proposals],
-                "events": [p.model_dump(by_alias=True) for p in state.events_proposals],
-                "states": [p.model_dump(by_alias=True) for p in state.states_proposals],
-                "accessibility": [p.model_dump(by_alias=True) for p in state.accessibility_proposals]
-            }
+            proposals_by_category = PROPOSALS_ADAPTER.dump_python(
+                {
+                    "props": state.props_proposals,
+                    "events": state.events_proposals,
+                    "states": state.states_proposals,
+                    "accessibility": state.accessibility_proposals,
+                },
+                mode="json",
+                by_alias=True,
+            )
 
             # Build response
             response_data = {
@@ -156,9 +346,11 @@ async def propose_requirements_stream(
                 "componentConfidence": state.classification.confidence,
                 "proposals": proposals_by_category,
                 "metadata": {
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "timestamp": _utc_timestamp(),
                     "source": "screenshot" if not figma_data_dict else "figma",
-                    "total_proposals": len(state.get_all_proposals()),
+                    "total_proposals": sum(
+                        len(proposals) for proposals in proposals_by_category.values()
+                    ),
                 }
             }
 
@@ -188,7 +380,8 @@ async def propose_requirements_stream(
 async def propose_requirements(
     file: UploadFile = File(..., description="Screenshot or Figma image (PNG, JPG, JPEG up to 10MB)"),
     tokens: Optional[str] = Form(None, description="Optional design tokens as JSON string"),
-    figma_data: Optional[str] = Form(None, description="Optional Figma frame data as JSON string")
+    figma_data: Optional[str] = Form(None, description="Optional Figma frame data as JSON string"),
+    orchestrator: RequirementOrchestrator = Depends(get_requirement_orchestrator)
 ) -> RequirementProposalResponse:
     """Propose functional requirements from screenshot/Figma frame.
     
@@ -205,6 +398,7 @@ async def propose_requirements(
         file: Uploaded image file (PNG, JPG, JPEG up to 10MB)
         tokens: Optional JSON string of design tokens from Epic 1
         figma_data: Optional JSON string of Figma frame metadata
+        orchestrator: Shared requirement orchestrator (injected)
         
     Returns:
         JSON response with component type, proposals by category, metadata
@@ -214,24 +408,35 @@ async def propose_requirements(
     """
     start_time = time.time()
     
-    # Sanitize filename
-    import os
-    safe_filename = os.path.basename(file.filename) if file.filename else "unknown"
-    
-    logger.info(
-        f"Received requirement proposal request: {safe_filename}",
-        extra={"extra": {"content_type": file.content_type}}
-    )
+    # Skip building log messages and their extra dicts when INFO is off
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    if log_info:
+        # Sanitize filename; strip both separators so Windows client paths
+        # are trimmed too, without going through os.path
+        safe_filename = (
+            file.filename.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+            if file.filename else "unknown"
+        )
+        logger.info(
+            f"Received requirement proposal request: {safe_filename}",
+            extra={"extra": {"content_type": file.content_type}}
+        )
     
     try:
         # Read and validate image
-        contents = await file.read()
-        
         try:
+            # Read the spooled upload in place rather than copying it to bytes
             image, metadata = validate_and_process_image(
-                contents,
+                file.file,
                 mime_type=file.content_type
             )
+        except ImageTooLargeError as e:
+            logger.error(f"Image validation failed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=str(e)
+            )
         except ImageValidationError as e:
             logger.error(f"Image validation failed: {e}")
             raise HTTPException(
@@ -240,69 +445,61 @@ async def propose_requirements(
             )
         
         # Parse optional JSON fields from form data
-        tokens_dict = None
-        figma_data_dict = None
-        
-        if tokens:
-            try:
-                tokens_dict = json.loads(tokens)
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid tokens JSON: {e}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid tokens JSON: {str(e)}"
-                )
-        
-        if figma_data:
-            try:
-                figma_data_dict = json.loads(figma_data)
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid figma_data JSON: {e}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid figma_data JSON: {str(e)}"
-                )
-        
-        logger.info(
-            "Starting requirement proposal",
-            extra={"extra": {
-                "has_tokens": tokens_dict is not None,
-                "has_figma": figma_data_dict is not None
-            }}
-        )
-        
-        # Initialize orchestrator
-        import os as env_os
-        openai_api_key = env_os.getenv("OPENAI_API_KEY")
-        if not openai_api_key:
+        try:
+            tokens_dict, figma_data_dict = _parse_form_json(tokens, figma_data)
+        except ValueError as e:
+            logger.error(str(e))
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="OPENAI_API_KEY not configured"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
             )
         
-        orchestrator = RequirementOrchestrator(openai_api_key=openai_api_key)
+        if log_info:
+            logger.info(
+                "Starting requirement proposal",
+                extra={"extra": {
+                    "has_tokens": tokens_dict is not None,
+                    "has_figma": figma_data_dict is not None
+                }}
+            )
         
         # Run requirement proposal (use parallel for production)
-        state = await orchestrator.propose_requirements_parallel(
-            image=image,
-            tokens=tokens_dict,
-            figma_data=figma_data_dict
-        )
+        try:
+            state = await _propose_coalesced(
+                _proposal_key(file.file, tokens, figma_data),
+                orchestrator,
+                image,
+                tokens_dict,
+                figma_data_dict,
+            )
+        except ProposalCapacityError as e:
+            logger.warning(str(e))
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e)
+            )
         
         # Calculate latency
         latency = time.time() - start_time
+        latency_seconds = round(latency, 2)
+
+        props_count = len(state.props_proposals)
+        events_count = len(state.events_proposals)
+        states_count = len(state.states_proposals)
+        a11y_count = len(state.accessibility_proposals)
         
-        logger.info(
-            "Requirement proposal complete",
-            extra={"extra": {
-                "component_type": state.classification.component_type.value,
-                "props_count": len(state.props_proposals),
-                "events_count": len(state.events_proposals),
-                "states_count": len(state.states_proposals),
-                "a11y_count": len(state.accessibility_proposals),
-                "latency_seconds": round(latency, 2)
-            }}
-        )
+        if log_info:
+            logger.info(
+                "Requirement proposal complete",
+                extra={"extra": {
+                    "component_type": state.classification.component_type.value,
+                    "props_count": props_count,
+                    "events_count": events_count,
+                    "states_count": states_count,
+                    "a11y_count": a11y_count,
+                    "latency_seconds": latency_seconds
+                }}
+            )
 
         # Group proposals by category
         proposals_by_category = {
@@ -312,23 +509,19 @@ async def propose_requirements(
             "accessibility": state.accessibility_proposals
         }
 
-        # Build response
-        response = RequirementProposalResponse(
+        # Build response; the data comes from validated internal models, so
+        # skip re-validating it (FastAPI still checks the returned model)
+        response = RequirementProposalResponse.model_construct(
             component_type=state.classification.component_type,
             component_confidence=state.classification.confidence,
             proposals=proposals_by_category,
             metadata={
-                "latency_seconds": round(latency, 2),
-                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "latency_seconds": latency_seconds,
+                "timestamp": _utc_timestamp(),
                 "source": "screenshot" if not figma_data_dict else "figma",
-                "total_proposals": (
-                    len(state.props_proposals) +
-                    len(state.events_proposals) +
-                    len(state.states_proposals) +
-                    len(state.accessibility_proposals)
-                ),
-                "target_latency_p50": 15.0,
-                "meets_latency_target": latency <= 15.0
+                "total_proposals": props_count + events_count + states_count + a11y_count,
+                "target_latency_p50": PROPOSAL_LATENCY_TARGET,
+                "meets_latency_target": latency <= PROPOSAL_LATENCY_TARGET
             }
         )
         
@@ -377,6 +570,37 @@ class ExportRequirementsRequest(BaseModel):
         populate_by_name = True
 
 
+async def _parse_export_request(http_request: Request) -> ExportRequirementsRequest:
+    """Validate the /export body straight from JSON bytes.
+
+    model_validate_json parses and validates in one pass, without first
+    building the body as Python dicts the way a typed body parameter does.
+
+    Raises:
+        RequestValidationError: If the body is invalid (422, as for a typed body)
+    """
+    try:
+        return ExportRequirementsRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        )
+
+
+# The body is read by _parse_export_request, so describe it for OpenAPI by
+# hand; the nested models are listed under components via ExportPreviewRequest
+_EXPORT_REQUEST_SCHEMA = {
+    key: value
+    for key, value in ExportRequirementsRequest.model_json_schema(
+        ref_template="#/components/schemas/{model}"
+    ).items()
+    if key != "$defs"
+}
+
+
 class ExportRequirementsResponse(BaseModel):
     """Response model for requirement export."""
     export_id: str = Field(..., alias="exportId")
@@ -410,9 +634,39 @@ class ExportPreviewResponse(BaseModel):
         populate_by_name = True
 
 
-@router.post("/export")
+def _export_json_chunks(result: Dict[str, Any]) -> Iterator[bytes]:
+    """Encode an export result as ExportRequirementsResponse JSON, piecewise.
+
+    Each top-level exportData entry is encoded separately, so the first
+    bytes are sent before the whole document is serialized.
+
+    Args:
+        result: Result of RequirementExporter.export_requirements
+
+    Yields:
+        Consecutive chunks of the JSON response body
+    """
+    yield b'{"exportId":' + json_dumps(result["export_id"]) + b',"exportData":{'
+    for index, (key, value) in enumerate(result["export_data"].items()):
+        yield (b"," if index else b"") + json_dumps(key) + b":" + json_dumps(value)
+    yield (
+        b'},"summary":' + json_dumps(result["database_record"])
+        + b',"status":' + json_dumps(result["status"]) + b"}"
+    )
+
+
+@router.post(
+    "/export",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _EXPORT_REQUEST_SCHEMA}},
+        }
+    },
+)
 async def export_requirements(
-    request: ExportRequirementsRequest,
+    http_request: Request,
+    request: ExportRequirementsRequest = Depends(_parse_export_request),
     db: AsyncSession = Depends(get_async_session)
 ) -> ExportRequirementsResponse:
     """Export approved requirements to JSON and store in database.
@@ -426,10 +680,12 @@ async def export_requirements(
 
     Args:
         request: Export request with approved requirements
+        http_request: Raw request, used to size the export
         db: Database session (injected)
 
     Returns:
-        Export result with ID, JSON data, and summary
+        Export result with ID, JSON data, and summary (streamed when the
+        request body exceeds EXPORT_STREAM_THRESHOLD)
 
     Raises:
         HTTPException: For validation or database failures
@@ -450,18 +706,19 @@ async def export_requirements(
         for category, proposals_list in request.proposals.items():
             proposals_dict[category] = proposals_list
 
-        # Parse timestamps if provided
+        # Parse timestamps if provided (fromisoformat accepts a trailing Z
+        # since Python 3.11)
         proposed_at = None
         if request.proposed_at:
             try:
-                proposed_at = datetime.fromisoformat(request.proposed_at.replace('Z', '+00:00'))
+                proposed_at = datetime.fromisoformat(request.proposed_at)
             except Exception as e:
                 logger.warning(f"Failed to parse proposed_at: {e}")
 
         approved_at = None
         if request.approved_at:
             try:
-                approved_at = datetime.fromisoformat(request.approved_at.replace('Z', '+00:00'))
+                approved_at = datetime.fromisoformat(request.approved_at)
             except Exception as e:
                 logger.warning(f"Failed to parse approved_at: {e}")
 
@@ -492,7 +749,14 @@ async def export_requirements(
             },
         )
 
-        return ExportRequirementsResponse(
+        # Large exports are streamed rather than built into one response body
+        content_length = int(http_request.headers.get("content-length") or 0)
+        if content_length > EXPORT_STREAM_THRESHOLD:
+            return StreamingResponse(
+                _export_json_chunks(result), media_type="application/json"
+            )
+
+        return ExportRequirementsResponse.model_construct(
             export_id=result["export_id"],
             export_data=result["export_data"],
             summary=result["database_record"],
@@ -537,7 +801,7 @@ async def preview_export(
             component_confidence=request.component_confidence,
         )
 
-        return ExportPreviewResponse(**preview)
+        return ExportPreviewResponse.model_construct(**preview)
 
     except Exception as e:
         logger.error(f"Export preview generation failed: {e}", exc_info=True)
@@ -550,13 +814,13 @@ async def preview_export(
 @router.get("/exports/{export_id}")
 async def get_export(
     export_id: str,
-    db: AsyncSession = Depends(get_async_session)
+    db: AsyncConnection = Depends(get_async_connection)
 ) -> Dict[str, Any]:
     """Retrieve an exported requirement set by ID.
 
     Args:
         export_id: Unique export identifier
-        db: Database session (injected)
+        db: Read-only database connection (injected)
 
     Returns:
         Export data with requirements and metadata
@@ -589,13 +853,13 @@ async def get_export(
 @router.get("/exports")
 async def list_recent_exports(
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_session)
+    db: AsyncConnection = Depends(get_async_connection)
 ) -> List[Dict[str, Any]]:
     """List recent requirement exports.
 
     Args:
         limit: Maximum number of exports to return (default: 10)
-        db: Database session (injected)
+        db: Read-only database connection (injected)
 
     Returns:
         List of recent exports with summaries
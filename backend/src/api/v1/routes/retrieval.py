@@ -5,10 +5,12 @@ POST /api/v1/retrieval/search endpoint.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import AsyncIterator, List, Dict, Optional, Any
 from langsmith import traceable
 from sqlalchemy.ext.asyncio import AsyncSession
+import json
 import logging
 
 from ....core.database import get_async_session
@@ -25,17 +27,21 @@ class RetrievalRequest(BaseModel):
     requirements: Dict = Field(
         ...,
         description="Component requirements from Epic 2",
-        example={
-            "component_type": "Button",
-            "props": ["variant", "size", "disabled"],
-            "variants": ["primary", "secondary", "ghost"],
-            "a11y": ["aria-label", "keyboard navigation"]
+        json_schema_extra={
+            "example": {
+                "component_type": "Button",
+                "props": ["variant", "size", "disabled"],
+                "variants": ["primary", "secondary", "ghost"],
+                "a11y": ["aria-label", "keyboard navigation"]
+            }
         }
     )
 
 
 class MatchHighlights(BaseModel):
     """Highlights of matched features."""
+    model_config = ConfigDict(frozen=True)
+
     matched_props: List[str] = Field(default_factory=list)
     matched_variants: List[str] = Field(default_factory=list)
     matched_a11y: List[str] = Field(default_factory=list)
@@ -43,6 +49,8 @@ class MatchHighlights(BaseModel):
 
 class RankingDetails(BaseModel):
     """Ranking details for explainability."""
+    model_config = ConfigDict(frozen=True)
+
     bm25_score: float
     bm25_rank: int
     semantic_score: float
@@ -53,6 +61,8 @@ class RankingDetails(BaseModel):
 
 class PatternResult(BaseModel):
     """Individual pattern result with metadata."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     category: str
@@ -69,6 +79,8 @@ class PatternResult(BaseModel):
 
 class RetrievalMetadata(BaseModel):
     """Metadata about the retrieval process."""
+    model_config = ConfigDict(frozen=True)
+
     latency_ms: int
     methods_used: List[str]
     weights: Dict[str, float]
@@ -78,6 +90,8 @@ class RetrievalMetadata(BaseModel):
 
 class RetrievalResponse(BaseModel):
     """Response model for pattern retrieval."""
+    model_config = ConfigDict(frozen=True)
+
     patterns: List[PatternResult]
     retrieval_metadata: RetrievalMetadata
 
@@ -199,8 +213,61 @@ async def search_patterns(
         )
 
 
+@router.post("/search/stream")
+async def search_patterns_stream(
+    request: RetrievalRequest,
+    retrieval_service=Depends(get_retrieval_service)
+) -> StreamingResponse:
+    """Search for matching patterns, streaming results as NDJSON.
+    
+    Accepts the same body as /search. Each line is one JSON object:
+    - {"pattern": {...}} for each top-3 pattern, in rank order, shaped like
+      /search's PatternResult
+    - {"retrieval_metadata": {...}} once all patterns are sent
+    - {"error": "..."} if the search fails after streaming has started
+    
+    Args:
+        request: RetrievalRequest with component requirements
+        retrieval_service: Injected retrieval service
+    
+    Returns:
+        application/x-ndjson stream of patterns followed by metadata
+    
+    Raises:
+        HTTPException 400: Invalid request (missing required fields)
+        HTTPException 422: Validation error
+    """
+    logger.info(f"Received streaming retrieval request: {request.requirements}")
+    
+    # Validate requirements has component_type
+    if "component_type" not in request.requirements:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="requirements.component_type is required"
+        )
+    
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        try:
+            async for kind, data in retrieval_service.search_stream(
+                requirements=request.requirements,
+                top_k=3
+            ):
+                if kind == "pattern":
+                    # Validated like /search's response_model, which also
+                    # drops pattern fields outside PatternResult
+                    payload = PatternResult.model_validate(data).model_dump_json()
+                else:
+                    payload = RetrievalMetadata.model_validate(data).model_dump_json()
+                yield b'{"%s":%s}\n' % (kind.encode(), payload.encode())
+        except Exception as e:
+            logger.error(f"Streaming retrieval search failed: {e}", exc_info=True)
+            yield json.dumps({"error": f"Retrieval search failed: {str(e)}"}).encode() + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/health")
-async def health_check(request: Request):
+async def health_check(request: Request) -> Dict[str, Any]:
     """Health check endpoint for retrieval service.
     
     Returns:
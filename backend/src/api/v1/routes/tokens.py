@@ -1,9 +1,10 @@
 """API routes for design token extraction."""
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from typing import Dict, Any
 import io
+import json
 import os
 from PIL import Image
 
@@ -17,6 +18,7 @@ from ....security.input_validator import (
 )
 from ....security.pii_detector import PIIDetector, PIIDetectionError
 from ....agents.token_extractor import TokenExtractor, TokenExtractionError
+from ....core.defaults import SHADCN_DEFAULTS
 from ....core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +28,13 @@ router = APIRouter(prefix="/tokens", tags=["tokens"])
 # Environment variable to control PII detection
 PII_DETECTION_ENABLED = os.getenv("PII_DETECTION_ENABLED", "false").lower() == "true"
 
+# The defaults never change at runtime, so /defaults serves pre-encoded JSON
+_DEFAULTS_JSON = json.dumps({
+    "tokens": {category: dict(tokens) for category, tokens in SHADCN_DEFAULTS.items()},
+    "source": "shadcn/ui",
+    "description": "Default design tokens used as fallbacks"
+}).encode("utf-8")
+
 
 @router.post("/extract/screenshot")
 async def extract_tokens_from_screenshot(
@@ -78,13 +87,11 @@ async def extract_tokens_from_screenshot(
                 detail=str(e)
             )
         
-        # Read file contents (re-read after validation)
-        contents = await file.read()
-        
-        # Step 2: Process image using existing processor
+        # Step 2: Process image using existing processor, reading the
+        # spooled upload in place rather than copying it to bytes
         try:
             image, metadata = validate_and_process_image(
-                contents,
+                file.file,
                 mime_type=file.content_type
             )
             logger.info(
@@ -170,17 +177,11 @@ async def extract_tokens_from_screenshot(
         await file.close()
 
 
-@router.get("/defaults")
-async def get_default_tokens() -> Dict[str, Any]:
+@router.get("/defaults", response_class=Response)
+async def get_default_tokens() -> Response:
     """Get shadcn/ui default design tokens.
     
     Returns:
         JSON response with default tokens
     """
-    from ....core.defaults import SHADCN_DEFAULTS
-    
-    return {
-        "tokens": SHADCN_DEFAULTS,
-        "source": "shadcn/ui",
-        "description": "Default design tokens used as fallbacks"
-    }
+    return Response(content=_DEFAULTS_JSON, media_type="application/json")
@@ -1,5 +1,6 @@
 """Cache package for application-level caching."""
 
-__all__ = ["FigmaCache"]
+__all__ = ["FigmaCache", "get_figma_cache", "ProposalCache", "get_proposal_cache"]
 
-from .figma_cache import FigmaCache
+from .figma_cache import FigmaCache, get_figma_cache
+from .proposal_cache import ProposalCache, get_proposal_cache
@@ -1,6 +1,7 @@
 """Figma API response caching with metrics tracking."""
 
 from typing import Optional
+import asyncio
 import time
 
 from src.core.cache import BaseCache
@@ -42,7 +43,7 @@ class FigmaCache(BaseCache):
 
         Args:
             file_key: Figma file key
-            metric: Metric type (hits, misses, latency)
+            metric: Metric type (hits, misses, latency_stats)
 
         Returns:
             Metrics key string
@@ -105,10 +106,11 @@ class FigmaCache(BaseCache):
             Number of keys deleted
         """
         pattern = f"{self.cache_prefix}:{file_key}:*"
-        deleted = await self.delete_pattern(pattern)
-        
-        # Also clear metrics for this file
-        await self._clear_metrics(file_key)
+
+        # Also clear metrics for this file, concurrently
+        deleted, _ = await asyncio.gather(
+            self.delete_pattern(pattern), self._clear_metrics(file_key)
+        )
         
         logger.info(f"Invalidated cache for Figma file {file_key}: {deleted} keys")
         return deleted
@@ -121,24 +123,28 @@ class FigmaCache(BaseCache):
             file_key: Figma file key
             latency: Response latency in seconds
         """
-        hits_key = self._build_metrics_key(file_key, "hits")
-        latency_key = self._build_metrics_key(file_key, "latency")
+        if not self.config.enabled:
+            return
 
-        # Increment hit counter (1 hour TTL)
-        await self.incr(hits_key, ttl=3600)
+        hits_key = self._build_metrics_key(file_key, "hits")
+        latency_key = self._build_metrics_key(file_key, "latency_stats")
 
-        # Track latency (simple moving average approach)
-        # Store as milliseconds for better readability
+        # Track latency as a running sum and count (in milliseconds) so the
+        # average is read back without fetching individual samples
         latency_ms = int(latency * 1000)
-        if self.config.enabled:
-            try:
-                from src.core.cache import get_redis
-                async with get_redis() as redis:
-                    await redis.rpush(latency_key, str(latency_ms))
-                    await redis.ltrim(latency_key, -100, -1)  # Keep last 100 samples
-                    await redis.expire(latency_key, 3600)
-            except Exception as e:
-                logger.error(f"Error tracking latency: {e}")
+        try:
+            from src.core.cache import get_redis
+            async with get_redis() as redis:
+                # Counter and latency updates in one round trip
+                pipe = redis.pipeline(transaction=False)
+                pipe.incr(hits_key)
+                pipe.expire(hits_key, 3600)  # 1 hour TTL
+                pipe.hincrby(latency_key, "sum", latency_ms)
+                pipe.hincrby(latency_key, "count", 1)
+                pipe.expire(latency_key, 3600)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error tracking cache hit: {e}")
 
     async def _track_miss(self, file_key: str):
         """
@@ -147,8 +153,19 @@ class FigmaCache(BaseCache):
         Args:
             file_key: Figma file key
         """
+        if not self.config.enabled:
+            return
+
         misses_key = self._build_metrics_key(file_key, "misses")
-        await self.incr(misses_key, ttl=3600)
+        try:
+            from src.core.cache import get_redis
+            async with get_redis() as redis:
+                pipe = redis.pipeline(transaction=False)
+                pipe.incr(misses_key)
+                pipe.expire(misses_key, 3600)  # 1 hour TTL
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error tracking cache miss: {e}")
 
     async def _clear_metrics(self, file_key: str):
         """
@@ -172,23 +189,30 @@ class FigmaCache(BaseCache):
         """
         hits_key = self._build_metrics_key(file_key, "hits")
         misses_key = self._build_metrics_key(file_key, "misses")
-        latency_key = self._build_metrics_key(file_key, "latency")
-
-        hits = await self.get_int(hits_key) or 0
-        misses = await self.get_int(misses_key) or 0
-        total = hits + misses
+        latency_key = self._build_metrics_key(file_key, "latency_stats")
 
-        # Calculate average latency from samples
+        hits = misses = 0
         avg_latency_ms = 0.0
         if self.config.enabled:
             try:
                 from src.core.cache import get_redis
                 async with get_redis() as redis:
-                    latency_samples = await redis.lrange(latency_key, 0, -1)
-                    if latency_samples:
-                        avg_latency_ms = sum(int(s) for s in latency_samples) / len(latency_samples)
+                    # Counters and latency totals in one round trip
+                    pipe = redis.pipeline(transaction=False)
+                    pipe.get(hits_key)
+                    pipe.get(misses_key)
+                    pipe.hmget(latency_key, "sum", "count")
+                    hits_value, misses_value, (latency_sum, latency_count) = (
+                        await pipe.execute()
+                    )
+
+                hits = int(hits_value) if hits_value else 0
+                misses = int(misses_value) if misses_value else 0
+                if latency_count:
+                    avg_latency_ms = int(latency_sum) / int(latency_count)
             except Exception as e:
-                logger.error(f"Error calculating average latency: {e}")
+                logger.error(f"Error reading cache metrics: {e}")
+        total = hits + misses
 
         return {
             "file_key": file_key,
@@ -214,3 +238,16 @@ class FigmaCache(BaseCache):
             "ttl_seconds": self.ttl,
             "message": "Use get_hit_rate(file_key) for per-file metrics",
         }
+
+
+# Shared instance; FigmaCache holds no connections of its own (Redis access
+# goes through the pooled get_redis), so one instance serves every request
+_shared_cache: Optional[FigmaCache] = None
+
+
+def get_figma_cache() -> FigmaCache:
+    """Get the shared FigmaCache singleton."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = FigmaCache()
+    return _shared_cache
@@ -0,0 +1,105 @@
+"""Requirement proposal caching keyed by request content."""
+
+from typing import Optional
+
+from src.core.cache import BaseCache
+from src.core.logging import get_logger
+from src.cache.vision_cache import PROMPT_VERSION
+from src.types.requirement_types import RequirementState, new_proposal_id
+
+logger = get_logger(__name__)
+
+
+class ProposalCache(BaseCache):
+    """Cache for complete requirement proposal results.
+
+    Users often re-upload the same screenshot while iterating, so finished
+    orchestrator states are stored by a digest of the image bytes and form
+    fields and served without running the proposal agents again.
+    """
+
+    def __init__(self, ttl: int = 3600):
+        """
+        Initialize proposal cache.
+
+        Args:
+            ttl: Time-to-live in seconds (default: 1 hour)
+        """
+        super().__init__(ttl=ttl)
+        self.cache_prefix = "requirements:proposal"
+
+    def _build_key(self, request_key: str) -> str:
+        """
+        Build cache key for a proposal request.
+
+        Args:
+            request_key: Request fingerprint (image and form field digest)
+
+        Returns:
+            Cache key string; includes PROMPT_VERSION so prompt changes
+            invalidate earlier results
+        """
+        return f"{self.cache_prefix}:{PROMPT_VERSION}:{request_key}"
+
+    async def get_state(self, request_key: str) -> Optional[RequirementState]:
+        """
+        Get a cached proposal result.
+
+        Proposals are given fresh IDs, as when they are re-parsed from the
+        vision cache, so two responses never share proposal IDs.
+
+        Args:
+            request_key: Request fingerprint
+
+        Returns:
+            Cached RequirementState, or None on a miss
+        """
+        cached = await self.get(self._build_key(request_key))
+        if cached is None:
+            return None
+        try:
+            state = RequirementState.model_validate(cached)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached proposal {request_key}: {e}")
+            return None
+        return state.model_copy(update={
+            field: [
+                p.model_copy(update={"id": new_proposal_id(p.category, p.name)})
+                for p in getattr(state, field)
+            ]
+            for field in (
+                "props_proposals",
+                "events_proposals",
+                "states_proposals",
+                "accessibility_proposals",
+            )
+        })
+
+    async def set_state(
+        self, request_key: str, state: RequirementState, ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache a proposal result.
+
+        Args:
+            request_key: Request fingerprint
+            state: Completed orchestrator state
+            ttl: Optional TTL override
+
+        Returns:
+            True if successful
+        """
+        return await self.set(
+            self._build_key(request_key), state.model_dump(mode="json"), ttl
+        )
+
+
+_shared_cache: Optional[ProposalCache] = None
+
+
+def get_proposal_cache() -> ProposalCache:
+    """Get the shared ProposalCache singleton."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ProposalCache()
+    return _shared_cache
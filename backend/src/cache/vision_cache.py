@@ -0,0 +1,157 @@
+"""In-process cache for deterministic vision API responses.
+
+Only greedy requests (temperature=0, with a seed derived from the image) are
+cached, so an identical (model, prompt, image) request returns the same
+completion. Sampled requests such as event proposals bypass the cache.
+Repeated requests (dev/test loops, re-uploads) are served from a bounded LRU
+of raw response text instead of calling the API again. When diskcache is
+installed and VISION_CACHE_DIR is set, responses are also persisted on disk
+so they survive restarts and CI runs.
+"""
+
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional
+
+from src.core.logging import get_logger
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Bump whenever prompts, response schemas or parsing change in a way that
+# makes previously cached responses invalid
+PROMPT_VERSION = "2"
+
+
+def image_seed(image_url: str) -> int:
+    """Derive a stable sampling seed from an encoded image.
+
+    Args:
+        image_url: Base64 data URL sent to the vision API
+
+    Returns:
+        Non-negative 31-bit seed
+    """
+    digest = hashlib.blake2b(image_url.encode(), digest_size=8).hexdigest()
+    return int(digest, 16) & 0x7FFFFFFF
+
+
+class VisionResponseCache:
+    """Vision API response text keyed by request content.
+
+    A bounded in-memory LRU sits in front of an optional disk cache. Disk
+    reads and writes run in a worker thread so SQLite I/O never blocks the
+    event loop.
+    """
+
+    def __init__(self, maxsize: int = 256, directory: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept in memory
+            directory: Disk cache directory (defaults to VISION_CACHE_DIR env
+                var); an empty or unset value disables the disk tier
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        if directory is None:
+            directory = os.getenv("VISION_CACHE_DIR", "")
+        self.directory = directory
+        self._disk = None
+        self._disk_failed = False
+
+    def _get_disk(self):
+        """Lazily open the disk cache, or return None if unavailable."""
+        if self._disk is None and not self._disk_failed:
+            if not DISKCACHE_AVAILABLE or not self.directory:
+                self._disk_failed = True
+                return None
+            try:
+                self._disk = diskcache.Cache(self.directory)
+            except Exception as e:
+                logger.warning(f"Vision disk cache unavailable: {e}")
+                self._disk_failed = True
+        return self._disk
+
+    async def _disk_tier(self):
+        """Return the disk cache, opening it in a worker thread on first use."""
+        if self._disk is None and not self._disk_failed:
+            await asyncio.to_thread(self._get_disk)
+        return self._disk
+
+    @staticmethod
+    def build_key(
+        model: str, prompt: str, image_url: str, detail: Optional[str] = None
+    ) -> str:
+        """
+        Build cache key for a vision request.
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            image_url: Base64 data URL of the image
+            detail: Vision detail level, if set on the request
+
+        Returns:
+            Cache key string
+        """
+        image_hash = hashlib.sha256(image_url.encode()).hexdigest()
+        prompt_hash = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        return f"{image_hash}:{PROMPT_VERSION}:{model}:{detail or 'auto'}:{prompt_hash}"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return cached response text, or None on a miss."""
+        content = self._entries.get(key)
+        if content is not None:
+            self._entries.move_to_end(key)
+            logger.debug(f"Vision response cache hit: {key}")
+            return content
+
+        disk = await self._disk_tier()
+        if disk is None:
+            return None
+        try:
+            content = await asyncio.to_thread(disk.get, key)
+        except Exception as e:
+            logger.warning(f"Vision disk cache read failed: {e}")
+            return None
+        if content is not None:
+            logger.debug(f"Vision response disk cache hit: {key}")
+            self._remember(key, content)
+        return content
+
+    async def set(self, key: str, content: str) -> None:
+        """Store response text in memory and, if enabled, on disk."""
+        self._remember(key, content)
+        disk = await self._disk_tier()
+        if disk is not None:
+            try:
+                await asyncio.to_thread(disk.set, key, content)
+            except Exception as e:
+                logger.warning(f"Vision disk cache write failed: {e}")
+
+    def _remember(self, key: str, content: str) -> None:
+        """Add to the in-memory LRU, evicting the least recently used entry."""
+        self._entries[key] = content
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses, including those on disk."""
+        self._entries.clear()
+        disk = self._get_disk()
+        if disk is not None:
+            disk.clear()
+
+
+# Shared by the classifier and proposers
+vision_response_cache = VisionResponseCache()
@@ -20,6 +20,9 @@ class CacheConfig:
         self.enabled = os.getenv("CACHE_ENABLED", "true").lower() == "true"
 
 
+# Keys requested per SCAN call when deleting by pattern
+SCAN_BATCH_SIZE = 500
+
 # Global connection pool
 _connection_pool: Optional[ConnectionPool] = None
 _config: Optional[CacheConfig] = None
@@ -166,13 +169,21 @@ class BaseCache:
             return 0
 
         try:
+            deleted = 0
             async with get_redis() as redis:
-                keys = await redis.keys(pattern)
-                if keys:
-                    deleted = await redis.delete(*keys)
-                    logger.debug(f"Cache delete pattern: {pattern} ({deleted} keys)")
-                    return deleted
-                return 0
+                # SCAN in batches rather than KEYS, which blocks Redis while it
+                # walks the whole keyspace; UNLINK frees values in the background
+                cursor = 0
+                while True:
+                    cursor, keys = await redis.scan(
+                        cursor, match=pattern, count=SCAN_BATCH_SIZE
+                    )
+                    if keys:
+                        deleted += await redis.unlink(*keys)
+                    if not cursor:
+                        break
+            logger.debug(f"Cache delete pattern: {pattern} ({deleted} keys)")
+            return deleted
         except Exception as e:
             logger.error(f"Cache delete pattern error for {pattern}: {e}")
             return 0
@@ -1,6 +1,11 @@
 import os
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+)
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import create_engine
 from sqlalchemy.pool import StaticPool
@@ -108,6 +113,22 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             logger.debug("Database session closed")
 
 
+async def get_async_connection() -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Dependency function to get a pooled connection for read-only queries.
+
+    Skips Session construction and identity-map bookkeeping; use it for
+    handlers that only run SELECTs and never add or modify ORM objects.
+
+    Usage in FastAPI:
+        @app.get("/endpoint")
+        async def endpoint(conn: AsyncConnection = Depends(get_async_connection)):
+            # Use conn.execute(...)
+    """
+    async with engine.connect() as conn:
+        yield conn
+
+
 async def init_database():
     """Initialize database - create all tables."""
     try:
@@ -1,9 +1,10 @@
 """Shadcn/ui default design token fallbacks."""
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 # Default design tokens from shadcn/ui with semantic naming
-SHADCN_DEFAULTS: Dict[str, Any] = {
+_SHADCN_DEFAULTS: Dict[str, Dict[str, Any]] = {
     "colors": {
         "primary": "#3B82F6",
         "secondary": "#64748B",
@@ -56,6 +57,22 @@ SHADCN_DEFAULTS: Dict[str, Any] = {
     },
 }
 
+# Read-only view shared by every caller, so a fallback value cannot be
+# changed for the whole process by mutating a returned category
+SHADCN_DEFAULTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    category: MappingProxyType(tokens)
+    for category, tokens in _SHADCN_DEFAULTS.items()
+})
+
+# (category, token name) -> value, for single-lookup access
+_DEFAULTS_BY_KEY: Dict[Tuple[str, str], Any] = {
+    (category, name): value
+    for category, tokens in _SHADCN_DEFAULTS.items()
+    for name, value in tokens.items()
+}
+
+_EMPTY_CATEGORY: Mapping[str, Any] = MappingProxyType({})
+
 
 def get_default_token(category: str, token_name: str) -> Any:
     """Get a default token value by category and name.
@@ -67,18 +84,16 @@ def get_default_token(category: str, token_name: str) -> Any:
     Returns:
         Default token value or None if not found
     """
-    if category in SHADCN_DEFAULTS:
-        return SHADCN_DEFAULTS[category].get(token_name)
-    return None
+    return _DEFAULTS_BY_KEY.get((category, token_name))
 
 
-def get_defaults_for_category(category: str) -> Dict[str, Any]:
+def get_defaults_for_category(category: str) -> Mapping[str, Any]:
     """Get all default tokens for a category.
     
     Args:
         category: Token category
         
     Returns:
-        Dictionary of default tokens for the category
+        Read-only mapping of default tokens for the category
     """
-    return SHADCN_DEFAULTS.get(category, {})
+    return SHADCN_DEFAULTS.get(category, _EMPTY_CATEGORY)
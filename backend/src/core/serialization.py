@@ -0,0 +1,37 @@
+"""JSON helpers backed by orjson when it is installed.
+
+orjson is a SIMD-accelerated parser that returns the same dicts as the stdlib
+json module, and its JSONDecodeError subclasses the stdlib one, so callers can
+catch json.JSONDecodeError either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def json_cache_key(obj: Any) -> bytes:
+        """Serialize obj with sorted keys, for use as a hashable cache key."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def json_cache_key(obj: Any) -> bytes:
+        """Serialize obj with sorted keys, for use as a hashable cache key."""
+        return json.dumps(obj, sort_keys=True).encode("utf-8")
@@ -7,7 +7,8 @@ enabling observability for AI operations throughout the application.
 import asyncio
 import os
 from datetime import datetime
-from functools import wraps
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from typing import Any, Dict, Optional
 
 from .logging import get_logger
@@ -15,17 +16,32 @@ from .logging import get_logger
 logger = get_logger(__name__)
 
 
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").lower() == "true"
+
+
+@dataclass(frozen=True, slots=True)
 class TracingConfig:
-    """LangSmith tracing configuration."""
-
-    def __init__(self):
-        """Initialize tracing configuration from environment variables."""
-        self.enabled = os.getenv("LANGCHAIN_TRACING_V2", "false").lower() == "true"
-        self.api_key = os.getenv("LANGCHAIN_API_KEY")
-        self.project = os.getenv("LANGCHAIN_PROJECT", "componentforge-dev")
-        self.endpoint = os.getenv(
+    """LangSmith tracing configuration.
+
+    Fields default to the environment variables; ``configured`` is derived
+    once at construction so traced calls check a plain attribute.
+    """
+
+    enabled: bool = field(default_factory=lambda: _env_flag("LANGCHAIN_TRACING_V2"))
+    api_key: Optional[str] = field(default_factory=lambda: os.getenv("LANGCHAIN_API_KEY"))
+    project: str = field(
+        default_factory=lambda: os.getenv("LANGCHAIN_PROJECT", "componentforge-dev")
+    )
+    endpoint: str = field(
+        default_factory=lambda: os.getenv(
             "LANGCHAIN_ENDPOINT", "https://api.smith.langchain.com"
         )
+    )
+    configured: bool = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "configured", self.enabled and bool(self.api_key))
 
     def is_configured(self) -> bool:
         """Check if tracing is properly configured.
@@ -33,7 +49,7 @@ class TracingConfig:
         Returns:
             bool: True if tracing is enabled and API key is set
         """
-        return self.enabled and bool(self.api_key)
+        return self.configured
 
     def get_config(self) -> dict:
         """Get tracing configuration as dictionary.
@@ -49,20 +65,16 @@ class TracingConfig:
         }
 
 
-# Global tracing configuration instance
-_tracing_config: Optional[TracingConfig] = None
-
-
+@lru_cache(maxsize=1)
 def get_tracing_config() -> TracingConfig:
     """Get or create the global tracing configuration instance.
 
+    Call ``get_tracing_config.cache_clear()`` to re-read the environment.
+
     Returns:
         TracingConfig: The global tracing configuration instance
     """
-    global _tracing_config
-    if _tracing_config is None:
-        _tracing_config = TracingConfig()
-    return _tracing_config
+    return TracingConfig()
 
 
 def init_tracing() -> bool:
@@ -120,8 +132,7 @@ def traced(run_name: Optional[str] = None, metadata: Optional[Dict[str, Any]] =
     def decorator(func):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            config = get_tracing_config()
-            if not config.is_configured():
+            if not get_tracing_config().configured:
                 # If tracing not configured, just run the function normally
                 return await func(*args, **kwargs)
 
@@ -147,8 +158,7 @@ def traced(run_name: Optional[str] = None, metadata: Optional[Dict[str, Any]] =
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            config = get_tracing_config()
-            if not config.is_configured():
+            if not get_tracing_config().configured:
                 return func(*args, **kwargs)
 
             try:
@@ -239,6 +249,25 @@ def get_current_run_id() -> Optional[str]:
         return None
 
 
+def add_trace_metadata(metadata: Dict[str, Any]) -> None:
+    """Attach metadata to the current LangSmith run, if any.
+
+    Args:
+        metadata: Fields to merge into the run's metadata
+
+    Note:
+        A no-op outside a traced call or when LangSmith is unavailable.
+    """
+    try:
+        from langsmith.run_helpers import get_current_run_tree
+
+        run_tree = get_current_run_tree()
+        if run_tree:
+            run_tree.add_metadata(metadata)
+    except Exception:
+        pass
+
+
 def get_trace_url(run_id: str) -> Optional[str]:
     """Get the LangSmith URL for a specific trace run.
 
@@ -27,6 +27,7 @@ from ..retrieval.semantic_retriever import SemanticRetriever
 from ..retrieval.query_builder import QueryBuilder
 from ..retrieval.weighted_fusion import WeightedFusion
 from ..retrieval.explainer import RetrievalExplainer
+from ..services.openai_client import get_openai_client
 from ..generation.generator_service import GeneratorService
 from ..generation.types import GenerationRequest
 from ..core.logging import get_logger
@@ -79,12 +80,11 @@ class E2EEvaluator:
         semantic_retriever = None
         try:
             from qdrant_client import QdrantClient
-            from openai import AsyncOpenAI
             
             # Initialize clients
             qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
             qdrant_client = QdrantClient(url=qdrant_url)
-            openai_client = AsyncOpenAI(api_key=api_key)
+            openai_client = get_openai_client(api_key)
             
             semantic_retriever = SemanticRetriever(
                 qdrant_client=qdrant_client,
@@ -7,9 +7,12 @@ code assembly, with LangSmith tracing for observability.
 REFACTORED (Epic 4.5): Now uses LLM-first 3-stage pipeline instead of 8-stage template-based approach.
 """
 
+import asyncio
 import time
 import os
-from typing import Dict, Any, Optional, List
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, List
 from pathlib import Path
 
 # Try to import LangSmith for tracing (optional dependency)
@@ -28,6 +31,7 @@ from .types import (
     GenerationRequest,
     GenerationResult,
     GenerationStage,
+    GenerationProgress,
     GenerationMetadata,
     ValidationMetadata,
     ValidationErrorDetail,
@@ -43,6 +47,9 @@ from .llm_generator import LLMComponentGenerator, MockLLMGenerator
 from .code_validator import CodeValidator
 from .exemplar_loader import ExemplarLoader
 
+# Number of recent runs whose progress stays available for polling
+MAX_TRACKED_RUNS = 256
+
 
 class GeneratorService:
     """
@@ -97,9 +104,9 @@ class GeneratorService:
             skip_eslint=True  # Skip ESLint - TypeScript validation covers all important checks
         )
         
-        # Track current stage for progress updates
-        self.current_stage = GenerationStage.LLM_GENERATING
-        self.stage_latencies: Dict[GenerationStage, int] = {}
+        # Per-run progress keyed by generation ID, so concurrent generate()
+        # calls on this shared service never see each other's stages
+        self.runs: "OrderedDict[str, GenerationProgress]" = OrderedDict()
     
     def _normalize_requirements(self, requirements: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -132,7 +139,12 @@ class GeneratorService:
         return result
 
     @traceable(run_type="chain", name="generate_component_llm_first")
-    async def generate(self, request: GenerationRequest) -> GenerationResult:
+    async def generate(
+        self,
+        request: GenerationRequest,
+        generation_id: Optional[str] = None,
+        on_stage: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> GenerationResult:
         """
         Generate component code using LLM-first 3-stage pipeline.
         
@@ -143,71 +155,91 @@ class GeneratorService:
         
         Args:
             request: GenerationRequest with pattern_id, tokens, requirements
+            generation_id: Optional ID to track progress under (generated
+                if not provided)
+            on_stage: Optional callback receiving a {"stage", "elapsed_ms"}
+                event as each stage starts, for streaming progress
         
         Returns:
             GenerationResult with generated code and metadata
         """
         start_time = time.time()
+        run = self._start_run(generation_id or uuid.uuid4().hex)
         
         # Normalize requirements from list to dict format
         requirements_dict = self._normalize_requirements(request.requirements)
         
         try:
             # ====== STAGE 1: LLM GENERATION ======
-            self.current_stage = GenerationStage.LLM_GENERATING
+            self._enter_stage(run, GenerationStage.LLM_GENERATING, start_time, on_stage)
             stage1_start = time.time()
 
             # Load pattern as reference
             pattern_structure = await self._parse_pattern_for_reference(request.pattern_id)
+            component_name = request.component_name or pattern_structure.component_name
 
-            # Build comprehensive prompt with exemplars
-            prompts = self._build_generation_prompt(
-                pattern_code=pattern_structure.code,
-                component_name=request.component_name or pattern_structure.component_name,
-                component_type=self._infer_component_type(request.pattern_id),
-                tokens=request.tokens,
-                requirements=requirements_dict,
-            )
+            # Provenance only depends on the request, so hash the
+            # tokens/requirements in a worker thread while the LLM runs
+            provenance_task = asyncio.create_task(asyncio.to_thread(
+                self._build_provenance,
+                component_name,
+                request.pattern_id,
+                request.tokens,
+                requirements_dict,
+            ))
+
+            try:
+                # Build comprehensive prompt with exemplars
+                prompts = self._build_generation_prompt(
+                    pattern_code=pattern_structure.code,
+                    component_name=component_name,
+                    component_type=self._infer_component_type(request.pattern_id),
+                    tokens=request.tokens,
+                    requirements=requirements_dict,
+                )
             
-            # Generate code via LLM
-            llm_result = await self.llm_generator.generate(
-                system_prompt=prompts["system"],
-                user_prompt=prompts["user"],
-            )
+                # Generate code via LLM
+                llm_result = await self.llm_generator.generate(
+                    system_prompt=prompts["system"],
+                    user_prompt=prompts["user"],
+                )
             
-            self.stage_latencies[GenerationStage.LLM_GENERATING] = int(
-                (time.time() - stage1_start) * 1000
-            )
+                run.stage_latencies[GenerationStage.LLM_GENERATING] = int(
+                    (time.time() - stage1_start) * 1000
+                )
             
-            # ====== STAGE 2: VALIDATION ======
-            self.current_stage = GenerationStage.VALIDATING
-            stage2_start = time.time()
+                # ====== STAGE 2: VALIDATION ======
+                self._enter_stage(run, GenerationStage.VALIDATING, start_time, on_stage)
+                stage2_start = time.time()
 
-            # Store original showcase before validation (to preserve it)
-            original_showcase_code = llm_result.showcase_code
+                # Store original showcase before validation (to preserve it)
+                original_showcase_code = llm_result.showcase_code
 
-            # Validate and fix code iteratively (only validates component_code)
-            validation_result = await self.code_validator.validate_and_fix(
-                code=llm_result.component_code,
-                original_prompt=prompts["user"],
-            )
+                # Validate and fix code iteratively (only validates component_code)
+                validation_result = await self.code_validator.validate_and_fix(
+                    code=llm_result.component_code,
+                    original_prompt=prompts["user"],
+                )
 
-            self.stage_latencies[GenerationStage.VALIDATING] = int(
-                (time.time() - stage2_start) * 1000
-            )
+                run.stage_latencies[GenerationStage.VALIDATING] = int(
+                    (time.time() - stage2_start) * 1000
+                )
+            except BaseException:
+                # Don't leave the provenance hash running, or its error
+                # unretrieved, when an earlier stage fails
+                if provenance_task.done():
+                    provenance_task.exception()
+                else:
+                    provenance_task.cancel()
+                raise
             
             # ====== STAGE 3: POST-PROCESSING ======
-            self.current_stage = GenerationStage.POST_PROCESSING
+            self._enter_stage(run, GenerationStage.POST_PROCESSING, start_time, on_stage)
             stage3_start = time.time()
             
             # Add provenance header
-            final_component_code = self._add_provenance(
-                validation_result.code,
-                request.component_name or pattern_structure.component_name,
-                request.pattern_id,
-                request.tokens,
-                requirements_dict,
-            )
+            provenance = await provenance_task
+            final_component_code = f"{provenance['header']}\n\n{validation_result.code}"
             
             # Use stories from LLM (already validated)
             final_stories_code = llm_result.stories_code
@@ -222,15 +254,14 @@ class GeneratorService:
             # Count tokens applied (from request.tokens) - count actual nested values, not just categories
             token_count = self._count_nested_tokens(request.tokens) if request.tokens else 0
 
-            self.stage_latencies[GenerationStage.POST_PROCESSING] = int(
+            run.stage_latencies[GenerationStage.POST_PROCESSING] = int(
                 (time.time() - stage3_start) * 1000
             )
 
             # ====== BUILD RESULT ======
-            self.current_stage = GenerationStage.COMPLETE
+            self._enter_stage(run, GenerationStage.COMPLETE, start_time, on_stage)
 
             total_latency_ms = int((time.time() - start_time) * 1000)
-            component_name = request.component_name or pattern_structure.component_name
 
             # Generate App.tsx template for auto-discovery showcase
             app_tsx_template = self._generate_app_tsx_template()
@@ -277,11 +308,13 @@ class GeneratorService:
             
             metadata = GenerationMetadata(
                 latency_ms=total_latency_ms,
-                stage_latencies=self.stage_latencies,
+                stage_latencies=dict(run.stage_latencies),
                 lines_of_code=len(final_component_code.split('\n')) + len(final_stories_code.split('\n')),
                 requirements_implemented=len(request.requirements),
                 pattern_used=request.pattern_id,
                 pattern_version="1.0.0",
+                tokens_hash=provenance["tokens_hash"],
+                requirements_hash=provenance["requirements_hash"],
                 token_count=token_count,
                 imports_count=imports_count,
                 has_typescript_errors=len(ts_errors) > 0,
@@ -315,6 +348,7 @@ class GeneratorService:
                 validation_results=validation_metadata,
                 success=validation_result.valid,
                 error=None if validation_result.valid else "Code validation failed after retries",
+                generation_id=run.generation_id,
             )
         
         except Exception as e:
@@ -327,40 +361,41 @@ class GeneratorService:
                 files={},
                 metadata=GenerationMetadata(
                     latency_ms=error_latency_ms,
-                    stage_latencies=self.stage_latencies,
+                    stage_latencies=dict(run.stage_latencies),
                 ),
                 success=False,
                 error=str(e),
+                generation_id=run.generation_id,
             )
     
     @traceable(run_type="tool", name="parse_pattern")
-    async def _parse_pattern(self, pattern_id: str):
+    async def _parse_pattern(self, pattern_id: str, run: GenerationProgress):
         """Parse pattern and track latency."""
-        self.current_stage = GenerationStage.PARSING
+        run.current_stage = GenerationStage.PARSING
         stage_start = time.time()
         
         try:
             result = self.pattern_parser.parse(pattern_id)
             return result
         finally:
-            self.stage_latencies[GenerationStage.PARSING] = int(
+            run.stage_latencies[GenerationStage.PARSING] = int(
                 (time.time() - stage_start) * 1000
             )
     
     @traceable(run_type="tool", name="assemble_code")
-    async def _assemble_code(self, code_parts: CodeParts):
+    async def _assemble_code(self, code_parts: CodeParts, run: GenerationProgress):
         """Assemble and format code, track latency."""
-        self.current_stage = GenerationStage.ASSEMBLING
+        run.current_stage = GenerationStage.ASSEMBLING
         stage_start = time.time()
         
         try:
             result = await self.code_assembler.assemble(code_parts)
             return result
         finally:
-            self.stage_latencies[GenerationStage.ASSEMBLING] = int(
+            run.stage_latencies[GenerationStage.ASSEMBLING] = int(
                 (time.time() - stage_start) * 1000
             )
-            self.current_stage = GenerationStage.COMPLETE
+            run.current_stage = GenerationStage.COMPLETE
     
     def _generate_basic_story(self, component_name: str) -> str:
         """Generate basic Storybook story (full implementation in P5)."""
@@ -453,7 +488,8 @@ export default function App() {
     
     async def _parse_pattern_for_reference(self, pattern_id: str):
         """Load pattern as reference (not for modification)."""
-        return self.pattern_parser.parse(pattern_id)
+        # File read + JSON parse; keep it off the event loop
+        return await asyncio.to_thread(self.pattern_parser.parse, pattern_id)
     
     def _build_generation_prompt(
         self,
@@ -477,23 +513,34 @@ export default function App() {
             requirements=requirements,
         )
     
-    def _add_provenance(
+    def _build_provenance(
         self,
-        code: str,
         component_name: str,
         pattern_id: str,
         tokens: Dict[str, Any],
         requirements: Dict[str, Any],
-    ) -> str:
-        """Add provenance header to generated code."""
+    ) -> Dict[str, str]:
+        """Hash tokens and requirements and build the provenance header.
+
+        Returns:
+            Dict with 'header', 'tokens_hash' and 'requirements_hash'
+        """
+        tokens_hash = self.provenance_generator._hash_content(tokens)
+        requirements_hash = self.provenance_generator._hash_content(requirements)
         header = self.provenance_generator.generate_header(
             component_name=component_name,
             pattern_id=pattern_id,
             tokens=tokens,
             requirements=requirements,
+            tokens_hash=tokens_hash,
+            requirements_hash=requirements_hash,
         )
-        return f"{header}\n\n{code}"
-    
+        return {
+            "header": header,
+            "tokens_hash": tokens_hash,
+            "requirements_hash": requirements_hash,
+        }
+
     def _infer_component_type(self, pattern_id: str) -> str:
         """Infer component type from pattern ID."""
         # Extract type from pattern ID (e.g., "shadcn-button" -> "button")
@@ -529,10 +576,40 @@ export default function App() {
                 count += sum(1 for v in category_value.values() if v is not None)
         return count
 
-    def get_current_stage(self) -> GenerationStage:
-        """Get current generation stage for progress tracking."""
-        return self.current_stage
+    def _start_run(self, generation_id: str) -> GenerationProgress:
+        """Register progress tracking for a new run, evicting the oldest."""
+        run = GenerationProgress(generation_id=generation_id)
+        self.runs[generation_id] = run
+        self.runs.move_to_end(generation_id)
+        while len(self.runs) > MAX_TRACKED_RUNS:
+            self.runs.popitem(last=False)
+        return run
+
+    @staticmethod
+    def _enter_stage(
+        run: GenerationProgress,
+        stage: GenerationStage,
+        start_time: float,
+        on_stage: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> None:
+        """Record that a run entered a stage and notify any listener."""
+        run.current_stage = stage
+        if on_stage is not None:
+            on_stage({
+                "stage": stage.value,
+                "elapsed_ms": int((time.time() - start_time) * 1000),
+            })
+
+    def get_progress(self, generation_id: str) -> Optional[GenerationProgress]:
+        """Get progress for a run, or None if unknown or evicted."""
+        return self.runs.get(generation_id)
+
+    def get_current_stage(self, generation_id: str) -> Optional[GenerationStage]:
+        """Get current generation stage of a run for progress tracking."""
+        run = self.runs.get(generation_id)
+        return run.current_stage if run else None
     
-    def get_stage_latencies(self) -> Dict[GenerationStage, int]:
-        """Get latency for each stage."""
-        return self.stage_latencies.copy()
+    def get_stage_latencies(self, generation_id: str) -> Dict[GenerationStage, int]:
+        """Get latency for each completed stage of a run."""
+        run = self.runs.get(generation_id)
+        return dict(run.stage_latencies) if run else {}
@@ -14,7 +14,8 @@ import time
 
 # Try to import OpenAI and LangSmith (optional dependencies)
 try:
-    from openai import AsyncOpenAI
+    # openai_client imports the openai package, so this doubles as the probe
+    from src.services.openai_client import get_openai_client
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
@@ -84,7 +85,7 @@ class LLMComponentGenerator:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model = model
         self.max_retries = max_retries
         self.timeout = timeout
@@ -25,7 +25,9 @@ class ProvenanceGenerator:
         pattern_id: str,
         tokens: Dict[str, Any],
         requirements: Dict[str, Any],
-        component_name: Optional[str] = None
+        component_name: Optional[str] = None,
+        tokens_hash: Optional[str] = None,
+        requirements_hash: Optional[str] = None,
     ) -> str:
         """
         Generate provenance header comment with metadata.
@@ -35,6 +37,9 @@ class ProvenanceGenerator:
             tokens: Design tokens used in generation
             requirements: Requirements implemented
             component_name: Optional custom component name
+            tokens_hash: Precomputed hash of tokens (computed if omitted)
+            requirements_hash: Precomputed hash of requirements (computed if
+                omitted)
         
         Returns:
             Provenance header as a TypeScript comment block
@@ -43,8 +48,8 @@ class ProvenanceGenerator:
         timestamp = datetime.now(timezone.utc).isoformat()
         
         # Generate content hashes
-        tokens_hash = self._hash_content(tokens)
-        requirements_hash = self._hash_content(requirements)
+        tokens_hash = tokens_hash or self._hash_content(tokens)
+        requirements_hash = requirements_hash or self._hash_content(requirements)
         
         # Build header
         header_lines = [
@@ -74,23 +79,21 @@ class ProvenanceGenerator:
     
     def _hash_content(self, data: Dict[str, Any]) -> str:
         """
-        Generate SHA-256 hash of content for tracking changes.
+        Generate a content hash for tracking changes.
+
+        This is a content identifier, not a security boundary, so it uses
+        BLAKE2b with a 6-byte digest instead of truncating SHA-256.
         
         Args:
             data: Dictionary to hash
         
         Returns:
-            First 12 characters of SHA-256 hash (hex)
+            12-character hex digest
         """
         # Serialize data to JSON with sorted keys for deterministic hashing
         json_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
         
-        # Generate SHA-256 hash
-        hash_object = hashlib.sha256(json_str.encode('utf-8'))
-        hash_hex = hash_object.hexdigest()
-        
-        # Return first 12 characters for brevity
-        return hash_hex[:12]
+        return hashlib.blake2b(json_str.encode('utf-8'), digest_size=6).hexdigest()
     
     def extract_metadata(self, header: str) -> Optional[Dict[str, str]]:
         """
@@ -31,6 +31,12 @@ class GenerationRequest(BaseModel):
     tokens: Dict[str, Any] = Field(..., description="Design tokens from extraction")
     requirements: List[Dict[str, Any]] = Field(..., description="Approved requirements as array")
     component_name: Optional[str] = Field(None, description="Optional custom component name")
+    generation_id: Optional[str] = Field(
+        None,
+        max_length=64,
+        pattern=r"^[A-Za-z0-9_-]+$",
+        description="Optional client-chosen run ID, so /status can be polled while the run is in progress",
+    )
 
 
 class PatternStructure(BaseModel):
@@ -79,6 +85,8 @@ class GenerationMetadata(BaseModel):
     # Pattern metadata for provenance tracking
     pattern_used: str = Field(default="", description="Pattern ID used for generation")
     pattern_version: str = Field(default="1.0.0", description="Pattern version")
+    tokens_hash: Optional[str] = Field(None, description="Content hash of the design tokens")
+    requirements_hash: Optional[str] = Field(None, description="Content hash of the requirements")
     imports_count: int = Field(default=0, description="Number of imports in generated code")
     
     # Code quality indicators
@@ -167,3 +175,13 @@ class GenerationResult(BaseModel):
     
     # New LLM-first fields
     validation_results: Optional[ValidationMetadata] = Field(None, description="Validation results")
+    generation_id: Optional[str] = Field(None, description="ID for polling this run's progress")
+
+
+class GenerationProgress(BaseModel):
+    """Progress of a single generation run, tracked for status polling."""
+    generation_id: str = Field(..., description="Generation run ID")
+    current_stage: GenerationStage = Field(default=GenerationStage.LLM_GENERATING)
+    stage_latencies: Dict[GenerationStage, int] = Field(
+        default_factory=dict, description="Latency per completed stage in ms"
+    )
@@ -15,6 +15,8 @@ logger = get_logger(__name__)
 
 # Initialize LangSmith tracing for observability
 from .core.tracing import init_tracing
+from .services.openai_client import close_openai_clients, get_openai_client
+from .services.figma_client import close_figma_transport
 init_tracing()
 
 # Try to import optional packages with proper error handling
@@ -55,7 +57,20 @@ async def lifespan(app: FastAPI):
         logger.warning("OPENAI_API_KEY not set - token extraction will fail")
     else:
         logger.info("OpenAI API key configured")
-    
+
+        # Build the requirement orchestrator once; its agents hold no
+        # per-request state and share the pooled OpenAI client
+        try:
+            from .agents.requirement_orchestrator import RequirementOrchestrator
+
+            app.state.requirement_orchestrator = RequirementOrchestrator(
+                openai_api_key=api_key
+            )
+            logger.info("Requirement orchestrator initialized")
+        except Exception as e:
+            logger.error(f"Failed to initialize requirement orchestrator: {e}", exc_info=True)
+            logger.warning("Requirement proposal endpoints will return 503 Service Unavailable")
+
     # Verify Redis connection for rate limiting
     try:
         from redis.asyncio import Redis
@@ -116,13 +131,12 @@ async def lifespan(app: FastAPI):
         semantic_retriever = None
         try:
             from qdrant_client import QdrantClient
-            from openai import AsyncOpenAI
 
             # Initialize clients
             qdrant_client = QdrantClient(
                 url=os.getenv("QDRANT_URL", "http://localhost:6333")
             )
-            openai_client = AsyncOpenAI(api_key=api_key)
+            openai_client = get_openai_client(api_key)
 
             semantic_retriever = SemanticRetriever(
                 qdrant_client=qdrant_client,
@@ -158,6 +172,8 @@ async def lifespan(app: FastAPI):
 
     yield
     logger.info("Shutting down FastAPI application", extra={"extra": {"event": "shutdown"}})
+    await close_openai_clients()
+    await close_figma_transport()
 
 
 app = FastAPI(
@@ -0,0 +1,7 @@
+"""Prompt templates for the vision agents.
+
+Each template puts its static rubric first and the per-request values
+(component type, Figma context, design tokens) at the end, so the long,
+identical prefix is eligible for OpenAI's automatic prompt caching
+(>= 1024 tokens).
+"""
@@ -4,13 +4,11 @@ This module contains the prompt templates and examples for accessibility
 requirement detection using GPT-4V, focusing on WCAG 2.1 Level AA compliance.
 """
 
-# Main accessibility proposal prompt template
-ACCESSIBILITY_PROPOSAL_PROMPT = """Analyze this {component_type} component and propose accessibility requirements.
+# Main accessibility proposal prompt template.
+ACCESSIBILITY_PROPOSAL_PROMPT = """Analyze this UI component and propose accessibility requirements.
 
 You are an accessibility expert analyzing component screenshots. Your task is to identify WCAG 2.1 Level AA compliance requirements this component needs to be fully accessible to all users including those with disabilities.
 
-## Component Type: {component_type}
-
 ## Accessibility Requirements to Detect
 
 ### 1. aria-label (Screen Reader Text)
@@ -179,8 +177,6 @@ Alternative text descriptions for images.
 - Icons conveying meaning
 - Decorative images (use alt="")
 
-{figma_context}
-
 ## Few-Shot Examples
 
 ### Example 1: Icon-Only Close Button
@@ -417,9 +413,19 @@ Return a JSON object with this exact structure:
    - **Medium (0.70-0.84)**: Likely needed, best practice
    - **Low (< 0.70)**: Optional enhancement, skip
 
-Now analyze the provided component and return the JSON with WCAG 2.1 Level AA requirements.
+## Component Type: {component_type}
+
+{figma_context}Now analyze the provided component and return the JSON with WCAG 2.1 Level AA requirements.
 """
 
+# Pre-split static pieces of the template, built once at import time, so each
+# prompt is a join of a few fixed strings instead of a full str.format pass
+_A11Y_PREFIX, _A11Y_REST = ACCESSIBILITY_PROPOSAL_PROMPT.split("{component_type}")
+_A11Y_MIDDLE, _A11Y_SUFFIX = _A11Y_REST.split("{figma_context}")
+_A11Y_PREFIX = _A11Y_PREFIX.format()
+_A11Y_MIDDLE = _A11Y_MIDDLE.format()
+_A11Y_SUFFIX = _A11Y_SUFFIX.format()
+
 
 def create_accessibility_prompt(
     component_type: str,
@@ -452,9 +458,8 @@ def create_accessibility_prompt(
         
         figma_context += "\n"
     
-    return ACCESSIBILITY_PROPOSAL_PROMPT.format(
-        component_type=component_type,
-        figma_context=figma_context
+    return "".join(
+        (_A11Y_PREFIX, component_type, _A11Y_MIDDLE, figma_context, _A11Y_SUFFIX)
     )
 
 
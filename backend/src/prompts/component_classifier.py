@@ -4,7 +4,7 @@ This module contains the prompt templates and examples for component
 type classification using GPT-4V.
 """
 
-# Main classification prompt template
+# Main classification prompt template.
 COMPONENT_CLASSIFICATION_PROMPT = """Analyze this UI component and identify its type.
 
 You are an expert UI/UX designer analyzing component screenshots. Your task is to accurately classify the component type based on visual cues, layout patterns, and interactive elements.
@@ -78,8 +78,6 @@ You are an expert UI/UX designer analyzing component screenshots. Your task is t
    - Active tab shown with underline, different background, or border
    - **Key differentiator from Buttons**: Connected navigation bar, mutual exclusivity, underline/border styling
 
-{figma_context}
-
 ## Classification Guidelines
 
 1. **Visual Analysis**:
@@ -209,7 +207,26 @@ Now analyze the provided component image:
 7. Provide alternative candidates if ambiguous (confidence < 0.8)
 8. Write a clear rationale citing specific visual evidence
 
-Return only the JSON object, nothing else.
+{figma_context}Return only the JSON object, nothing else.
+"""
+
+# Batch variant: the same static rubric followed by instructions to classify
+# several attached images at once.
+BATCH_CLASSIFICATION_SUFFIX = """## Batch Mode
+
+You are given {count} component images. Classify each image independently, in the order they are attached, using the output format above for each one.
+
+Return a JSON object with this exact structure:
+
+```json
+{{
+  "classifications": [
+    {{"component_type": "...", "confidence": 0.0-1.0, "candidates": [...], "rationale": "..."}}
+  ]
+}}
+```
+
+The `classifications` array must contain exactly {count} objects, one per image, in order. Return only the JSON object, nothing else.
 """
 
 
@@ -250,5 +267,23 @@ def create_classification_prompt(figma_data: dict = None) -> str:
     return COMPONENT_CLASSIFICATION_PROMPT.format(figma_context=figma_context)
 
 
+def create_batch_classification_prompt(count: int) -> str:
+    """Create a prompt for classifying several images in one request.
+    
+    Args:
+        count: Number of images attached to the request
+        
+    Returns:
+        Formatted batch classification prompt
+    """
+    rubric = COMPONENT_CLASSIFICATION_PROMPT.split("{figma_context}")[0]
+    return rubric.format() + BATCH_CLASSIFICATION_SUFFIX.format(count=count)
+
+
 # Export prompt for use in classifier
-__all__ = ["COMPONENT_CLASSIFICATION_PROMPT", "create_classification_prompt"]
+__all__ = [
+    "COMPONENT_CLASSIFICATION_PROMPT",
+    "BATCH_CLASSIFICATION_SUFFIX",
+    "create_classification_prompt",
+    "create_batch_classification_prompt",
+]
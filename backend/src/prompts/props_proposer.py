@@ -4,13 +4,11 @@ This module contains the prompt templates and examples for prop
 requirement detection using GPT-4V.
 """
 
-# Main props proposal prompt template
-PROPS_PROPOSAL_PROMPT = """Analyze this {component_type} component and propose prop requirements.
+# Main props proposal prompt template.
+PROPS_PROPOSAL_PROMPT = """Analyze this UI component and propose prop requirements.
 
 You are an expert React/TypeScript developer analyzing component screenshots. Your task is to identify all props that this component should expose based on visual evidence.
 
-## Component Type: {component_type}
-
 ## Prop Types to Detect
 
 ### 1. Variant Props (Enum)
@@ -70,10 +68,6 @@ Props that accept text or numeric values.
 - `placeholder` - Placeholder text in inputs
 - `count` - Numeric badge/counter
 
-{figma_context}
-
-{tokens_context}
-
 ## Few-Shot Examples
 
 ### Example 1: Button Component
@@ -209,7 +203,9 @@ Return a JSON object with this exact structure:
 4. Focus on props with confidence ≥ 0.70
 5. Prioritize props with the clearest visual evidence
 
-Now analyze the provided component image and return the JSON.
+## Component Type: {component_type}
+
+{figma_context}{tokens_context}Now analyze the provided component image and return the JSON.
 """
 
 
@@ -4,13 +4,11 @@ This module contains the prompt templates and examples for state/variant
 requirement detection using GPT-4V.
 """
 
-# Main states proposal prompt template
-STATES_PROPOSAL_PROMPT = """Analyze this {component_type} component and propose state/variant requirements.
+# Main states proposal prompt template.
+STATES_PROPOSAL_PROMPT = """Analyze this UI component and propose state/variant requirements.
 
 You are an expert UI/UX designer analyzing component screenshots. Your task is to identify visual states this component should support based on state variations, interactions, and accessibility needs.
 
-## Component Type: {component_type}
-
 ## States to Detect
 
 ### 1. Hover State
@@ -175,8 +173,6 @@ Visual appearance when action succeeds.
 **Component Types:**
 - Input, Alert - Common for feedback
 
-{figma_context}
-
 ## Few-Shot Examples
 
 ### Example 1: Button with Hover and Active States
@@ -358,7 +354,9 @@ Return a JSON object with this exact structure:
    - **Medium (0.70-0.84)**: Some indicators, reasonable inference
    - **Low (< 0.70)**: Weak evidence, skip these
 
-Now analyze the provided component image and return the JSON.
+## Component Type: {component_type}
+
+{figma_context}Now analyze the provided component image and return the JSON.
 """
 
 
@@ -0,0 +1,75 @@
+"""Unified requirement proposer prompt.
+
+Combines the props, events, states and accessibility rubrics into one prompt
+so all four categories can be proposed from a single vision call.
+"""
+
+from .props_proposer import create_props_prompt
+from .events_proposer import create_events_prompt
+from .states_proposer import create_states_prompt
+from .accessibility_proposer import create_accessibility_prompt
+
+UNIFIED_PROMPT_HEADER = """Analyze this {component_type} component and propose requirements in four categories: props, events, states, and accessibility.
+
+Each part below is the complete guide for one category. Apply each guide to the same component image independently.
+
+"""
+
+UNIFIED_PROMPT_FOOTER = """# Combined Output Format
+
+Return a single JSON object whose keys hold the array described in each part's output format:
+
+```json
+{{
+  "props": [...],
+  "events": [...],
+  "states": [...],
+  "accessibility": [...]
+}}
+```
+
+Use an empty array for a category with no confident requirements. Now analyze the provided component image and return the JSON.
+"""
+
+# Each category prompt ends with its own "Now analyze ..." instruction, which
+# the combined footer replaces
+_SECTION_END_MARKER = "Now analyze the provided component"
+
+
+def _strip_closing_instruction(prompt: str) -> str:
+    """Drop a category prompt's closing instruction line."""
+    return prompt.rsplit(_SECTION_END_MARKER, 1)[0].rstrip() + "\n\n"
+
+
+def create_unified_prompt(
+    component_type: str,
+    figma_data: dict = None,
+    tokens: dict = None,
+) -> str:
+    """Create a prompt proposing all requirement categories at once.
+
+    Args:
+        component_type: The component type being analyzed
+        figma_data: Optional Figma layer/component metadata
+        tokens: Optional design tokens from Epic 1
+
+    Returns:
+        Formatted unified proposal prompt
+    """
+    sections = [
+        ("Props", create_props_prompt(component_type, figma_data=figma_data, tokens=tokens)),
+        ("Events", create_events_prompt(component_type, figma_data=figma_data)),
+        ("States", create_states_prompt(component_type, figma_data=figma_data)),
+        ("Accessibility", create_accessibility_prompt(component_type, figma_data=figma_data)),
+    ]
+
+    parts = [UNIFIED_PROMPT_HEADER.format(component_type=component_type)]
+    for index, (title, prompt) in enumerate(sections, 1):
+        parts.append(f"# Part {index}: {title}\n\n")
+        parts.append(_strip_closing_instruction(prompt))
+    parts.append(UNIFIED_PROMPT_FOOTER.format())
+    return "".join(parts)
+
+
+# Export prompt for use in proposer
+__all__ = ["UNIFIED_PROMPT_HEADER", "UNIFIED_PROMPT_FOOTER", "create_unified_prompt"]
@@ -47,6 +47,8 @@ class ImageUploadValidator:
     MAX_PIXELS = 25_000_000  # 25 megapixels (~5000x5000)
     MIN_WIDTH = 50
     MIN_HEIGHT = 50
+    # Leading bytes inspected for magic numbers and SVG markers
+    SNIFF_SIZE = 2048
     
     # SVG security patterns
     SVG_FORBIDDEN_PATTERNS = [
@@ -214,6 +216,11 @@ class ImageUploadValidator:
         4. SVG security checks (if SVG detected)
         5. Image format validation
         
+        The upload's spooled file is inspected in place: only its first
+        SNIFF_SIZE bytes are read for type detection, and PIL decodes the
+        headers straight from the file, so bitmaps are never copied into a
+        bytes object. SVGs are read in full for the script checks.
+        
         Args:
             file: FastAPI UploadFile object
             
@@ -223,13 +230,15 @@ class ImageUploadValidator:
         Raises:
             InputValidationError: If validation fails
         """
-        # Read file contents
-        contents = await file.read()
-        file_size = len(contents)
+        upload = file.file
+        file_size = upload.seek(0, io.SEEK_END)
         
         # Validate file size first
         cls.validate_file_size(file_size)
         
+        upload.seek(0)
+        contents = upload.read(cls.SNIFF_SIZE)
+        
         # Validate Content-Type header
         cls.validate_file_type(file.content_type, file.filename)
         
@@ -266,7 +275,8 @@ class ImageUploadValidator:
         # Handle SVG files with security validation
         if is_svg:
             try:
-                svg_content = contents.decode('utf-8')
+                upload.seek(0)
+                svg_content = upload.read().decode('utf-8')
                 cls.validate_svg_content(svg_content)
             except UnicodeDecodeError:
                 raise InputValidationError("Invalid SVG file: cannot decode content")
@@ -282,7 +292,8 @@ class ImageUploadValidator:
         
         # Validate bitmap images (PNG, JPEG)
         try:
-            image = Image.open(io.BytesIO(contents))
+            upload.seek(0)
+            image = Image.open(upload)
             
             # Verify image to detect corruption
             try:
@@ -290,8 +301,9 @@ class ImageUploadValidator:
             except Exception as e:
                 raise InputValidationError(f"Image verification failed: {str(e)}")
             
-            # Re-open after verify (verify closes the file)
-            image = Image.open(io.BytesIO(contents))
+            # Re-open after verify (verify consumes the decoder)
+            upload.seek(0)
+            image = Image.open(upload)
             
             # Check format
             if image.format not in cls.ALLOWED_FORMATS:
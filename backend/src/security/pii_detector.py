@@ -19,6 +19,7 @@ except ImportError:
 
 try:
     from openai import AsyncOpenAI
+    from src.services.openai_client import get_openai_client
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
@@ -129,7 +130,7 @@ If no PII is found, return has_pii: false with empty entities_found array."""
             if not api_key:
                 raise PIIDetectionError("OPENAI_API_KEY environment variable not set")
             
-            self._client = AsyncOpenAI(api_key=api_key)
+            self._client = get_openai_client(api_key)
         
         return self._client
     
@@ -6,10 +6,38 @@ from typing import Optional, Dict, Any
 import httpx
 
 from src.core.logging import get_logger
-from src.cache.figma_cache import FigmaCache
+from src.cache.figma_cache import FigmaCache, get_figma_cache
 
 logger = get_logger(__name__)
 
+# Keep-alive connections held open to api.figma.com across requests
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+# Global connection pool shared by every FigmaClient
+_transport: Optional[httpx.AsyncHTTPTransport] = None
+
+
+def get_figma_transport() -> httpx.AsyncHTTPTransport:
+    """Get or create the shared Figma API connection pool.
+
+    Clients are per request because each carries its caller's PAT, but they
+    all send through this transport so TCP/TLS connections are reused.
+    """
+    global _transport
+    if _transport is None:
+        _transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        )
+    return _transport
+
+
+async def close_figma_transport() -> None:
+    """Close the shared Figma API connection pool."""
+    global _transport
+    if _transport is not None:
+        await _transport.aclose()
+        _transport = None
+
 
 class FigmaClientError(Exception):
     """Base exception for Figma client errors."""
@@ -40,6 +68,7 @@ class FigmaClient:
 
     FIGMA_API_BASE = "https://api.figma.com/v1"
     FILE_URL_PATTERN = r"figma\.com/(?:file|design)/([a-zA-Z0-9]+)"
+    FILE_URL_RE = re.compile(FILE_URL_PATTERN)
 
     def __init__(self, personal_access_token: Optional[str] = None, cache: Optional[FigmaCache] = None):
         """
@@ -47,10 +76,10 @@ class FigmaClient:
 
         Args:
             personal_access_token: Figma PAT (if None, uses FIGMA_PAT from env)
-            cache: Optional FigmaCache instance for caching responses
+            cache: Optional FigmaCache instance (defaults to the shared cache)
         """
         self.pat = personal_access_token or os.getenv("FIGMA_PAT")
-        self.cache = cache or FigmaCache()
+        self.cache = cache or get_figma_cache()
         self.http_client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
@@ -59,13 +88,14 @@ class FigmaClient:
             base_url=self.FIGMA_API_BASE,
             timeout=30.0,
             headers=self._get_headers(),
+            transport=get_figma_transport(),
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.http_client:
-            await self.http_client.aclose()
+        # Closing the client would close the shared transport, so just drop it
+        self.http_client = None
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -131,7 +161,7 @@ class FigmaClient:
         Raises:
             ValueError: If URL format is invalid
         """
-        match = re.search(FigmaClient.FILE_URL_PATTERN, url)
+        match = FigmaClient.FILE_URL_RE.search(url)
         if not match:
             raise ValueError(
                 "Invalid Figma URL format. Expected: https://figma.com/file/{file_key} or https://figma.com/design/{file_key}"
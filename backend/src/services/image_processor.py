@@ -1,23 +1,41 @@
 """Image processing service for screenshot upload and validation."""
 
 import io
-from typing import Tuple, Optional
-from PIL import Image
+from typing import Any, BinaryIO, Tuple, Optional, Union
+from PIL import Image, features
 import base64
 
 # Configuration
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per read when streaming an upload
 MAX_IMAGE_WIDTH = 2000  # Max width in pixels
 # PIL returns "JPEG" for both .jpg and .jpeg files
 ALLOWED_FORMATS = {"PNG", "JPEG"}
 ALLOWED_MIME_TYPES = {"image/png", "image/jpeg", "image/jpg"}
 
+# GPT-4o fits images into a 2048x2048 box, then scales the shortest side down
+# to 768px before tiling. Pixels beyond that envelope are never seen by the
+# model, so we drop them before encoding.
+VISION_MAX_DIMENSION = 2048
+VISION_MAX_SHORT_SIDE = 768
+VISION_WEBP_QUALITY = 80
+VISION_WEBP_METHOD = 4  # Encoder effort (0-6); 4 balances size against encode time
+VISION_JPEG_QUALITY = 85
+
+# Pillow can be built without libwebp; opaque images fall back to JPEG then
+WEBP_AVAILABLE = features.check("webp")
+
 
 class ImageValidationError(Exception):
     """Exception raised for image validation errors."""
     pass
 
 
+class ImageTooLargeError(ImageValidationError):
+    """Exception raised when an image exceeds MAX_FILE_SIZE."""
+    pass
+
+
 def validate_file_size(file_size: int) -> None:
     """Validate file size is within limits.
     
@@ -29,11 +47,43 @@ def validate_file_size(file_size: int) -> None:
     """
     if file_size > MAX_FILE_SIZE:
         size_mb = file_size / (1024 * 1024)
-        raise ImageValidationError(
+        raise ImageTooLargeError(
             f"File too large ({size_mb:.1f}MB). Maximum size is 10MB."
         )
 
 
+async def read_upload(file: Any, max_size: int = MAX_FILE_SIZE) -> bytearray:
+    """Read an uploaded file in chunks, rejecting it once it exceeds max_size.
+
+    Oversized uploads are rejected up front when the size is known, and
+    otherwise as soon as the running total passes the limit, so they are
+    never read into memory in full.
+
+    Args:
+        file: UploadFile-like object with an async read(size) method
+        max_size: Maximum accepted size in bytes
+
+    Returns:
+        The file contents
+
+    Raises:
+        ImageTooLargeError: If the file is larger than max_size
+    """
+    size = getattr(file, "size", None)
+    if size is not None and size > max_size:
+        validate_file_size(size)
+
+    contents = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        contents += chunk
+        if len(contents) > max_size:
+            raise ImageTooLargeError(
+                f"File too large (over {max_size / (1024 * 1024):.1f}MB). "
+                "Maximum size is 10MB."
+            )
+    return contents
+
+
 def validate_mime_type(mime_type: str) -> None:
     """Validate file MIME type.
     
@@ -50,13 +100,15 @@ def validate_mime_type(mime_type: str) -> None:
 
 
 def validate_and_process_image(
-    image_data: bytes,
+    image_data: Union[bytes, BinaryIO],
     mime_type: Optional[str] = None
 ) -> Tuple[Image.Image, dict]:
     """Validate and process uploaded image.
     
     Args:
-        image_data: Raw image bytes
+        image_data: Raw image bytes, or a seekable binary file (such as an
+            UploadFile's spooled file) read in place without copying it
+            into memory
         mime_type: Optional MIME type for additional validation
         
     Returns:
@@ -65,8 +117,15 @@ def validate_and_process_image(
     Raises:
         ImageValidationError: If image is invalid or corrupted
     """
+    if isinstance(image_data, (bytes, bytearray)):
+        file_size = len(image_data)
+        image_file = io.BytesIO(image_data)
+    else:
+        image_file = image_data
+        file_size = image_file.seek(0, io.SEEK_END)
+
     # Validate file size
-    validate_file_size(len(image_data))
+    validate_file_size(file_size)
     
     # Validate MIME type if provided
     if mime_type:
@@ -74,7 +133,8 @@ def validate_and_process_image(
     
     try:
         # Try to open and validate image with decompression bomb check
-        image = Image.open(io.BytesIO(image_data))
+        image_file.seek(0)
+        image = Image.open(image_file)
         
         # Verify image to detect corruption early
         try:
@@ -83,7 +143,8 @@ def validate_and_process_image(
             raise ImageValidationError(f"Image verification failed: {str(e)}")
         
         # Re-open image after verify (verify() closes the file)
-        image = Image.open(io.BytesIO(image_data))
+        image_file.seek(0)
+        image = Image.open(image_file)
         
         # Check for decompression bombs (PIL's default limit is 178956970 pixels)
         # We add an additional conservative check
@@ -115,11 +176,21 @@ def validate_and_process_image(
                 f"Image too small ({width}x{height}). Minimum size is 50x50 pixels."
             )
         
-        # Resize if needed
         if width > MAX_IMAGE_WIDTH:
             # Calculate new height maintaining aspect ratio
             ratio = MAX_IMAGE_WIDTH / width
             new_height = int(height * ratio)
+
+            # Only the resized pixels are kept, so let the JPEG decoder scale
+            # down by 1/2, 1/4 or 1/8 while decoding instead of decoding every
+            # pixel first (no effect on PNG)
+            image.draft(None, (MAX_IMAGE_WIDTH, new_height))
+
+        # Decode now; the caller's file may be closed before the image is used
+        image.load()
+
+        # Resize if needed
+        if width > MAX_IMAGE_WIDTH:
             image = image.resize((MAX_IMAGE_WIDTH, new_height), Image.LANCZOS)
             metadata["resized"] = True
             metadata["original_width"] = width
@@ -140,12 +211,15 @@ def validate_and_process_image(
         raise ImageValidationError(f"Corrupted or invalid image file: {str(e)}")
 
 
-def image_to_base64(image: Image.Image, format: str = "PNG") -> str:
+def image_to_base64(
+    image: Image.Image, format: str = "PNG", quality: int = 90
+) -> str:
     """Convert PIL Image to base64 string.
     
     Args:
         image: PIL Image object
-        format: Image format (PNG, JPEG)
+        format: Image format (PNG, JPEG, WEBP)
+        quality: Encoder quality for lossy formats (ignored for PNG)
         
     Returns:
         Base64-encoded image string
@@ -157,7 +231,13 @@ def image_to_base64(image: Image.Image, format: str = "PNG") -> str:
         # Create white background
         rgb_image = Image.new("RGB", image.size, (255, 255, 255))
         rgb_image.paste(image, mask=image.split()[3] if len(image.split()) == 4 else None)
-        rgb_image.save(buffer, format=format, quality=90)
+        rgb_image.save(buffer, format=format, quality=quality)
+    elif format.upper() == "JPEG":
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(buffer, format=format, quality=quality)
+    elif format.upper() == "WEBP":
+        image.save(buffer, format=format, quality=quality, method=VISION_WEBP_METHOD)
     else:
         image.save(buffer, format=format)
     
@@ -165,15 +245,65 @@ def image_to_base64(image: Image.Image, format: str = "PNG") -> str:
     return base64.b64encode(buffer.read()).decode("utf-8")
 
 
+def _has_alpha(image: Image.Image) -> bool:
+    """Check whether an image carries transparency information."""
+    return image.mode in ("RGBA", "LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+
+
+def _downscale_for_gpt4o(image: Image.Image) -> Image.Image:
+    """Shrink an image to GPT-4o's vision processing envelope.
+    
+    Fits the image into a 2048x2048 box and then scales it so the shortest
+    side is at most 768px, preserving aspect ratio. Images already inside
+    the envelope are returned unchanged.
+    
+    Args:
+        image: PIL Image object
+        
+    Returns:
+        Downscaled copy of the image, or the original if no resize is needed
+    """
+    width, height = image.size
+    # First pass: fit into the 2048x2048 box
+    scale = min(1.0, VISION_MAX_DIMENSION / max(width, height))
+
+    # Second pass: cap the shortest side at 768px
+    short_side = min(width, height) * scale
+    if short_side > VISION_MAX_SHORT_SIDE:
+        scale *= VISION_MAX_SHORT_SIDE / short_side
+
+    if scale >= 1.0:
+        return image
+
+    new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return image.resize(new_size, Image.LANCZOS)
+
+
 def prepare_image_for_vision_api(image: Image.Image) -> str:
     """Prepare image for GPT-4V API.
     
+    The image is first downscaled to the envelope GPT-4o actually processes,
+    then encoded as PNG when it has transparency or as lossy WebP otherwise
+    (JPEG if this Pillow build lacks WebP support).
+    
     Args:
         image: PIL Image object
         
     Returns:
         Base64-encoded image in data URL format
     """
-    # Use PNG format to preserve quality and support transparency
-    base64_image = image_to_base64(image, format="PNG")
-    return f"data:image/png;base64,{base64_image}"
+    image = _downscale_for_gpt4o(image)
+
+    # Keep PNG for transparent images; opaque screenshots encode much smaller as WebP
+    if _has_alpha(image):
+        base64_image = image_to_base64(image, format="PNG")
+        return f"data:image/png;base64,{base64_image}"
+
+    if WEBP_AVAILABLE:
+        base64_image = image_to_base64(image, format="WEBP", quality=VISION_WEBP_QUALITY)
+        return f"data:image/webp;base64,{base64_image}"
+
+    base64_image = image_to_base64(image, format="JPEG", quality=VISION_JPEG_QUALITY)
+    return f"data:image/jpeg;base64,{base64_image}"
@@ -0,0 +1,141 @@
+"""Route text-heavy screenshots through OCR before calling the vision API.
+
+Many component screenshots (inputs with placeholders, alerts, button labels)
+are dominated by text. For those, sending the OCR'd text plus a small
+low-detail thumbnail costs a fraction of the image tokens of a full
+high-detail image. OCR is optional: when rapidocr_onnxruntime is not
+installed, or OCR fails, the full image is used unchanged.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from .image_processor import prepare_image_for_vision_api
+from ..core.logging import get_logger
+
+try:
+    from rapidocr_onnxruntime import RapidOCR
+    OCR_AVAILABLE = True
+except ImportError:
+    OCR_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# Characters of detected text per pixel above which an image is treated as
+# text-dominated (e.g. ~100 characters on a 400x250 component screenshot)
+TEXT_DENSITY_THRESHOLD = 0.001
+THUMBNAIL_SIZE = 256
+
+_ocr_engine = None
+
+
+@dataclass
+class VisionInput:
+    """Image payload for a vision API call.
+
+    Attributes:
+        image_url: Base64 data URL to send as the image
+        detail: Vision detail level override ("low"/"high"), or None for default
+        detected_text: OCR'd text to include in the prompt, if the image was
+            routed through OCR
+    """
+    image_url: str
+    detail: Optional[str] = None
+    detected_text: Optional[str] = None
+
+
+def _get_ocr_engine():
+    """Lazily create the shared OCR engine."""
+    global _ocr_engine
+    if _ocr_engine is None:
+        _ocr_engine = RapidOCR()
+    return _ocr_engine
+
+
+def extract_text(image: Image.Image) -> list[str]:
+    """Run OCR on an image.
+
+    Args:
+        image: PIL Image object
+
+    Returns:
+        Detected text fragments in reading order (empty if none found)
+    """
+    result, _ = _get_ocr_engine()(np.asarray(image.convert("RGB")))
+    if not result:
+        return []
+    return [text for _box, text, _score in result if text]
+
+
+def route_image_for_vision(
+    image: Image.Image,
+    image_url: Optional[str] = None,
+) -> VisionInput:
+    """Choose between the full image and an OCR text + thumbnail payload.
+
+    Args:
+        image: PIL Image object
+        image_url: Optional data URL already produced by
+            prepare_image_for_vision_api, used for the full-image path
+
+    Returns:
+        VisionInput describing what to send to the vision API
+    """
+    full_image = VisionInput(image_url=image_url or prepare_image_for_vision_api(image))
+    if not OCR_AVAILABLE:
+        return full_image
+
+    try:
+        words = extract_text(image)
+    except Exception as e:
+        logger.warning(f"OCR failed, sending full image: {e}")
+        return full_image
+
+    width, height = image.size
+    text_density = sum(len(word) for word in words) / (width * height)
+    if text_density < TEXT_DENSITY_THRESHOLD:
+        return full_image
+
+    thumbnail = image.copy()
+    thumbnail.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.LANCZOS)
+
+    logger.info(
+        "Routing text-heavy image through OCR",
+        extra={
+            "extra": {
+                "text_density": text_density,
+                "detected_chars": sum(len(word) for word in words),
+            }
+        }
+    )
+
+    return VisionInput(
+        image_url=prepare_image_for_vision_api(thumbnail),
+        detail="low",
+        detected_text="\n".join(words),
+    )
+
+
+def append_detected_text(prompt: str, vision_input: VisionInput) -> str:
+    """Append OCR'd text to a prompt when the image was routed through OCR.
+
+    The text is appended at the end so the static prompt prefix stays
+    cacheable.
+
+    Args:
+        prompt: Prompt text
+        vision_input: Routed vision input
+
+    Returns:
+        Prompt with a "Detected text" section, or the original prompt
+    """
+    if not vision_input.detected_text:
+        return prompt
+    return (
+        f"{prompt}\n## Detected Text\n\n"
+        "The image below is a low-resolution thumbnail. The component contains "
+        f"the following text (extracted by OCR):\n\n{vision_input.detected_text}\n"
+    )
@@ -0,0 +1,119 @@
+"""Shared AsyncOpenAI client.
+
+Every AsyncOpenAI instance owns its own httpx connection pool, so agents that
+each build a client open separate TLS connections to the same host. Agents
+use get_openai_client() instead, which lazily creates one client per API key
+backed by a single HTTP/2 connection pool.
+"""
+
+import gzip
+import os
+from typing import Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool limits for the shared client
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+
+# Request bodies above this size (mostly base64 image data URLs) are gzipped
+GZIP_MIN_BODY_SIZE = 16 * 1024
+
+_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def gzip_request_body(request: httpx.Request) -> httpx.Request:
+    """Return a gzipped copy of a large, fully buffered request.
+
+    Only in-memory bodies (JSON payloads) are considered; streaming bodies
+    such as multipart file uploads are returned unchanged, since reading
+    them here would consume the stream.
+
+    Args:
+        request: Outgoing request
+
+    Returns:
+        The original request, or a new one with the compressed body and
+        Content-Encoding/Content-Length set
+    """
+    if "Content-Encoding" in request.headers:
+        return request
+    if not isinstance(request.stream, httpx.ByteStream):
+        return request
+    body = request.content
+    if len(body) < GZIP_MIN_BODY_SIZE:
+        return request
+
+    compressed = gzip.compress(body, compresslevel=6)
+    headers = request.headers.copy()
+    headers["Content-Encoding"] = "gzip"
+    headers["Content-Length"] = str(len(compressed))
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=headers,
+        content=compressed,
+        extensions=request.extensions,
+    )
+
+
+class GzipRequestTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that gzips large request bodies before sending."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(gzip_request_body(request))
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def get_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client for an API key.
+
+    Args:
+        api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+
+    Returns:
+        AsyncOpenAI client shared by all callers using the same key
+
+    Raises:
+        ValueError: If no API key is available
+    """
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OpenAI API key is required")
+
+    client = _clients.get(api_key)
+    if client is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        http_client = httpx.AsyncClient(
+            transport=GzipRequestTransport(transport),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+        client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        _clients[api_key] = client
+    return client
+
+
+async def close_openai_clients() -> None:
+    """Close all shared clients and their connection pools."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
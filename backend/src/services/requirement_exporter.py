@@ -5,12 +5,13 @@ stores them in the database for audit compliance, and provides integration
 points for Epic 3 (Pattern Retrieval) and Epic 4 (Code Generation).
 """
 
+import asyncio
 import uuid
 import json
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from typing import List, Dict, Any, Optional, Union
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy import Row, select
 
 from src.types.requirement_types import (
     RequirementProposal,
@@ -22,6 +23,18 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Read paths select plain table rows so they run on a bare AsyncConnection
+EXPORTS_TABLE = RequirementExport.__table__
+
+
+def _export_from_row(row: Row) -> RequirementExport:
+    """Build a detached RequirementExport from a requirement_exports row.
+
+    The instance is never added to a session; it only provides the model's
+    summary helpers over the selected values.
+    """
+    return RequirementExport(**row._mapping)
+
 
 class RequirementExporter:
     """Service for exporting and storing approved requirements.
@@ -34,11 +47,13 @@ class RequirementExporter:
     - Calculate quality metrics
     """
 
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: Union[AsyncSession, AsyncConnection]):
         """Initialize the exporter with a database session.
 
         Args:
-            db_session: Async SQLAlchemy session for database operations
+            db_session: Async SQLAlchemy session for database operations; a
+                plain AsyncConnection is enough for the read-only lookups
+                (get_export_by_id, get_recent_exports)
         """
         self.db = db_session
 
@@ -84,63 +99,76 @@ class RequirementExporter:
         edited_count = self._count_edited_requirements(approved_requirements)
         custom_added_count = self._count_custom_requirements(approved_requirements)
 
-        # Build export JSON
-        export_data = self._build_export_json(
-            component_type=component_type,
+        # Record for the audit trail
+        db_export = RequirementExport(
+            export_id=export_id,
+            component_type=component_type.value,
             component_confidence=component_confidence,
             requirements=approved_requirements,
-            export_id=export_id,
+            source_type=source_type,
             source_metadata=source_metadata,
             tokens=tokens,
+            total_requirements=total_requirements,
+            approved_count=approved_count,
+            edited_count=edited_count,
+            custom_added_count=custom_added_count,
+            proposal_latency_ms=proposal_latency_ms,
+            approval_duration_ms=approval_duration_ms,
+            proposed_at=proposed_at or datetime.now(timezone.utc),
+            approved_at=approved_at,
+            exported_at=datetime.now(timezone.utc),
+            user_edit_rate=(edited_count / total_requirements) if total_requirements > 0 else 0.0,
+            status="exported",
         )
 
-        # Store in database for audit trail
-        try:
-            db_export = RequirementExport(
-                export_id=export_id,
-                component_type=component_type.value,
+        # The export JSON doesn't depend on the database record, so build it
+        # while the audit-trail insert is in flight
+        export_data, _ = await asyncio.gather(
+            asyncio.to_thread(
+                self._build_export_json,
+                component_type=component_type,
                 component_confidence=component_confidence,
                 requirements=approved_requirements,
-                source_type=source_type,
+                export_id=export_id,
                 source_metadata=source_metadata,
                 tokens=tokens,
-                total_requirements=total_requirements,
-                approved_count=approved_count,
-                edited_count=edited_count,
-                custom_added_count=custom_added_count,
-                proposal_latency_ms=proposal_latency_ms,
-                approval_duration_ms=approval_duration_ms,
-                proposed_at=proposed_at or datetime.now(timezone.utc),
-                approved_at=approved_at,
-                exported_at=datetime.now(timezone.utc),
-                user_edit_rate=(edited_count / total_requirements) if total_requirements > 0 else 0.0,
-                status="exported",
-            )
+            ),
+            self._persist_export(db_export),
+        )
 
-            self.db.add(db_export)
-            await self.db.commit()
-            await self.db.refresh(db_export)
+        logger.info(
+            f"Requirements exported successfully: {export_id}",
+            extra={
+                "extra": {
+                    "export_id": export_id,
+                    "component_type": component_type.value,
+                    "total_requirements": total_requirements,
+                    "approved_count": approved_count,
+                    "edited_count": edited_count,
+                }
+            },
+        )
 
-            logger.info(
-                f"Requirements exported successfully: {export_id}",
-                extra={
-                    "extra": {
-                        "export_id": export_id,
-                        "component_type": component_type.value,
-                        "total_requirements": total_requirements,
-                        "approved_count": approved_count,
-                        "edited_count": edited_count,
-                    }
-                },
-            )
+        return {
+            "export_id": export_id,
+            "export_data": export_data,
+            "database_record": db_export.get_approval_summary(),
+            "status": "success",
+        }
 
-            return {
-                "export_id": export_id,
-                "export_data": export_data,
-                "database_record": db_export.get_approval_summary(),
-                "status": "success",
-            }
+    async def _persist_export(self, db_export: RequirementExport) -> None:
+        """Store an export in the database for the audit trail.
+
+        Args:
+            db_export: Export record to insert
 
+        Raises:
+            Exception: If the insert fails (the session is rolled back)
+        """
+        try:
+            self.db.add(db_export)
+            await self.db.commit()
+            await self.db.refresh(db_export)
         except Exception as e:
             logger.error(f"Failed to export requirements: {e}")
             await self.db.rollback()
@@ -365,13 +393,15 @@ class RequirementExporter:
         """
         try:
             result = await self.db.execute(
-                select(RequirementExport).where(RequirementExport.export_id == export_id)
+                select(EXPORTS_TABLE).where(EXPORTS_TABLE.c.export_id == export_id)
             )
-            export = result.scalar_one_or_none()
+            row = result.first()
 
-            if not export:
+            if row is None:
                 return None
 
+            export = _export_from_row(row)
+
             return {
                 "export_id": export.export_id,
                 "component_type": export.component_type,
@@ -397,13 +427,12 @@ class RequirementExporter:
         """
         try:
             result = await self.db.execute(
-                select(RequirementExport)
-                .order_by(RequirementExport.exported_at.desc())
+                select(EXPORTS_TABLE)
+                .order_by(EXPORTS_TABLE.c.exported_at.desc())
                 .limit(limit)
             )
-            exports = result.scalars().all()
 
-            return [export.get_approval_summary() for export in exports]
+            return [_export_from_row(row).get_approval_summary() for row in result]
 
         except Exception as e:
             logger.error(f"Failed to retrieve recent exports: {e}")
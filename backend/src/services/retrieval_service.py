@@ -4,7 +4,7 @@ This module implements the retrieval orchestration (B7) for Epic 3.
 Coordinates query building, BM25, semantic search, fusion, and explainability.
 """
 
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import time
 import logging
 from sqlalchemy import select
@@ -94,6 +94,59 @@ class RetrievalService:
         """
         start_time = time.time()
         
+        fusion_details, methods_used, query = await self._rank(requirements, top_k)
+        
+        # Step 5: Add explanations
+        enriched_patterns = [
+            self._explain(detail, requirements) for detail in fusion_details
+        ]
+        
+        return {
+            "patterns": enriched_patterns,
+            "retrieval_metadata": self._build_metadata(
+                start_time, len(enriched_patterns), methods_used, query
+            )
+        }
+
+    async def search_stream(
+        self,
+        requirements: Dict,
+        top_k: int = 3
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """Execute the retrieval pipeline, yielding results as they are explained.
+        
+        Ranking (steps 1-4) runs up front since fusion needs every candidate;
+        each pattern is then explained and yielded in rank order.
+        
+        Args:
+            requirements: Requirements dictionary from Epic 2
+            top_k: Number of top patterns to return (default: 3)
+        
+        Yields:
+            ("pattern", pattern) for each top-k pattern, in the same shape as
+            search()'s patterns, then ("retrieval_metadata", metadata)
+        """
+        start_time = time.time()
+        
+        fusion_details, methods_used, query = await self._rank(requirements, top_k)
+        
+        for detail in fusion_details:
+            yield "pattern", self._explain(detail, requirements)
+        
+        yield "retrieval_metadata", self._build_metadata(
+            start_time, len(fusion_details), methods_used, query
+        )
+
+    async def _rank(
+        self,
+        requirements: Dict,
+        top_k: int
+    ) -> Tuple[List[Dict], List[str], str]:
+        """Build queries, search and fuse results (pipeline steps 1-4).
+        
+        Returns:
+            Tuple of (fusion details in rank order, methods used, query text)
+        """
         logger.info(f"Starting retrieval for requirements: {requirements}")
         
         # Step 1: Build queries
@@ -148,48 +201,51 @@ class RetrievalService:
         
         logger.info(f"Fusion produced {len(fusion_details)} results")
         
-        # Step 5: Add explanations
-        enriched_patterns = []
-        for detail in fusion_details:
-            explanation_data = self.explainer.explain(
-                pattern=detail["pattern"],
-                requirements=requirements,
-                bm25_score=detail["bm25_score"],
-                bm25_rank=detail["bm25_rank"] or 999,
-                semantic_score=detail["semantic_score"],
-                semantic_rank=detail["semantic_rank"] or 999,
-                final_score=detail["final_score"],
-                final_rank=detail["final_rank"]
-            )
-            
-            # Combine pattern with explanation
-            enriched_pattern = {
-                **detail["pattern"],
-                "confidence": explanation_data["confidence"],
-                "explanation": explanation_data["explanation"],
-                "match_highlights": explanation_data["match_highlights"],
-                "ranking_details": explanation_data["ranking_details"]
-            }
-            enriched_patterns.append(enriched_pattern)
+        return fusion_details, methods_used, semantic_query if semantic_query else bm25_query
+
+    def _explain(self, detail: Dict, requirements: Dict) -> Dict:
+        """Combine a fused result's pattern with its explanation (step 5)."""
+        explanation_data = self.explainer.explain(
+            pattern=detail["pattern"],
+            requirements=requirements,
+            bm25_score=detail["bm25_score"],
+            bm25_rank=detail["bm25_rank"] or 999,
+            semantic_score=detail["semantic_score"],
+            semantic_rank=detail["semantic_rank"] or 999,
+            final_score=detail["final_score"],
+            final_rank=detail["final_rank"]
+        )
         
+        return {
+            **detail["pattern"],
+            "confidence": explanation_data["confidence"],
+            "explanation": explanation_data["explanation"],
+            "match_highlights": explanation_data["match_highlights"],
+            "ranking_details": explanation_data["ranking_details"]
+        }
+
+    def _build_metadata(
+        self,
+        start_time: float,
+        pattern_count: int,
+        methods_used: List[str],
+        query: str
+    ) -> Dict:
+        """Build retrieval_metadata for a finished search."""
         # Calculate latency
         latency_ms = int((time.time() - start_time) * 1000)
         
-        logger.info(f"Retrieval completed in {latency_ms}ms, returning {len(enriched_patterns)} patterns")
+        logger.info(f"Retrieval completed in {latency_ms}ms, returning {pattern_count} patterns")
         
-        # Build response
         return {
-            "patterns": enriched_patterns,
-            "retrieval_metadata": {
-                "latency_ms": latency_ms,
-                "methods_used": methods_used,
-                "weights": {
-                    "bm25": self.weighted_fusion.bm25_weight,
-                    "semantic": self.weighted_fusion.semantic_weight
-                },
-                "total_patterns_searched": len(self.patterns),
-                "query": semantic_query if semantic_query else bm25_query
-            }
+            "latency_ms": latency_ms,
+            "methods_used": methods_used,
+            "weights": {
+                "bm25": self.weighted_fusion.bm25_weight,
+                "semantic": self.weighted_fusion.semantic_weight
+            },
+            "total_patterns_searched": len(self.patterns),
+            "query": query
         }
 
     def get_library_stats(self) -> Dict:
@@ -4,6 +4,7 @@ This module defines Pydantic models and enums for the requirement proposal
 system that analyzes screenshots/Figma frames to propose functional requirements.
 """
 
+import uuid
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
@@ -58,6 +59,19 @@ def get_confidence_level(confidence: float) -> ConfidenceLevel:
         return ConfidenceLevel.LOW
 
 
+def new_proposal_id(category: RequirementCategory, name: str) -> str:
+    """Generate a unique requirement proposal ID.
+    
+    Args:
+        category: Requirement category
+        name: Requirement name
+        
+    Returns:
+        ID of the form "<category>-<name>-<8 hex chars>"
+    """
+    return f"{category.value}-{name}-{uuid.uuid4().hex[:8]}"
+
+
 class RequirementProposal(BaseModel):
     """A single requirement proposal with confidence and rationale.
     
@@ -19,6 +19,18 @@ from src.main import app
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Start every test without cached evaluation responses."""
+    from src.api.v1.routes import evaluation
+
+    evaluation._metrics_cache.clear()
+    evaluation._status_cache.clear()
+    yield
+    evaluation._metrics_cache.clear()
+    evaluation._status_cache.clear()
+
+
 class TestEvaluationStatusEndpoint:
     """Tests for /api/v1/evaluation/status endpoint."""
 
@@ -65,6 +77,29 @@ class TestEvaluationStatusEndpoint:
             assert data["golden_dataset"]["size"] == 0
             assert data["ready"] is False
 
+    def test_status_cached_until_fresh_requested(self):
+        """Status is reused within the TTL unless ?fresh=true is passed."""
+        client.get("/api/v1/evaluation/status")
+
+        with patch('src.api.v1.routes.evaluation.GoldenDataset') as mock_dataset:
+            mock_dataset.side_effect = FileNotFoundError("Dataset not found")
+
+            cached = client.get("/api/v1/evaluation/status").json()
+            fresh = client.get("/api/v1/evaluation/status?fresh=true").json()
+
+        assert cached["golden_dataset"]["loaded"] is True
+        assert fresh["golden_dataset"]["loaded"] is False
+
+    def test_status_reads_api_key_from_environment(self):
+        """The API key is read from the environment on each fresh status."""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': ''}):
+            response = client.get("/api/v1/evaluation/status?fresh=true")
+            assert response.json()["api_key_configured"] is False
+
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            response = client.get("/api/v1/evaluation/status?fresh=true")
+            assert response.json()["api_key_configured"] is True
+
     def test_status_response_structure(self):
         """Test that status response has correct structure."""
         response = client.get("/api/v1/evaluation/status")
@@ -91,7 +126,7 @@ class TestEvaluationMetricsEndpoint:
     @pytest.mark.asyncio
     async def test_metrics_without_api_key(self):
         """Test metrics endpoint without API key configured."""
-        with patch.dict('os.environ', {}, clear=True):
+        with patch.dict('os.environ', {'OPENAI_API_KEY': ''}):
             response = client.get("/api/v1/evaluation/metrics")
 
             assert response.status_code == 500
@@ -226,6 +261,50 @@ class TestEvaluationMetricsEndpoint:
             assert "detail" in data
             assert "Evaluation failed" in data["detail"]
 
+    def test_query_results_columnar_unless_verbose(self):
+        """Test query_results are returned as parallel arrays by default."""
+        from src.api.v1.routes.evaluation import _with_columnar_query_results
+
+        rows = [
+            {'query': 'button', 'expected': 'shadcn-button',
+             'retrieved': 'shadcn-button', 'correct': True, 'rank': 1,
+             'confidence': 0.9, 'category': 'keyword'},
+            {'query': 'card', 'expected': 'shadcn-card',
+             'retrieved': 'shadcn-badge', 'correct': False, 'rank': None,
+             'confidence': 0.4, 'category': 'semantic'},
+        ]
+        results = {'overall': {}, 'retrieval_only': {'mrr': 0.5, 'query_results': rows}}
+
+        compact = _with_columnar_query_results(results)
+        columns = compact['retrieval_only']['query_results']
+
+        assert columns['queries'] == ['button', 'card']
+        assert columns['ranks'] == [1, None]
+        assert columns['correct'] == [True, False]
+        assert columns['categories'] == ['keyword', 'semantic']
+        assert compact['retrieval_only']['mrr'] == 0.5
+        # Cached results keep the per-query rows
+        assert results['retrieval_only']['query_results'] is rows
+
+    def test_per_category_metrics_match_masked_metrics(self):
+        """Test grouped per-category metrics equal metrics over each subset."""
+        import numpy as np
+        from src.api.v1.routes.evaluation import (
+            _retrieval_metrics, _retrieval_metrics_by_category
+        )
+
+        ranks = np.array([1, 2, 999, 1, 4], dtype=np.int32)
+        correct = np.array([True, True, False, True, True])
+        categories = np.array(['keyword', 'keyword', 'semantic', 'semantic', 'keyword'])
+
+        per_category = _retrieval_metrics_by_category(ranks, correct, categories)
+
+        for category in ('keyword', 'semantic'):
+            mask = categories == category
+            expected = _retrieval_metrics(ranks[mask], correct[mask])
+            assert per_category[category] == pytest.approx(expected)
+        assert per_category['mixed'] == {'mrr': 0.0, 'hit_at_3': 0.0, 'precision_at_1': 0.0}
+
 
 class TestEvaluationEndpointsIntegration:
     """Integration tests for evaluation endpoints."""
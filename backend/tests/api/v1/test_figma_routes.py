@@ -0,0 +1,23 @@
+"""Tests for Figma extraction request validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.api.v1.routes.figma import FigmaExtractRequest
+
+
+class TestFigmaExtractRequest:
+    """Tests for FigmaExtractRequest."""
+
+    def test_file_key_parsed_from_url(self):
+        """The file key is available after validation."""
+        request = FigmaExtractRequest(figma_url="https://www.figma.com/design/abc123/Buttons")
+
+        assert request.file_key == "abc123"
+
+    def test_invalid_url_error_points_at_field(self):
+        """A bad URL is reported against figma_url."""
+        with pytest.raises(ValidationError) as exc_info:
+            FigmaExtractRequest(figma_url="https://example.com/file/abc123")
+
+        assert exc_info.value.errors()[0]["loc"] == ("figma_url",)
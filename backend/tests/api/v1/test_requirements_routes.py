@@ -0,0 +1,49 @@
+"""Tests for requirement proposal admission control."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.api.v1.routes import requirements
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = MagicMock()
+    orchestrator.propose_requirements_parallel = AsyncMock(return_value="state")
+    return orchestrator
+
+
+@pytest.mark.asyncio
+class TestBoundedProposal:
+    """Tests for _bounded_proposal."""
+
+    async def test_slot_released_after_run(self, orchestrator):
+        """A finished run frees its admission slot."""
+        assert await requirements._bounded_proposal(orchestrator, None, None, None) == "state"
+        assert requirements._proposals_admitted == 0
+
+    async def test_cancel_before_start_does_not_leak(self, orchestrator):
+        """A task cancelled before its first step never takes a slot."""
+        task = asyncio.ensure_future(
+            requirements._bounded_proposal(orchestrator, None, None, None)
+        )
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert requirements._proposals_admitted == 0
+        orchestrator.propose_requirements_parallel.assert_not_called()
+
+    async def test_full_queue_is_rejected(self, orchestrator, monkeypatch):
+        """Admissions beyond concurrency plus queue depth raise."""
+        monkeypatch.setattr(
+            requirements,
+            "_proposals_admitted",
+            requirements.PROPOSE_CONCURRENCY + requirements.PROPOSE_MAX_QUEUED,
+        )
+
+        with pytest.raises(requirements.ProposalCapacityError):
+            await requirements._bounded_proposal(orchestrator, None, None, None)
+        orchestrator.propose_requirements_parallel.assert_not_called()
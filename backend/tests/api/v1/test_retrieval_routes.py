@@ -0,0 +1,135 @@
+"""
+Tests for retrieval API endpoints.
+
+Validates:
+- POST /api/v1/retrieval/search/stream NDJSON output
+- Parity with POST /api/v1/retrieval/search
+- Error handling
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.v1.routes import retrieval
+from src.services.retrieval_service import RetrievalService
+
+
+PATTERNS = [
+    {
+        "id": f"shadcn-{name.lower()}",
+        "name": name,
+        "category": category,
+        "description": f"A {name.lower()} component with variants",
+        "framework": "react",
+        "library": "shadcn/ui",
+        "code": f"export function {name}() {{ return null }}",
+        "metadata": {
+            "props": [{"name": "variant"}, {"name": "size"}],
+            "variants": [{"name": "default"}, {"name": "outline"}],
+            "a11y": {"features": ["aria-label"]},
+        },
+    }
+    for name, category in [
+        ("Button", "form"),
+        ("Card", "layout"),
+        ("Input", "form"),
+        ("Badge", "data-display"),
+    ]
+]
+
+REQUEST = {
+    "requirements": {
+        "component_type": "Button",
+        "props": ["variant", "size"],
+        "variants": ["default", "outline"],
+    }
+}
+
+
+class FailingRetrievalService:
+    """Stub whose stream breaks after the first pattern."""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+    async def search_stream(self, requirements, top_k=3):
+        yield "pattern", self.pattern
+        raise RuntimeError("semantic search unavailable")
+
+
+def _client(service) -> TestClient:
+    app = FastAPI()
+    app.include_router(retrieval.router, prefix="/api/v1")
+    app.state.retrieval_service = service
+    return TestClient(app)
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.fixture
+def client():
+    return _client(RetrievalService(patterns=PATTERNS))
+
+
+class TestSearchStreamEndpoint:
+    """Tests for /api/v1/retrieval/search/stream endpoint."""
+
+    def test_patterns_then_metadata(self, client):
+        """Each pattern is one line, followed by a single metadata line."""
+        response = client.post("/api/v1/retrieval/search/stream", json=REQUEST)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = _lines(response)
+        assert [list(line) for line in lines] == (
+            [["pattern"]] * (len(lines) - 1) + [["retrieval_metadata"]]
+        )
+        assert len(lines) == 4
+        assert lines[-1]["retrieval_metadata"]["methods_used"] == ["bm25"]
+
+    def test_matches_search_response(self, client):
+        """Streamed patterns and metadata match /search for the same body."""
+        search = client.post("/api/v1/retrieval/search", json=REQUEST).json()
+        lines = _lines(client.post("/api/v1/retrieval/search/stream", json=REQUEST))
+
+        assert [line["pattern"] for line in lines[:-1]] == search["patterns"]
+        streamed = dict(lines[-1]["retrieval_metadata"], latency_ms=0)
+        expected = dict(search["retrieval_metadata"], latency_ms=0)
+        assert streamed == expected
+
+    def test_missing_component_type(self, client):
+        """A body without component_type is rejected before streaming."""
+        response = client.post(
+            "/api/v1/retrieval/search/stream",
+            json={"requirements": {"props": ["variant"]}},
+        )
+
+        assert response.status_code == 400
+        assert "component_type" in response.json()["detail"]
+
+    def test_error_line_after_failure(self, client):
+        """A failure mid-stream ends the stream with an error line."""
+        search = client.post("/api/v1/retrieval/search", json=REQUEST).json()
+        failing = _client(FailingRetrievalService(search["patterns"][0]))
+
+        lines = _lines(failing.post("/api/v1/retrieval/search/stream", json=REQUEST))
+
+        assert lines[0] == {"pattern": search["patterns"][0]}
+        assert lines[1] == {
+            "error": "Retrieval search failed: semantic search unavailable"
+        }
+        assert len(lines) == 2
+
+    def test_service_unavailable(self):
+        """Without an initialized service the endpoint returns 503."""
+        app = FastAPI()
+        app.include_router(retrieval.router, prefix="/api/v1")
+
+        response = TestClient(app).post("/api/v1/retrieval/search/stream", json=REQUEST)
+
+        assert response.status_code == 503
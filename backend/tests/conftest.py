@@ -12,6 +12,24 @@ import importlib.util
 backend_available = importlib.util.find_spec("src.generation.generator_service") is not None
 
 
+@pytest.fixture(autouse=True)
+def isolated_vision_cache(monkeypatch):
+    """
+    Keep mocked vision responses out of the shared and on-disk caches.
+
+    Every test starts with an empty in-memory cache and no disk tier, so
+    responses from mocked clients never leak between tests or persist.
+    """
+    from collections import OrderedDict
+    from src.cache.vision_cache import vision_response_cache
+
+    monkeypatch.setenv("VISION_CACHE_DIR", "")
+    monkeypatch.setattr(vision_response_cache, "directory", "")
+    monkeypatch.setattr(vision_response_cache, "_disk", None)
+    monkeypatch.setattr(vision_response_cache, "_disk_failed", False)
+    monkeypatch.setattr(vision_response_cache, "_entries", OrderedDict())
+
+
 @pytest.fixture
 def sample_tokens():
     """
@@ -149,8 +149,9 @@ class TestGenerationAPI:
         # Expected endpoints
         expected_endpoints = [
             "/api/v1/generation/generate",      # POST - Generate component
+            "/api/v1/generation/generate/stream",  # POST - Generate with NDJSON progress
             "/api/v1/generation/patterns",      # GET - List patterns
-            "/api/v1/generation/status/{pattern_id}"  # GET - Get status
+            "/api/v1/generation/status/{generation_id}"  # GET - Get status
         ]
         
         # Verify endpoint paths are defined
@@ -181,3 +182,86 @@ class TestGenerationAPI:
             assert "status_code" in error
             assert "scenario" in error
             assert "expected_detail" in error
+
+
+class TestGenerationStreamAPI:
+    """Tests for the NDJSON streaming generation endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Client for an app with only the generation router."""
+        from fastapi import FastAPI
+        from src.api.v1.routes.generation import router
+
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+        return TestClient(app)
+
+    def test_streams_stages_then_result(self, client):
+        """Stage events are streamed before the final result line."""
+        import json
+        from src.generation.types import (
+            GenerationMetadata,
+            GenerationResult,
+            GenerationStage,
+        )
+
+        async def fake_generate(request, generation_id=None, on_stage=None):
+            for stage in (GenerationStage.LLM_GENERATING, GenerationStage.VALIDATING):
+                on_stage({"stage": stage.value, "elapsed_ms": 0})
+            return GenerationResult(
+                component_code="export const Button = () => null",
+                stories_code="",
+                files={},
+                metadata=GenerationMetadata(latency_ms=1),
+                generation_id=generation_id,
+            )
+
+        with patch(
+            "src.api.v1.routes.generation.generator_service.generate",
+            side_effect=fake_generate,
+        ):
+            response = client.post(
+                "/api/v1/generation/generate/stream",
+                json={"pattern_id": "shadcn-button", "tokens": {}, "requirements": []},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["stage"] for e in events] == ["llm_generating", "validating", "done"]
+        assert events[-1]["generation_id"] == response.headers["x-generation-id"]
+        assert events[-1]["code"]["component"] == "export const Button = () => null"
+
+    def test_client_generation_id_is_used(self, client):
+        """A client-chosen generation_id names the run before it finishes."""
+        with patch(
+            "src.api.v1.routes.generation.generator_service.generate",
+            new=AsyncMock(side_effect=RuntimeError("stop")),
+        ) as generate:
+            response = client.post(
+                "/api/v1/generation/generate/stream",
+                json={
+                    "pattern_id": "shadcn-button",
+                    "tokens": {},
+                    "requirements": [],
+                    "generation_id": "client-run-1",
+                },
+            )
+
+        assert response.headers["x-generation-id"] == "client-run-1"
+        assert generate.call_args.kwargs["generation_id"] == "client-run-1"
+
+    def test_invalid_generation_id_rejected(self, client):
+        """generation_id is limited to URL-safe characters."""
+        response = client.post(
+            "/api/v1/generation/generate/stream",
+            json={
+                "pattern_id": "shadcn-button",
+                "tokens": {},
+                "requirements": [],
+                "generation_id": "../etc",
+            },
+        )
+
+        assert response.status_code == 422
@@ -4,6 +4,9 @@ End-to-end tests for Generator Service
 Tests the full code generation pipeline from pattern to generated code.
 """
 
+import asyncio
+import gc
+
 import pytest
 
 from src.generation.generator_service import GeneratorService
@@ -151,7 +154,22 @@ class TestGeneratorService:
         for stage in expected_stages:
             assert stage in stage_latencies
             assert stage_latencies[stage] >= 0  # Should have non-negative latency
-    
+
+    @pytest.mark.asyncio
+    async def test_progress_tracked_per_run(self, generator_service, button_request):
+        """Test that each run's progress is tracked under its own ID."""
+        result = await generator_service.generate(button_request, generation_id="run-1")
+        other = await generator_service.generate(button_request)
+
+        assert result.generation_id == "run-1"
+        assert other.generation_id not in (None, "run-1")
+
+        progress = generator_service.get_progress("run-1")
+        assert progress.generation_id == "run-1"
+        assert progress.stage_latencies == result.metadata.stage_latencies
+        assert generator_service.get_progress(other.generation_id) is not progress
+        assert generator_service.get_progress("unknown") is None
+
     @pytest.mark.asyncio
     async def test_generation_with_missing_tokens(self, generator_service):
         """Test generation with missing tokens (should use fallbacks)."""
@@ -231,3 +249,32 @@ class TestGeneratorService:
         # Stories should have Storybook structure
         stories_code = result.stories_code
         assert "Story" in stories_code or "Meta" in stories_code
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_does_not_orphan_provenance(
+        self, generator_service, button_request, monkeypatch
+    ):
+        """A failing LLM stage leaves no unretrieved provenance task error."""
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+
+        def failing_provenance(*args):
+            raise ValueError("provenance failed")
+
+        async def failing_generate(**kwargs):
+            # A fresh exception per call, so no traceback keeps the task alive
+            raise RuntimeError("LLM unavailable")
+
+        monkeypatch.setattr(generator_service, "_build_provenance", failing_provenance)
+        monkeypatch.setattr(generator_service.llm_generator, "generate", failing_generate)
+
+        result = await generator_service.generate(button_request)
+        await asyncio.sleep(0.1)
+        gc.collect()
+        asyncio.get_running_loop().set_exception_handler(None)
+
+        assert result.success is False
+        assert result.error == "LLM unavailable"
+        assert errors == []
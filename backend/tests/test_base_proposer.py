@@ -0,0 +1,106 @@
+"""Tests for the shared proposer retry path."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from PIL import Image
+
+from src.agents.accessibility_proposer import AccessibilityProposer
+from src.agents.base_proposer import call_with_retry
+from src.agents.events_proposer import EventsProposer
+from src.types.requirement_types import ComponentClassification, ComponentType
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Skip retry backoff sleeps."""
+    monkeypatch.setattr("asyncio.sleep", AsyncMock())
+
+
+def _stream(text):
+    """Chat completion stream delivering text in two chunks."""
+    async def chunks():
+        for part in (text[: len(text) // 2], text[len(text) // 2:]):
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+    return chunks()
+
+
+@pytest.mark.asyncio
+class TestCallWithRetry:
+    """Tests for call_with_retry."""
+
+    async def test_retries_transient_errors(self):
+        """Retryable errors are retried until an attempt succeeds."""
+        fn = AsyncMock(side_effect=[ValueError("truncated"), "ok"])
+
+        assert await call_with_retry(fn, 3, 0.5, "Test") == "ok"
+        assert fn.call_count == 2
+
+    async def test_gives_up_after_max_retries(self):
+        """The last error is raised once retries run out."""
+        fn = AsyncMock(side_effect=ValueError("truncated"))
+
+        with pytest.raises(ValueError):
+            await call_with_retry(fn, 2, 0.5, "Test")
+        assert fn.call_count == 3
+
+    async def test_other_errors_not_retried(self):
+        """Errors outside RETRYABLE_ERRORS fail on the first attempt."""
+        fn = AsyncMock(side_effect=RuntimeError("bad request"))
+
+        with pytest.raises(RuntimeError):
+            await call_with_retry(fn, 3, 0.5, "Test")
+        assert fn.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_accessibility_retries_truncated_stream():
+    """A cut-off accessibility stream is requested again."""
+    body = json.dumps({"accessibility": [{
+        "name": "aria-label",
+        "required": True,
+        "description": "Label the button",
+        "visual_cues": ["icon only"],
+        "confidence": 0.9,
+    }]})
+    create = AsyncMock(side_effect=[_stream(body[:20]), _stream(body)])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    proposer = AccessibilityProposer(api_key="sk-test", client=client)
+    classification = ComponentClassification(
+        component_type=ComponentType.BUTTON, confidence=0.9, rationale="test"
+    )
+
+    proposals = await proposer.propose(
+        Image.new("RGB", (64, 64)), classification, image_url="data:image/png;base64,abc"
+    )
+
+    assert [p.name for p in proposals] == ["aria-label"]
+    assert create.call_count == 2
+    assert create.call_args.kwargs["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_events_retries_truncated_stream():
+    """The events proposer shares the same retry path."""
+    body = json.dumps({"events": [{
+        "name": "onClick",
+        "required": True,
+        "description": "Handle clicks",
+        "visual_cues": ["button"],
+        "confidence": 0.9,
+    }]})
+    create = AsyncMock(side_effect=[_stream(body[:20]), _stream(body)])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    proposer = EventsProposer(api_key="sk-test", client=client)
+    classification = ComponentClassification(
+        component_type=ComponentType.BUTTON, confidence=0.9, rationale="test"
+    )
+
+    proposals = await proposer.propose(
+        Image.new("RGB", (64, 64)), classification, image_url="data:image/png;base64,abc"
+    )
+
+    assert [p.name for p in proposals] == ["onClick"]
+    assert create.call_count == 2
@@ -0,0 +1,137 @@
+"""Tests for batch component classification."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from PIL import Image
+
+from src.agents.component_classifier import (
+    MAX_BATCH_IMAGES,
+    ComponentClassifier,
+    ComponentClassifierError,
+)
+from src.types.requirement_types import ComponentType
+
+
+def _response(component_types):
+    """Build a chat completion carrying one classification per type."""
+    content = json.dumps({
+        "classifications": [
+            {
+                "component_type": component_type,
+                "confidence": 0.9,
+                "candidates": [],
+                "rationale": "test",
+            }
+            for component_type in component_types
+        ]
+    })
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+def _images(count):
+    return [Image.new("RGB", (64, 64), color=(i, 0, 0)) for i in range(count)]
+
+
+@pytest.fixture
+def create(monkeypatch):
+    """Mocked chat.completions.create; retry backoff sleeps are skipped."""
+    monkeypatch.setattr("asyncio.sleep", AsyncMock())
+    return AsyncMock()
+
+
+@pytest.fixture
+def classifier(create):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return ComponentClassifier(api_key="sk-test", client=client)
+
+
+@pytest.mark.asyncio
+class TestClassifyBatch:
+    """Tests for ComponentClassifier.classify_batch."""
+
+    async def test_results_follow_image_order(self, classifier, create):
+        """Classifications map to images in request order, in one call."""
+        create.return_value = _response(["Card", "Button", "Input"])
+
+        results = await classifier.classify_batch(_images(3))
+
+        assert [r.component_type for r in results] == [
+            ComponentType.CARD, ComponentType.BUTTON, ComponentType.INPUT
+        ]
+        assert create.call_count == 1
+        content = create.call_args.kwargs["messages"][0]["content"]
+        assert [part["type"] for part in content] == ["text"] + ["image_url"] * 3
+        response_format = create.call_args.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["strict"] is True
+
+    async def test_count_mismatch_is_retried(self, classifier, create):
+        """A response with the wrong number of results is requested again."""
+        create.side_effect = [
+            _response(["Button"]),
+            _response(["Button", "Card"]),
+        ]
+
+        results = await classifier.classify_batch(_images(2))
+
+        assert [r.component_type for r in results] == [
+            ComponentType.BUTTON, ComponentType.CARD
+        ]
+        assert create.call_count == 2
+
+    async def test_repeat_batch_served_from_cache(self, classifier, create):
+        """An identical batch is answered from the vision cache."""
+        create.return_value = _response(["Card", "Button"])
+        images = _images(2)
+
+        first = await classifier.classify_batch(images)
+        second = await classifier.classify_batch(images)
+
+        assert second == first
+        assert create.call_count == 1
+
+    async def test_persistent_mismatch_raises(self, classifier, create):
+        """Retries stop after max_retries and surface a classifier error."""
+        create.return_value = _response(["Button"])
+
+        with pytest.raises(ComponentClassifierError, match="Expected 2"):
+            await classifier.classify_batch(_images(2))
+
+        assert create.call_count == classifier.max_retries + 1
+
+    async def test_non_transient_error_not_retried(self, classifier, create):
+        """Errors outside RETRYABLE_ERRORS fail on the first attempt."""
+        create.side_effect = RuntimeError("bad request")
+
+        with pytest.raises(ComponentClassifierError):
+            await classifier.classify_batch(_images(2))
+
+        assert create.call_count == 1
+
+    async def test_large_batches_are_split(self, classifier, create):
+        """More than MAX_BATCH_IMAGES images go out in bounded requests."""
+        count = MAX_BATCH_IMAGES + 2
+
+        async def respond(**kwargs):
+            images = len(kwargs["messages"][0]["content"]) - 1
+            return _response(["Button"] * images)
+
+        create.side_effect = respond
+
+        results = await classifier.classify_batch(_images(count))
+
+        assert len(results) == count
+        sizes = sorted(
+            len(call.kwargs["messages"][0]["content"]) - 1
+            for call in create.call_args_list
+        )
+        assert sizes == [2, MAX_BATCH_IMAGES]
+        assert all(
+            call.kwargs["max_tokens"] <= 400 * MAX_BATCH_IMAGES
+            for call in create.call_args_list
+        )
@@ -53,10 +53,8 @@ class TestFigmaCacheBasics:
         cached_data = {"name": "Cached File"}
         mock_redis = AsyncMock()
         mock_redis.get = AsyncMock(return_value=json.dumps(cached_data))
-        mock_redis.incr = AsyncMock(return_value=1)
-        mock_redis.rpush = AsyncMock()
-        mock_redis.ltrim = AsyncMock()
-        mock_redis.expire = AsyncMock()
+        mock_redis.pipeline = MagicMock()
+        mock_redis.pipeline.return_value.execute = AsyncMock()
         mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
         mock_get_redis.return_value.__aexit__ = AsyncMock()
 
@@ -72,7 +70,8 @@ class TestFigmaCacheBasics:
         """Test cache miss returns None."""
         mock_redis = AsyncMock()
         mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.incr = AsyncMock(return_value=1)
+        mock_redis.pipeline = MagicMock()
+        mock_redis.pipeline.return_value.execute = AsyncMock()
         mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
         mock_get_redis.return_value.__aexit__ = AsyncMock()
 
@@ -89,13 +88,17 @@ class TestFigmaCacheInvalidation:
     @patch("src.core.cache.get_redis")
     async def test_invalidate_file_success(self, mock_get_redis):
         """Test successful cache invalidation."""
+        # Simulate 2 cache keys (over two SCAN batches) and 1 metrics key
+        batches = {
+            ("figma:file:abc123:*", 0): (7, ["figma:file:abc123:file"]),
+            ("figma:file:abc123:*", 7): (0, ["figma:file:abc123:styles"]),
+            ("figma:metrics:abc123:*", 0): (0, ["figma:metrics:abc123:hits"]),
+        }
         mock_redis = AsyncMock()
-        # Simulate 2 cache keys being found
-        mock_redis.keys = AsyncMock(return_value=[
-            "figma:file:abc123:file",
-            "figma:file:abc123:styles"
-        ])
-        mock_redis.delete = AsyncMock(return_value=2)
+        mock_redis.scan = AsyncMock(
+            side_effect=lambda cursor, match, count: batches[(match, cursor)]
+        )
+        mock_redis.unlink = AsyncMock(side_effect=lambda *keys: len(keys))
         mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
         mock_get_redis.return_value.__aexit__ = AsyncMock()
 
@@ -104,17 +107,16 @@ class TestFigmaCacheInvalidation:
 
         assert deleted == 2
         
-        # Check that both cache and metrics patterns were queried
-        metrics_calls = [call for call in mock_redis.keys.call_args_list]
-        assert len(metrics_calls) == 2  # Once for cache, once for metrics
-        assert "figma:file:abc123:*" in str(metrics_calls[0])
-        assert "figma:metrics:abc123:*" in str(metrics_calls[1])
+        # Check that both cache and metrics patterns were scanned
+        patterns = {call.kwargs["match"] for call in mock_redis.scan.call_args_list}
+        assert patterns == {"figma:file:abc123:*", "figma:metrics:abc123:*"}
+        assert mock_redis.unlink.await_count == 3
 
     @patch("src.core.cache.get_redis")
     async def test_invalidate_file_no_entries(self, mock_get_redis):
         """Test invalidation when no cache entries exist."""
         mock_redis = AsyncMock()
-        mock_redis.keys = AsyncMock(return_value=[])
+        mock_redis.scan = AsyncMock(return_value=(0, []))
         mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
         mock_get_redis.return_value.__aexit__ = AsyncMock()
 
@@ -128,51 +130,52 @@ class TestFigmaCacheInvalidation:
 class TestFigmaCacheMetrics:
     """Tests for cache metrics tracking."""
 
+    @staticmethod
+    def _mock_pipeline(mock_get_redis, results):
+        """Patch get_redis with a client whose pipeline returns results."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=results)
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = pipe
+        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+        mock_get_redis.return_value.__aexit__ = AsyncMock()
+        return pipe
+
     @patch("src.core.cache.get_redis")
     async def test_track_hit(self, mock_get_redis):
         """Test tracking cache hits."""
-        mock_redis = AsyncMock()
-        mock_redis.incr = AsyncMock(return_value=5)
-        mock_redis.rpush = AsyncMock()
-        mock_redis.ltrim = AsyncMock()
-        mock_redis.expire = AsyncMock()
-        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
-        mock_get_redis.return_value.__aexit__ = AsyncMock()
+        pipe = self._mock_pipeline(mock_get_redis, [5, True, 95, 1, True])
 
         cache = FigmaCache(ttl=300)
         await cache._track_hit("abc123", 0.095)  # 95ms
 
         # Verify hit counter was incremented
-        mock_redis.incr.assert_called_once()
-        assert "figma:metrics:abc123:hits" in str(mock_redis.incr.call_args)
+        pipe.incr.assert_called_once_with("figma:metrics:abc123:hits")
 
         # Verify latency was tracked
-        mock_redis.rpush.assert_called_once()
-        mock_redis.ltrim.assert_called_once()
+        pipe.hincrby.assert_any_call("figma:metrics:abc123:latency_stats", "sum", 95)
+        pipe.hincrby.assert_any_call("figma:metrics:abc123:latency_stats", "count", 1)
+
+        # Sent as one batch
+        pipe.execute.assert_awaited_once()
 
     @patch("src.core.cache.get_redis")
     async def test_track_miss(self, mock_get_redis):
         """Test tracking cache misses."""
-        mock_redis = AsyncMock()
-        mock_redis.incr = AsyncMock(return_value=3)
-        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
-        mock_get_redis.return_value.__aexit__ = AsyncMock()
+        pipe = self._mock_pipeline(mock_get_redis, [3, True])
 
         cache = FigmaCache(ttl=300)
         await cache._track_miss("abc123")
 
         # Verify miss counter was incremented
-        mock_redis.incr.assert_called_once()
-        assert "figma:metrics:abc123:misses" in str(mock_redis.incr.call_args)
+        pipe.incr.assert_called_once_with("figma:metrics:abc123:misses")
+        pipe.execute.assert_awaited_once()
 
     @patch("src.core.cache.get_redis")
     async def test_get_hit_rate_with_data(self, mock_get_redis):
         """Test calculating hit rate with data."""
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(side_effect=["10", "2"])  # 10 hits, 2 misses
-        mock_redis.lrange = AsyncMock(return_value=["95", "100", "90"])  # latency samples
-        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
-        mock_get_redis.return_value.__aexit__ = AsyncMock()
+        # 10 hits, 2 misses, latency sum and count of three samples
+        self._mock_pipeline(mock_get_redis, ["10", "2", ["285", "3"]])
 
         cache = FigmaCache(ttl=300)
         metrics = await cache.get_hit_rate("abc123")
@@ -187,11 +190,7 @@ class TestFigmaCacheMetrics:
     @patch("src.core.cache.get_redis")
     async def test_get_hit_rate_no_data(self, mock_get_redis):
         """Test calculating hit rate with no data."""
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.lrange = AsyncMock(return_value=[])
-        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
-        mock_get_redis.return_value.__aexit__ = AsyncMock()
+        self._mock_pipeline(mock_get_redis, [None, None, [None, None]])
 
         cache = FigmaCache(ttl=300)
         metrics = await cache.get_hit_rate("abc123")
@@ -227,3 +226,10 @@ class TestFigmaCacheConfiguration:
         assert "cache_enabled" in metrics
         assert "ttl_seconds" in metrics
         assert metrics["ttl_seconds"] == 300
+
+    def test_shared_cache_is_singleton(self):
+        """Test get_figma_cache returns one shared instance."""
+        from src.cache.figma_cache import get_figma_cache
+
+        assert get_figma_cache() is get_figma_cache()
+        assert isinstance(get_figma_cache(), FigmaCache)
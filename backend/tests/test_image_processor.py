@@ -1,5 +1,6 @@
 """Tests for image processing and validation."""
 
+import base64
 import io
 import pytest
 from PIL import Image
@@ -8,9 +9,12 @@ from src.services.image_processor import (
     validate_file_size,
     validate_mime_type,
     validate_and_process_image,
+    read_upload,
     image_to_base64,
     prepare_image_for_vision_api,
     ImageValidationError,
+    ImageTooLargeError,
+    _downscale_for_gpt4o,
     MAX_FILE_SIZE,
     MAX_IMAGE_WIDTH,
 )
@@ -37,6 +41,47 @@ class TestFileSizeValidation:
         assert "10MB" in str(exc_info.value)
 
 
+class _FakeUpload:
+    """Minimal UploadFile stand-in recording how much was read."""
+
+    def __init__(self, data: bytes, size=None):
+        self._buffer = io.BytesIO(data)
+        self.size = size
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+class TestReadUpload:
+    """Tests for chunked upload reading."""
+
+    @pytest.mark.asyncio
+    async def test_reads_whole_file(self):
+        """Test that an upload within the limit is read completely."""
+        data = b"x" * 200_000
+        assert await read_upload(_FakeUpload(data)) == data
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_stream_early(self):
+        """Test that reading stops once the limit is passed."""
+        upload = _FakeUpload(b"x" * 1_000_000)
+
+        with pytest.raises(ImageTooLargeError):
+            await read_upload(upload, max_size=100_000)
+
+        assert upload._buffer.tell() < 1_000_000
+
+    @pytest.mark.asyncio
+    async def test_rejects_known_size_without_reading(self):
+        """Test that a declared oversized upload is rejected before reading."""
+        upload = _FakeUpload(b"x", size=MAX_FILE_SIZE + 1)
+
+        with pytest.raises(ImageTooLargeError):
+            await read_upload(upload)
+
+        assert upload._buffer.tell() == 0
+
+
 class TestMimeTypeValidation:
     """Tests for MIME type validation."""
     
@@ -78,7 +123,25 @@ class TestImageValidation:
         assert metadata["width"] == 800
         assert metadata["height"] == 600
         assert metadata["resized"] is False
-    
+
+    def test_file_object_processing(self):
+        """Test that a file object is read in place and usable once closed."""
+        import tempfile
+
+        with tempfile.SpooledTemporaryFile() as image_file:
+            image_file.write(self.create_test_image(800, 600))
+            image, metadata = validate_and_process_image(image_file, "image/png")
+
+        assert metadata["width"] == 800
+        assert image.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_oversized_file_object(self):
+        """Test that an oversized file object raises ImageTooLargeError."""
+        image_file = io.BytesIO(b"x" * (MAX_FILE_SIZE + 1))
+
+        with pytest.raises(ImageTooLargeError):
+            validate_and_process_image(image_file)
+
     def test_image_resizing_large_width(self):
         """Test that large images are resized."""
         # Create image wider than MAX_IMAGE_WIDTH
@@ -92,7 +155,18 @@ class TestImageValidation:
         # Check aspect ratio is maintained
         expected_height = int(2000 * (MAX_IMAGE_WIDTH / 3000))
         assert metadata["height"] == expected_height
-    
+
+    def test_large_jpeg_resized_to_exact_width(self):
+        """Test that draft-decoded JPEGs still come out at MAX_IMAGE_WIDTH."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (4500, 1000), color="blue").save(buffer, format="JPEG")
+
+        image, metadata = validate_and_process_image(buffer.getvalue())
+
+        assert image.size == (MAX_IMAGE_WIDTH, int(1000 * MAX_IMAGE_WIDTH / 4500))
+        assert metadata["original_width"] == 4500
+        assert metadata["width"] == MAX_IMAGE_WIDTH
+
     def test_image_too_small(self):
         """Test that very small images are rejected."""
         image_data = self.create_test_image(30, 30)
@@ -166,7 +240,16 @@ class TestImageEncoding:
         
         assert isinstance(base64_str, str)
         assert len(base64_str) > 0
-    
+
+    def test_image_to_base64_webp(self):
+        """Test converting image to base64 WebP."""
+        image = Image.new("RGB", (100, 100), color="blue")
+
+        base64_str = image_to_base64(image, format="WEBP", quality=80)
+
+        decoded = Image.open(io.BytesIO(base64.b64decode(base64_str)))
+        assert decoded.format == "WEBP"
+
     def test_rgba_to_jpeg_conversion(self):
         """Test that RGBA images are converted properly for JPEG."""
         # JPEG doesn't support transparency
@@ -182,7 +265,50 @@ class TestImageEncoding:
         
         data_url = prepare_image_for_vision_api(image)
         
-        assert data_url.startswith("data:image/png;base64,")
+        # Opaque images are sent as WebP
+        assert data_url.startswith("data:image/webp;base64,")
         # Extract base64 part and verify it's valid
         base64_part = data_url.split(",", 1)[1]
         assert len(base64_part) > 0
+    
+    def test_prepare_image_for_vision_api_jpeg_without_webp(self, monkeypatch):
+        """Test that opaque images fall back to JPEG when WebP is unavailable."""
+        monkeypatch.setattr("src.services.image_processor.WEBP_AVAILABLE", False)
+        image = Image.new("RGB", (100, 100), color="red")
+        
+        data_url = prepare_image_for_vision_api(image)
+        
+        assert data_url.startswith("data:image/jpeg;base64,")
+    
+    def test_prepare_image_for_vision_api_keeps_png_for_alpha(self):
+        """Test that transparent images are still encoded as PNG."""
+        image = Image.new("RGBA", (100, 100), color=(255, 0, 0, 128))
+        
+        data_url = prepare_image_for_vision_api(image)
+        
+        assert data_url.startswith("data:image/png;base64,")
+    
+    def test_prepare_image_for_vision_api_downscales(self):
+        """Test that large images are shrunk to GPT-4o's processing envelope."""
+        image = Image.new("RGB", (1920, 1080), color="red")
+        
+        data_url = prepare_image_for_vision_api(image)
+        
+        decoded = Image.open(io.BytesIO(base64.b64decode(data_url.split(",", 1)[1])))
+        assert decoded.size == (1365, 768)
+        # Caller's image is left untouched
+        assert image.size == (1920, 1080)
+    
+    def test_downscale_for_gpt4o_fits_box_first(self):
+        """Test that very wide images are fit into 2048px before the short-side cap."""
+        image = Image.new("RGB", (4096, 1024), color="red")
+        
+        resized = _downscale_for_gpt4o(image)
+        
+        assert resized.size == (2048, 512)
+    
+    def test_downscale_for_gpt4o_small_image_unchanged(self):
+        """Test that images inside the envelope are returned as-is."""
+        image = Image.new("RGB", (800, 600), color="red")
+        
+        assert _downscale_for_gpt4o(image) is image
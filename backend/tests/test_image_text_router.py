@@ -0,0 +1,87 @@
+"""Tests for OCR-based routing of text-heavy screenshots."""
+
+import base64
+import io
+from PIL import Image
+
+from src.services import image_text_router
+from src.services.image_text_router import (
+    VisionInput,
+    append_detected_text,
+    route_image_for_vision,
+    THUMBNAIL_SIZE,
+)
+
+
+def _decode_data_url(data_url: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(data_url.split(",", 1)[1])))
+
+
+class TestRouteImageForVision:
+    """Tests for route_image_for_vision."""
+
+    def test_ocr_unavailable_returns_full_image(self, monkeypatch):
+        """Without an OCR engine the caller's encoding is used unchanged."""
+        monkeypatch.setattr(image_text_router, "OCR_AVAILABLE", False)
+        image = Image.new("RGB", (400, 200), color="white")
+
+        result = route_image_for_vision(image, image_url="data:image/webp;base64,abc")
+
+        assert result == VisionInput(image_url="data:image/webp;base64,abc")
+
+    def test_text_heavy_image_uses_thumbnail(self, monkeypatch):
+        """Dense text routes to a low-detail thumbnail plus OCR text."""
+        monkeypatch.setattr(image_text_router, "OCR_AVAILABLE", True)
+        monkeypatch.setattr(
+            image_text_router, "extract_text",
+            lambda image: ["Email address", "Enter your email to continue"] * 4,
+        )
+        image = Image.new("RGB", (400, 200), color="white")
+
+        result = route_image_for_vision(image, image_url="data:image/webp;base64,abc")
+
+        assert result.detail == "low"
+        assert "Enter your email to continue" in result.detected_text
+        assert max(_decode_data_url(result.image_url).size) <= THUMBNAIL_SIZE
+
+    def test_sparse_text_keeps_full_image(self, monkeypatch):
+        """Images with little text keep the full image."""
+        monkeypatch.setattr(image_text_router, "OCR_AVAILABLE", True)
+        monkeypatch.setattr(image_text_router, "extract_text", lambda image: ["OK"])
+        image = Image.new("RGB", (800, 600), color="white")
+
+        result = route_image_for_vision(image, image_url="data:image/webp;base64,abc")
+
+        assert result.detected_text is None
+        assert result.image_url == "data:image/webp;base64,abc"
+
+    def test_ocr_failure_falls_back_to_full_image(self, monkeypatch):
+        """OCR errors never block the vision call."""
+        def failing_ocr(image):
+            raise RuntimeError("model not loaded")
+
+        monkeypatch.setattr(image_text_router, "OCR_AVAILABLE", True)
+        monkeypatch.setattr(image_text_router, "extract_text", failing_ocr)
+        image = Image.new("RGB", (400, 200), color="white")
+
+        result = route_image_for_vision(image, image_url="data:image/webp;base64,abc")
+
+        assert result.detected_text is None
+        assert result.image_url == "data:image/webp;base64,abc"
+
+
+class TestAppendDetectedText:
+    """Tests for append_detected_text."""
+
+    def test_appends_text_after_prompt(self):
+        """Detected text goes after the static prompt body."""
+        prompt = append_detected_text(
+            "Static rubric", VisionInput(image_url="x", detected_text="Submit")
+        )
+
+        assert prompt.startswith("Static rubric")
+        assert prompt.endswith("Submit\n")
+
+    def test_no_text_leaves_prompt_unchanged(self):
+        """Full-image inputs don't alter the prompt."""
+        assert append_detected_text("Static rubric", VisionInput(image_url="x")) == "Static rubric"
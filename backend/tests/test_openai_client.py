@@ -0,0 +1,82 @@
+"""Tests for the shared OpenAI client helpers."""
+
+import gzip
+import json
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from src.services.openai_client import GZIP_MIN_BODY_SIZE, GzipRequestTransport
+
+
+async def _send(payload: dict) -> httpx.Request:
+    """Send a JSON request through the gzip transport and return what went out."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    async with httpx.AsyncClient(
+        transport=GzipRequestTransport(httpx.MockTransport(handler)),
+    ) as client:
+        await client.post("https://api.example.com/v1/chat/completions", json=payload)
+    return sent[0]
+
+
+class TestGzipRequestBody:
+    """Tests for gzip_request_body via GzipRequestTransport."""
+
+    @pytest.mark.asyncio
+    async def test_large_body_is_compressed(self):
+        """Bodies over the threshold are gzipped with matching headers."""
+        payload = {"image": "A" * (GZIP_MIN_BODY_SIZE * 2)}
+
+        request = await _send(payload)
+
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        assert json.loads(gzip.decompress(request.content)) == payload
+
+    @pytest.mark.asyncio
+    async def test_small_body_is_unchanged(self):
+        """Small bodies are sent as-is."""
+        request = await _send({"prompt": "hello"})
+
+        assert "Content-Encoding" not in request.headers
+        assert json.loads(request.content) == {"prompt": "hello"}
+
+    @pytest.mark.asyncio
+    async def test_multipart_upload_is_sent_uncompressed(self):
+        """Streaming multipart uploads (files.create) pass through untouched."""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            request.read()
+            return httpx.Response(200, json={
+                "id": "file-1",
+                "object": "file",
+                "bytes": 0,
+                "created_at": 0,
+                "filename": "batch.jsonl",
+                "purpose": "batch",
+                "status": "processed",
+            })
+
+        http_client = httpx.AsyncClient(
+            transport=GzipRequestTransport(httpx.MockTransport(handler))
+        )
+        client = AsyncOpenAI(api_key="sk-test", http_client=http_client)
+        line = b'{"custom_id": "1"}\n'
+        batch = line * (GZIP_MIN_BODY_SIZE // len(line) + 1)
+
+        uploaded = await client.files.create(
+            file=("batch.jsonl", batch), purpose="batch"
+        )
+        await client.close()
+
+        assert uploaded.id == "file-1"
+        assert "Content-Encoding" not in sent[0].headers
+        assert batch in sent[0].content
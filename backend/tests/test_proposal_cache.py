@@ -0,0 +1,80 @@
+"""Tests for requirement proposal caching."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.cache.proposal_cache import ProposalCache
+from src.cache.vision_cache import PROMPT_VERSION
+from src.types.requirement_types import (
+    ComponentClassification,
+    ComponentType,
+    RequirementCategory,
+    RequirementProposal,
+    RequirementState,
+)
+
+
+def _state() -> RequirementState:
+    return RequirementState(
+        classification=ComponentClassification(
+            component_type=ComponentType.BUTTON,
+            confidence=0.9,
+            rationale="Rectangular clickable element",
+        ),
+        props_proposals=[
+            RequirementProposal(
+                id="prop-1",
+                category=RequirementCategory.PROPS,
+                name="variant",
+                confidence=0.8,
+                rationale="Multiple visual styles",
+            )
+        ],
+    )
+
+
+@pytest.mark.asyncio
+class TestProposalCache:
+    """Tests for proposal cache operations."""
+
+    async def test_build_cache_key(self):
+        """Test cache keys carry the prompt version."""
+        cache = ProposalCache()
+        assert cache._build_key("abc") == f"requirements:proposal:{PROMPT_VERSION}:abc"
+
+    @patch("src.core.cache.get_redis")
+    async def test_state_round_trip(self, mock_get_redis):
+        """Test a stored state is returned with fresh proposal IDs."""
+        stored = {}
+        mock_redis = AsyncMock()
+        mock_redis.setex = AsyncMock(
+            side_effect=lambda key, ttl, value: stored.__setitem__(key, value)
+        )
+        mock_redis.get = AsyncMock(side_effect=lambda key: stored.get(key))
+        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+        mock_get_redis.return_value.__aexit__ = AsyncMock()
+
+        cache = ProposalCache()
+        state = _state()
+
+        assert await cache.get_state("abc") is None
+        assert await cache.set_state("abc", state) is True
+        assert mock_redis.setex.call_args[0][1] == 3600
+        first = await cache.get_state("abc")
+        second = await cache.get_state("abc")
+        assert first.model_dump(exclude={"props_proposals": {0: {"id"}}}) == (
+            state.model_dump(exclude={"props_proposals": {0: {"id"}}})
+        )
+        ids = {s.props_proposals[0].id for s in (state, first, second)}
+        assert len(ids) == 3
+        assert first.props_proposals[0].id.startswith("props-variant-")
+
+    @patch("src.core.cache.get_redis")
+    async def test_unreadable_entry_is_a_miss(self, mock_get_redis):
+        """Test entries that no longer validate are treated as misses."""
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value='{"props_proposals": 1}')
+        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+        mock_get_redis.return_value.__aexit__ = AsyncMock()
+
+        assert await ProposalCache().get_state("abc") is None
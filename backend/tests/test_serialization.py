@@ -0,0 +1,16 @@
+"""Tests for the shared JSON helpers."""
+
+from src.core.serialization import json_cache_key, json_dumps, json_loads
+
+
+def test_round_trip():
+    """json_dumps output parses back to the same value."""
+    data = {"props": ["variant", "size"], "confidence": 0.9, "required": True}
+    assert json_loads(json_dumps(data)) == data
+
+
+def test_cache_key_ignores_key_order():
+    """Dicts with the same items produce the same cache key."""
+    assert json_cache_key({"a": 1, "b": {"c": 2, "d": 3}}) == (
+        json_cache_key({"b": {"d": 3, "c": 2}, "a": 1})
+    )
@@ -0,0 +1,37 @@
+"""Tests for incremental parsing of streamed JSON arrays."""
+
+import json
+
+from src.agents.base_proposer import StreamingArrayParser
+
+
+class TestStreamingArrayParser:
+    """Tests for StreamingArrayParser."""
+
+    def test_yields_items_as_they_complete(self):
+        """Each item is returned by the chunk that closes it."""
+        parser = StreamingArrayParser("accessibility")
+
+        assert parser.feed('{"accessibility": [{"name": "aria') == []
+        assert parser.feed('-label"}, {"name": "role"') == [{"name": "aria-label"}]
+        assert parser.feed('}]}') == [{"name": "role"}]
+        assert parser.done
+
+    def test_character_by_character_stream(self):
+        """Items are recovered no matter how the stream is split."""
+        payload = {"accessibility": [{"name": "a", "cues": ["x, ]"]}, {"name": "b"}]}
+        parser = StreamingArrayParser("accessibility")
+
+        items = []
+        for char in json.dumps(payload):
+            items.extend(parser.feed(char))
+
+        assert items == payload["accessibility"]
+        assert parser.text == json.dumps(payload)
+
+    def test_missing_key_is_not_done(self):
+        """Responses without the array leave the parser unfinished."""
+        parser = StreamingArrayParser("accessibility")
+
+        assert parser.feed('{"props": [{"name": "size"}]}') == []
+        assert not parser.done
@@ -106,7 +106,7 @@ class TestTracingInitialization:
         with patch.dict(os.environ, {}, clear=True):
             # Reset the global config to test fresh initialization
             import src.core.tracing as tracing_module
-            tracing_module._tracing_config = None
+            tracing_module.get_tracing_config.cache_clear()
             
             result = init_tracing()
             assert result is False
@@ -124,7 +124,7 @@ class TestTracingInitialization:
             # Reset the global config
             import src.core.tracing as tracing_module
 
-            tracing_module._tracing_config = None
+            tracing_module.get_tracing_config.cache_clear()
 
             result = init_tracing()
             assert result is True
@@ -152,7 +152,7 @@ class TestTraceURL:
             # Reset config
             import src.core.tracing as tracing_module
 
-            tracing_module._tracing_config = None
+            tracing_module.get_tracing_config.cache_clear()
 
             run_id = "12345-abcde"
             url = get_trace_url(run_id)
@@ -179,7 +179,7 @@ class TestTracedDecorator:
             # Reset config
             import src.core.tracing as tracing_module
 
-            tracing_module._tracing_config = None
+            tracing_module.get_tracing_config.cache_clear()
 
             result = await sample_async_function()
             assert result == "async result"
@@ -196,7 +196,7 @@ class TestTracedDecorator:
             # Reset config
             import src.core.tracing as tracing_module
 
-            tracing_module._tracing_config = None
+            tracing_module.get_tracing_config.cache_clear()
 
             result = sample_sync_function()
             assert result == "sync result"
@@ -216,7 +216,7 @@ class TestTracedDecorator:
             # Reset config
             import src.core.tracing as tracing_module
 
-            tracing_module._tracing_config = None
+            tracing_module.get_tracing_config.cache_clear()
 
             result = await sample_function()
             assert result == "result"
@@ -0,0 +1,107 @@
+"""Tests for the vision response cache."""
+
+import pytest
+
+from src.cache.vision_cache import VisionResponseCache, image_seed
+
+
+class TestVisionResponseCache:
+    """Tests for VisionResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Stored responses are returned for the same request."""
+        cache = VisionResponseCache(directory="")
+        key = cache.build_key("gpt-4o", "prompt", "data:image/webp;base64,abc")
+
+        assert await cache.get(key) is None
+        await cache.set(key, '{"component_type": "Button"}')
+        assert await cache.get(key) == '{"component_type": "Button"}'
+
+    def test_key_depends_on_every_input(self):
+        """Model, prompt, image and detail all change the key."""
+        base = VisionResponseCache.build_key("gpt-4o", "p", "img", "low")
+
+        assert base != VisionResponseCache.build_key("gpt-4o-mini", "p", "img", "low")
+        assert base != VisionResponseCache.build_key("gpt-4o", "q", "img", "low")
+        assert base != VisionResponseCache.build_key("gpt-4o", "p", "img2", "low")
+        assert base != VisionResponseCache.build_key("gpt-4o", "p", "img", "high")
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """The oldest untouched entry is evicted past maxsize."""
+        cache = VisionResponseCache(maxsize=2, directory="")
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+
+        assert await cache.get("a") == "1"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == "3"
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_new_instance(self, tmp_path):
+        """Responses persisted on disk are served by a fresh cache."""
+        pytest.importorskip("diskcache")
+        key = VisionResponseCache.build_key("gpt-4o", "prompt", "img")
+        await VisionResponseCache(directory=str(tmp_path)).set(key, "{}")
+
+        assert await VisionResponseCache(directory=str(tmp_path)).get(key) == "{}"
+
+    def test_disk_tier_off_without_env(self, monkeypatch):
+        """No directory is used unless VISION_CACHE_DIR is set."""
+        monkeypatch.delenv("VISION_CACHE_DIR", raising=False)
+
+        assert VisionResponseCache().directory == ""
+
+
+def test_image_seed_is_stable_and_bounded():
+    """Seeds are deterministic per image and fit in 31 bits."""
+    seed = image_seed("data:image/webp;base64,abc")
+
+    assert seed == image_seed("data:image/webp;base64,abc")
+    assert 0 <= seed <= 0x7FFFFFFF
+
+
+class TestProposerResponseCaching:
+    """Tests for BaseRequirementProposer._cached_call."""
+
+    @pytest.fixture
+    def proposer(self, monkeypatch):
+        from src.agents import base_proposer
+        from src.agents.props_proposer import PropsProposer
+
+        monkeypatch.setattr(
+            base_proposer, "vision_response_cache", VisionResponseCache(directory="")
+        )
+        return PropsProposer(api_key="sk-test", client=object())
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_served_from_cache(self, proposer):
+        """The API is called once per key; hits parse the cached text."""
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            return '{"props": []}', ["fresh"]
+
+        assert await proposer._cached_call("key", fn, lambda text: [text]) == ["fresh"]
+        assert await proposer._cached_call("key", fn, lambda text: [text]) == [
+            '{"props": []}'
+        ]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_not_cached(self, proposer):
+        """A call that fails to parse is fetched again next time."""
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            raise ValueError("not json")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await proposer._cached_call("key", fn, lambda text: [text])
+        assert len(calls) == 2